@@ -2,6 +2,7 @@
 import time
 
 import pytest
+from triangulator.delaunay import sweep_hull
 from triangulator.services import triangulate
 from triangulator.utils import (
     deserialize_pointset,
@@ -19,7 +20,7 @@ def test_triangulate_100_points():
     triangles = triangulate(points)
     duration = time.perf_counter() - start
     print(f"\n100 points → {len(triangles)} triangles in {duration:.4f}s")
-    assert len(triangles) == 98  # fan triangulation: n-2 triangles
+    assert len(triangles) == 162  # Delaunay sur grille : 2n - 2 - h triangles
     assert duration < 0.1, f"Too slow: {duration:.4f}s"
 
 
@@ -31,7 +32,7 @@ def test_triangulate_1000_points():
     triangles = triangulate(points)
     duration = time.perf_counter() - start
     print(f"\n1000 points → {len(triangles)} triangles in {duration:.4f}s")
-    assert len(triangles) == 998
+    assert len(triangles) == 1898
     assert duration < 0.5, f"Too slow: {duration:.4f}s"
 
 
@@ -43,7 +44,25 @@ def test_triangulate_10000_points():
     triangles = triangulate(points)
     duration = time.perf_counter() - start
     print(f"\n10000 points → {len(triangles)} triangles in {duration:.4f}s")
-    assert len(triangles) == 9998
+    assert len(triangles) == 19602
+    assert duration < 5.0, f"Too slow: {duration:.4f}s"
+
+
+@pytest.mark.slow
+def test_triangulate_incremental_clustered_10000_points():
+    """Incremental insertion of clustered points stays fast thanks to BRIO."""
+    import random
+    random.seed(0)
+    points = [
+        (cx + random.gauss(0, 1), cy + random.gauss(0, 1))
+        for cx, cy in [(0.0, 0.0), (500.0, 0.0), (250.0, 400.0), (250.0, 150.0)]
+        for _ in range(2500)
+    ]
+    start = time.perf_counter()
+    triangles = triangulate(points, algorithm="incremental")
+    duration = time.perf_counter() - start
+    print(f"\n10000 clustered points → {len(triangles)} triangles in {duration:.4f}s")
+    assert len(triangles) > 19000
     assert duration < 5.0, f"Too slow: {duration:.4f}s"
 
 
@@ -100,7 +119,7 @@ def test_serialize_triangles_large():
 def test_full_roundtrip_performance():
     """Test complete serialize→deserialize→triangulate→serialize cycle."""
     # Créer des points
-    points = [(float(i * 0.1), float(i * 0.2)) for i in range(500)]
+    points = [(float(i % 25), float(i // 25)) for i in range(500)]
     
     # Mesurer le cycle complet
     start = time.perf_counter()
@@ -120,7 +139,7 @@ def test_full_roundtrip_performance():
     duration = time.perf_counter() - start
     
     print(f"\nFull roundtrip (500 points) in {duration:.4f}s")
-    assert len(triangles) == 498
+    assert len(triangles) == 912  # grille 25x20 : 2n - 2 - 86
     assert duration < 1.0, f"Full cycle too slow: {duration:.4f}s"
 
 
@@ -134,7 +153,7 @@ def test_scalability_triangulation():
     
     print("\nScalability test:")
     for size in sizes:
-        points = [(float(i * 0.1), float(i * 0.2)) for i in range(size)]
+        points = [(float(i % 10), i // 10 + (i % 3) * 0.1) for i in range(size)]
         
         start = time.perf_counter()
         triangles = triangulate(points)
@@ -143,9 +162,10 @@ def test_scalability_triangulation():
         times.append(duration)
         print(f"  {size} points: {duration:.4f}s ({len(triangles)} triangles)")
         
-        assert len(triangles) == size - 2
+        _, _, hull = sweep_hull([x for x, _ in points], [y for _, y in points])
+        assert len(triangles) == 2 * size - 2 - len(hull)
     
-    # Vérifier que c'est à peu près linéaire (fan triangulation est O(n))
+    # Vérifier que c'est à peu près linéaire (Delaunay est en O(n log n))
     # Le ratio temps[4] / temps[0] devrait être proche de sizes[4] / sizes[0]
     ratio_time = times[-1] / times[0] if times[0] > 0 else 0
     ratio_size = sizes[-1] / sizes[0]
@@ -2,7 +2,8 @@
 from unittest.mock import patch
 
 import pytest
-from triangulator.app import app
+from triangulator.app import app, content_cache, result_cache, shutdown_executor
+from triangulator.client import PointSetManagerError
 
 
 def test_app_exists():
@@ -13,8 +14,12 @@ def test_app_exists():
 @pytest.fixture
 def client():
     """Fournit un client de test pour l'application Flask."""
+    # Les tests réutilisent les mêmes IDs avec des PointSets différents
+    result_cache.clear()
+    content_cache.clear()
     with app.test_client() as client:
         yield client
+    shutdown_executor()
 
 
 # ==================== Tests du happy path ====================
@@ -70,6 +75,90 @@ def test_triangulation_with_4_points(client):
         assert num_triangles == 2  # Fan: n-2 = 4-2 = 2
 
 
+def test_triangulation_reuses_previous_version(client):
+    """Test qu'une nouvelle version déclarée par ``base`` est mise à jour."""
+    from triangulator.utils import serialize_pointset
+
+    square = [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)]
+    version_2 = square + [(1.0, 3.0)]
+    version_3 = version_2 + [(3.0, 1.0)]
+
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(square)), \
+         patch('triangulator.app.DelaunayTriangulation') as incremental:
+        assert client.get('/triangulation/v1').status_code == 200
+    # Sans ``base``, triangulation classique, rien n'est conservé
+    incremental.assert_not_called()
+
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(version_2)):
+        assert client.get('/triangulation/v2?base=v1').status_code == 200
+
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(version_3)), \
+         patch('triangulator.app.DelaunayTriangulation') as rebuild:
+        response = client.get('/triangulation/v3?base=v2')
+
+    # La triangulation de v2 est mise à jour, pas reconstruite
+    rebuild.assert_not_called()
+    assert response.status_code == 200
+    data = response.data
+    offset = 4 + 8 * 6
+    num_triangles = int.from_bytes(data[offset:offset + 4], byteorder='big')
+    assert num_triangles == 6
+
+    # Mêmes octets et même ETag que la triangulation classique
+    content_cache.clear()
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(version_3)):
+        scratch = client.get('/triangulation/v3-scratch')
+    assert scratch.data == data
+    assert scratch.headers['ETag'] == response.headers['ETag']
+
+
+def test_kept_versions_are_bounded_by_points(client):
+    """Test que les triangulations conservées respectent leur budget en points."""
+    from triangulator import app as app_module
+    from triangulator.utils import serialize_pointset
+
+    app.config['VERSIONS_MAX_POINTS'] = 10
+    try:
+        for k in range(4):
+            points = [(float(i), float(i * i % 7)) for i in range(4 + k)]
+            with patch('triangulator.app.fetch_pointset_from_manager',
+                       return_value=serialize_pointset(points)):
+                response = client.get(f'/triangulation/v{k + 1}?base=none')
+            assert response.status_code == 200
+        assert app_module._versions_points <= 10
+        assert list(app_module._versions) == ['v4']
+    finally:
+        app.config['VERSIONS_MAX_POINTS'] = 250_000
+
+
+def test_large_pointsets_use_parallel_mode(client):
+    """Test que GET passe au mode parallèle au-delà du seuil configuré."""
+    from triangulator.parallel import parallel_delaunay
+    from triangulator.utils import serialize_pointset
+
+    points = [(float(i % 30), float(i // 30) + i % 7 / 10) for i in range(900)]
+    app.config.update(PARALLEL_THRESHOLD=500, PARALLEL_WORKERS=2)
+    try:
+        with patch('triangulator.app.fetch_pointset_from_manager',
+                   return_value=serialize_pointset(points)), \
+             patch('triangulator.services.parallel_delaunay',
+                   wraps=parallel_delaunay) as parallel:
+            response = client.get('/triangulation/large-id')
+            data = response.data
+    finally:
+        app.config.update(PARALLEL_THRESHOLD=200_000, PARALLEL_WORKERS=None)
+
+    assert response.status_code == 200
+    parallel.assert_called_once()
+    assert parallel.call_args.args[2] == 2
+    offset = 4 + 8 * 900
+    assert int.from_bytes(data[offset:offset + 4], 'big') > 0
+
+
 # ==================== Tests de validation des headers HTTP ====================
 
 def test_response_headers(client):
@@ -122,7 +211,7 @@ def test_root_route_returns_404(client):
 @patch('triangulator.app.fetch_pointset_from_manager')
 def test_pointset_not_found_404(mock_fetch, client):
     """Test quand le PointSetManager retourne 404."""
-    mock_fetch.side_effect = RuntimeError("HTTP error 404")
+    mock_fetch.side_effect = PointSetManagerError("HTTP error 404", 404)
     
     response = client.get('/triangulation/nonexistent-id')
     
@@ -135,7 +224,7 @@ def test_pointset_not_found_404(mock_fetch, client):
 @patch('triangulator.app.fetch_pointset_from_manager')
 def test_pointset_manager_unavailable_503(mock_fetch, client):
     """Test quand le PointSetManager est indisponible."""
-    mock_fetch.side_effect = RuntimeError("Service unavailable")
+    mock_fetch.side_effect = PointSetManagerError("URL error: Connection refused")
     
     response = client.get('/triangulation/test-id')
     
@@ -148,12 +237,24 @@ def test_pointset_manager_unavailable_503(mock_fetch, client):
 @patch('triangulator.app.fetch_pointset_from_manager')
 def test_pointset_manager_internal_error(mock_fetch, client):
     """Test quand le PointSetManager a une erreur interne."""
-    mock_fetch.side_effect = RuntimeError("Internal server error")
+    mock_fetch.side_effect = PointSetManagerError("HTTP error 500", 500)
     
     response = client.get('/triangulation/test-id')
     assert response.status_code == 502
 
 
+def test_error_status_not_read_from_message(client):
+    """Test qu'un ID contenant « 404 » ne transforme pas une 500 en 404."""
+    pointset_id = '6f1c2a7e-0000-4404-9abc-123456789012'
+    error = PointSetManagerError(
+        f"HTTP error 500 for http://manager/pointset/{pointset_id}", 500
+    )
+    with patch('triangulator.app.fetch_pointset_from_manager', side_effect=error):
+        response = client.get(f'/triangulation/{pointset_id}')
+    assert response.status_code == 502
+    assert response.get_json()['code'] == 'UPSTREAM_ERROR'
+
+
 # ==================== Tests de données invalides ====================
 
 @patch('triangulator.app.fetch_pointset_from_manager')
@@ -216,6 +317,657 @@ def test_collinear_points_handling(mock_fetch, client):
     assert response.status_code == 200
 
 
+@patch('triangulator.app.fetch_pointset_from_manager')
+def test_collinear_points_give_zero_triangles(mock_fetch, client):
+    """Test que des points alignés et dupliqués donnent 0 triangle."""
+    from triangulator.utils import serialize_pointset
+    mock_fetch.return_value = serialize_pointset(
+        [(0.0, 0.0), (1.0, 1.0), (0.0, 0.0), (2.0, 2.0), (1.0, 1.0)]
+    )
+
+    response = client.get('/triangulation/collinear-id')
+
+    assert response.status_code == 200
+    offset = 4 + 8 * 5
+    assert response.data[offset:] == b"\x00\x00\x00\x00"
+
+
+@pytest.mark.parametrize("bad", [float('nan'), float('inf'), float('-inf')])
+@patch('triangulator.app.fetch_pointset_from_manager')
+def test_non_finite_coordinates_rejected(mock_fetch, bad, client):
+    """Test que NaN et les infinis sont refusés avec un message clair."""
+    from triangulator.utils import serialize_pointset
+    mock_fetch.return_value = serialize_pointset(
+        [(0.0, 0.0), (1.0, 0.0), (bad, 1.0), (0.0, 1.0)]
+    )
+
+    response = client.get('/triangulation/non-finite-id')
+
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body['code'] == 'INVALID_DATA'
+    assert 'Non-finite coordinate in point 2' in body['message']
+
+
+@patch('triangulator.app.fetch_pointset_from_manager')
+def test_duplicates_keep_original_indices(mock_fetch, client):
+    """Test que les triangles référencent les indices d'origine malgré les doublons."""
+    from triangulator.utils import serialize_pointset
+    mock_fetch.return_value = serialize_pointset(
+        [(0.0, 0.0), (0.0, 0.0), (1.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    )
+
+    response = client.get('/triangulation/duplicates-id')
+
+    assert response.status_code == 200
+    data = response.data
+    offset = 4 + 8 * 5
+    assert int.from_bytes(data[offset:offset + 4], 'big') == 1
+    indices = [
+        int.from_bytes(data[offset + 4 + 4 * k:offset + 8 + 4 * k], 'big')
+        for k in range(3)
+    ]
+    assert indices == [0, 2, 4]
+
+
+def test_triangulation_is_streamed(client):
+    """Test que la triangulation est envoyée en flux avec sa taille exacte."""
+    from triangulator.utils import serialize_pointset
+    points = [(float(i % 30), float(i // 30)) for i in range(900)]
+
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(points)):
+        response = client.get('/triangulation/streamed-id')
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert int(response.headers['Content-Length']) == len(response.data)
+    offset = 4 + 8 * 900
+    assert int.from_bytes(response.data[offset:offset + 4], 'big') == 2 * 900 - 2 - 116
+
+
+# ==================== Tests de la négociation de contenu ====================
+
+def _grid_pointset():
+    """Return a serialized 10x10 grid PointSet."""
+    from triangulator.utils import serialize_pointset
+    return serialize_pointset([(float(i % 10), float(i // 10)) for i in range(100)])
+
+
+def test_default_format_without_negotiation(client):
+    """Test que le format par défaut reste le format Triangles standard."""
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=_grid_pointset()):
+        response = client.get('/triangulation/grid-id',
+                              headers={'Accept': '*/*'})
+
+    assert response.mimetype == 'application/octet-stream'
+    assert 'Content-Encoding' not in response.headers
+    assert int.from_bytes(response.data[:4], 'big') == 100
+
+
+def test_little_endian_format(client):
+    """Test Accept: application/x-triangles-le."""
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=_grid_pointset()):
+        standard = client.get('/triangulation/grid-id').data
+        response = client.get('/triangulation/grid-id',
+                              headers={'Accept': 'application/x-triangles-le'})
+
+    assert response.mimetype == 'application/x-triangles-le'
+    data = response.data
+    assert len(data) == len(standard)
+    assert int(response.headers['Content-Length']) == len(data)
+    assert int.from_bytes(data[:4], 'little') == 100
+    assert data[4:8] == standard[4:8][::-1]
+
+
+def test_varint_format(client):
+    """Test Accept: application/x-triangles-varint."""
+    from triangulator.utils import decode_varint_deltas
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=_grid_pointset()):
+        standard = client.get('/triangulation/grid-id').data
+        response = client.get('/triangulation/grid-id',
+                              headers={'Accept': 'application/x-triangles-varint'})
+
+    assert response.mimetype == 'application/x-triangles-varint'
+    data = response.data
+    offset = 4 + 8 * 100
+    assert data[:offset + 4] == standard[:offset + 4]
+    count = int.from_bytes(data[offset:offset + 4], 'big')
+    indices, _ = decode_varint_deltas(data[offset + 4:], 3 * count)
+    assert list(indices) == [
+        int.from_bytes(standard[k:k + 4], 'big')
+        for k in range(offset + 4, len(standard), 4)
+    ]
+    assert len(data) < len(standard)
+
+
+def test_gzip_encoding(client):
+    """Test Accept-Encoding: gzip (préféré à deflate selon les q-values)."""
+    import gzip
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=_grid_pointset()):
+        standard = client.get('/triangulation/grid-id').data
+        response = client.get('/triangulation/grid-id', headers={
+            'Accept-Encoding': 'deflate;q=0.5, gzip'
+        })
+
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.data) == standard
+
+
+def test_compressed_result_is_cached(client):
+    """Test qu'un résultat compressé n'est compressé qu'une fois."""
+    from triangulator.utils import iter_compress
+
+    headers = {'Accept-Encoding': 'gzip'}
+    with patch('triangulator.app.iter_compress', wraps=iter_compress) as compress:
+        first = client.get('/triangulation/gzip-id', headers=headers)
+        second = client.get('/triangulation/gzip-id', headers=headers)
+
+    assert compress.call_count == 1
+    assert second.data == first.data
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert int(second.headers['Content-Length']) == len(second.data)
+
+
+# ==================== Tests du cache des résultats ====================
+
+def test_triangulation_etag_and_not_modified(client):
+    """Test ETag/Cache-Control, puis 304 sans rappeler le PointSetManager."""
+    response = client.get('/triangulation/cached-id')
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert etag.startswith('"') and etag.endswith('"')
+    assert 'max-age=' in response.headers['Cache-Control']
+
+    with patch('triangulator.app.fetch_pointset_from_manager') as fetch:
+        again = client.get('/triangulation/cached-id')
+        not_modified = client.get(
+            '/triangulation/cached-id', headers={'If-None-Match': etag}
+        )
+    fetch.assert_not_called()
+    assert again.data == response.data
+    assert again.headers['ETag'] == etag
+    assert not_modified.status_code == 304
+    assert not_modified.data == b''
+    assert not_modified.headers['ETag'] == etag
+
+
+def test_triangulation_etag_depends_on_representation(client):
+    """Test qu'une réponse compressée ou d'un autre format a son propre ETag."""
+    plain = client.get('/triangulation/cached-id')
+    gzipped = client.get(
+        '/triangulation/cached-id', headers={'Accept-Encoding': 'gzip'}
+    )
+    varint = client.get(
+        '/triangulation/cached-id',
+        headers={'Accept': 'application/x-triangles-varint'},
+    )
+    etags = {r.headers['ETag'] for r in (plain, gzipped, varint)}
+    assert len(etags) == 3
+
+    stale = client.get(
+        '/triangulation/cached-id',
+        headers={'If-None-Match': plain.headers['ETag'], 'Accept-Encoding': 'gzip'},
+    )
+    assert stale.status_code == 200
+
+
+def test_cache_stats(client):
+    """Test que les compteurs des deux niveaux de cache sont exposés."""
+    before = client.get('/cache/stats').get_json()
+    client.get('/triangulation/stats-id')
+    client.get('/triangulation/stats-id')
+    after = client.get('/cache/stats').get_json()
+
+    assert after['id']['misses'] == before['id']['misses'] + 1
+    assert after['id']['hits'] == before['id']['hits'] + 1
+    assert after['id']['entries'] == 1
+    assert after['content']['misses'] == before['content']['misses'] + 1
+    assert {'evictions', 'bytes', 'max_bytes'} <= set(after['content'])
+
+
+def test_same_content_under_other_ids(client):
+    """Test qu'une même géométrie sous plusieurs IDs n'est triangulée qu'une fois."""
+    before = client.get('/cache/stats').get_json()
+    first = client.get('/triangulation/template-a')
+    with patch('triangulator.app.compute_triangulation') as compute:
+        second = client.get('/triangulation/template-b')
+    after = client.get('/cache/stats').get_json()
+
+    compute.assert_not_called()
+    assert second.status_code == 200
+    assert second.data == first.data
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert after['content']['hits'] == before['content']['hits'] + 1
+    assert after['id']['misses'] == before['id']['misses'] + 2
+
+
+def test_late_request_reuses_finished_flight(client):
+    """Test qu'un calcul terminé juste avant l'entrée dans le groupe sert."""
+    from triangulator.app import build_batch_result, build_result
+
+    key = ('late-id', 'triangles', 'application/octet-stream')
+    result_cache.put(key, 'tag', b'data')
+    with patch('triangulator.app.fetch_pointset') as fetch:
+        assert build_result(*key) == ('tag', b'data', None)
+        assert build_batch_result('late-id') == ('tag', b'data', None)
+    fetch.assert_not_called()
+
+
+def test_concurrent_requests_are_coalesced(client):
+    """Test que des requêtes simultanées sur un même ID ne calculent qu'une fois."""
+    import threading
+    import time
+
+    from triangulator.app import flights
+    from triangulator.services import fetch_pointset_from_manager
+
+    release = threading.Event()
+    calls = []
+
+    def slow_fetch(pointset_id, **kwargs):
+        calls.append(pointset_id)
+        release.wait(5)
+        return fetch_pointset_from_manager(pointset_id)
+
+    start = flights.coalesced
+    statuses = []
+
+    def request():
+        with app.test_client() as other:
+            statuses.append(other.get('/triangulation/busy-id').status_code)
+
+    with patch('triangulator.app.fetch_pointset_from_manager', slow_fetch):
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while flights.coalesced < start + 4 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    assert calls == ['busy-id']
+    assert statuses == [200] * 5
+    assert client.get('/cache/stats').get_json()['coalesced'] == start + 4
+
+
+# ==================== Tests du téléversement direct ====================
+
+def test_upload_triangulation(client):
+    """Test qu'un PointSet envoyé dans la requête est triangulé directement."""
+    from triangulator.utils import serialize_pointset
+
+    square = serialize_pointset([(0.0, 0.0), (4.0, 0.0), (4.0, 3.0), (0.0, 5.0)])
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=square) as fetch:
+        expected = client.get('/triangulation/square').data
+        fetch.reset_mock()
+        response = client.post('/triangulation', data=square)
+        fetch.assert_not_called()
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    assert response.data == expected
+    assert int(response.headers['Content-Length']) == len(expected)
+
+
+def test_upload_invalid_pointsets(client):
+    """Test des PointSets téléversés refusés, avec les erreurs habituelles."""
+    response = client.post('/triangulation', data=b'\x00\x00')
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'INVALID_DATA'
+
+    response = client.post('/triangulation', data=b'\x00\x00\x00\x03' + b'\x00' * 8)
+    assert response.status_code == 400
+    assert 'expected 28 bytes, got 12' in response.get_json()['message']
+
+    response = client.post('/triangulation', data=b'\x00\x00\x00\x02' + b'\x00' * 16)
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'INSUFFICIENT_POINTS'
+
+
+def test_upload_size_limit(client):
+    """Test qu'un PointSet trop gros est refusé d'après son en-tête."""
+    from triangulator.services import fetch_pointset_from_manager
+
+    three_points = fetch_pointset_from_manager('x')  # 28 octets
+    app.config['UPLOAD_MAX_BYTES'] = len(three_points)
+    try:
+        accepted = client.post('/triangulation', data=three_points)
+        refused = client.post(
+            '/triangulation', data=b'\x00\x00\x00\x04' + b'\x00' * 32
+        )
+    finally:
+        app.config['UPLOAD_MAX_BYTES'] = 64 * 1024 * 1024
+    assert accepted.status_code == 200
+    assert refused.status_code == 413
+    assert refused.get_json()['code'] == 'PAYLOAD_TOO_LARGE'
+
+
+# ==================== Tests du traitement par lots ====================
+
+def read_batch(data):
+    """Découpe un flux Batch en liste de (index, statut, contenu)."""
+    import struct
+
+    count = int.from_bytes(data[:4], 'big')
+    frames, offset = [], 4
+    for _ in range(count):
+        index, status, size = struct.unpack_from('>IHI', data, offset)
+        offset += 10
+        frames.append((index, status, data[offset:offset + size]))
+        offset += size
+    assert offset == len(data)
+    return frames
+
+
+def test_batch_triangulation(client):
+    """Test d'un lot : un résultat par ID, y compris les erreurs."""
+    import json
+
+    from triangulator.services import InsufficientPointsError
+
+    square = (
+        b"\x00\x00\x00\x04"
+        b"\x00\x00\x00\x00\x00\x00\x00\x00"
+        b"\x3f\x80\x00\x00\x00\x00\x00\x00"
+        b"\x3f\x80\x00\x00\x3f\x80\x00\x00"
+        b"\x00\x00\x00\x00\x3f\x80\x00\x00"
+    )
+
+    def fetch(pointset_id, **kwargs):
+        if pointset_id == 'missing':
+            raise PointSetManagerError("HTTP error 404 for /pointset/missing", 404)
+        if pointset_id == 'small':
+            raise InsufficientPointsError("Need at least 3 points")
+        return square
+
+    with patch('triangulator.app.fetch_pointset_from_manager', side_effect=fetch):
+        expected = client.get('/triangulation/other').data
+        result_cache.clear()
+        content_cache.clear()
+        response = client.post(
+            '/triangulation/batch', json=['a', 'missing', 'b', 'small']
+        )
+        # Le flux est produit pendant sa lecture
+        frames = read_batch(response.data)
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-triangles-batch'
+    frames = {index: (status, body) for index, status, body in frames}
+    assert sorted(frames) == [0, 1, 2, 3]
+    assert frames[0] == (200, expected)
+    assert frames[2] == (200, expected)
+    assert frames[1][0] == 404
+    assert json.loads(frames[1][1])['code'] == 'NOT_FOUND'
+    assert frames[3][0] == 400
+    assert json.loads(frames[3][1])['code'] == 'INSUFFICIENT_POINTS'
+
+    # Résultats mis en cache pour les GET suivants
+    assert result_cache.get(('a', 'triangles', 'application/octet-stream'))
+
+
+def test_batch_streams_in_completion_order(client):
+    """Test que les résultats prêts passent avant un PointSet lent."""
+    import time
+
+    from triangulator.services import fetch_pointset_from_manager
+
+    def fetch(pointset_id, **kwargs):
+        if pointset_id == 'slow':
+            time.sleep(0.3)
+        return fetch_pointset_from_manager(pointset_id)
+
+    with patch('triangulator.app.fetch_pointset_from_manager', side_effect=fetch):
+        response = client.post('/triangulation/batch', json=['slow', 'a', 'b'])
+        indices = [index for index, _, _ in read_batch(response.data)]
+
+    assert indices[-1] == 0
+    assert sorted(indices) == [0, 1, 2]
+
+
+def test_batch_invalid_body(client):
+    """Test des corps de requête refusés."""
+    for body in (b'not json', b'[]', b'{"ids": ["a"]}', b'["a", 3]'):
+        response = client.post(
+            '/triangulation/batch', data=body, content_type='application/json'
+        )
+        assert response.status_code == 400
+        assert response.get_json()['code'] == 'INVALID_DATA'
+
+    app.config['BATCH_MAX_IDS'] = 2
+    try:
+        response = client.post('/triangulation/batch', json=['a', 'b', 'c'])
+    finally:
+        app.config['BATCH_MAX_IDS'] = 10000
+    assert response.status_code == 400
+    assert response.get_json()['code'] == 'INVALID_PARAMETER'
+
+
+# ==================== Tests de la configuration ====================
+
+def test_pointset_manager_configuration(client):
+    """Test que l'URL du PointSetManager et le mock viennent de la config."""
+    from triangulator.client import MANAGER_URL
+    from triangulator.services import fetch_pointset_from_manager
+    with patch('triangulator.app.manager_client') as factory:
+        factory.return_value.get_pointset.return_value = (
+            fetch_pointset_from_manager("any")
+        )
+        app.config.update(
+            POINTSET_MANAGER_MOCK=False,
+            POINTSET_MANAGER_URL='http://manager:8080',
+        )
+        try:
+            response = client.get('/triangulation/cfg-id')
+        finally:
+            app.config.update(
+                POINTSET_MANAGER_MOCK=True, POINTSET_MANAGER_URL=MANAGER_URL
+            )
+
+    assert response.status_code == 200
+    assert factory.call_args.args == ('http://manager:8080',)
+    factory.return_value.get_pointset.assert_called_once_with('cfg-id')
+
+
+# ==================== Tests de la sortie Voronoi ====================
+
+def test_triangulation_voronoi_output(client):
+    """Test ?output=voronoi : un centre par triangle, une arête par côté."""
+    response = client.get('/triangulation/test-id?output=voronoi')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    data = response.data
+    # 1 triangle → 1 sommet de Voronoi (4 + 8) puis 3 demi-droites (4 + 3 * 16)
+    assert len(data) == 12 + 4 + 48
+    assert int.from_bytes(data[:4], 'big') == 1
+    assert int.from_bytes(data[12:16], 'big') == 3
+
+
+def test_triangulation_strips_output(client):
+    """Test ?output=strips : les triangles sous forme de bandes."""
+    from triangulator.strips import strips_to_triangles
+    response = client.get('/triangulation/test-id?output=strips')
+
+    assert response.status_code == 200
+    data = response.data
+    # 3 sommets (4 + 24) puis une bande de 3 indices (4 + 12)
+    assert len(data) == 28 + 4 + 12
+    assert int.from_bytes(data[28:32], 'big') == 3
+    strips = [int.from_bytes(data[k:k + 4], 'big') for k in range(32, 44, 4)]
+    assert len(strips_to_triangles(strips)) == 1
+
+
+def test_triangulation_unknown_output(client):
+    """Test qu'un format de sortie inconnu est refusé."""
+    response = client.get('/triangulation/test-id?output=svg')
+    assert response.status_code == 400
+    assert response.get_json()["code"] == "INVALID_PARAMETER"
+
+
+# ==================== Tests de l'enveloppe convexe ====================
+
+@patch('triangulator.app.fetch_pointset_from_manager')
+def test_hull_endpoint(mock_fetch, client):
+    """Test GET /hull : sommets de l'enveloppe au format PointSet."""
+    from triangulator.utils import deserialize_pointset, serialize_pointset
+    mock_fetch.return_value = serialize_pointset(
+        [(1.0, 1.0), (0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0), (1.0, 0.0)]
+    )
+
+    response = client.get('/triangulation/hull-id/hull')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    hull = deserialize_pointset(response.data)
+    assert hull == [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+
+
+@patch('triangulator.app.fetch_pointset_from_manager')
+def test_hull_endpoint_invalid_data(mock_fetch, client):
+    """Test GET /hull avec des données corrompues."""
+    mock_fetch.return_value = b"\x00\x00\x00\x05"
+    response = client.get('/triangulation/hull-id/hull')
+    assert response.status_code == 400
+    assert response.get_json()["code"] == "INVALID_DATA"
+
+
+# ==================== Tests de localisation de points ====================
+
+def test_locate_points(client):
+    """Test POST /locate : un indice de triangle par point requête."""
+    from triangulator.utils import serialize_pointset
+
+    square = [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)]
+    queries = [(1.0, 3.0), (3.0, 1.0), (5.0, 5.0)]
+
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(square)):
+        triangulation = client.get('/triangulation/locate-id').data
+        response = client.post('/triangulation/locate-id/locate',
+                               data=serialize_pointset(queries))
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    data = response.data
+    assert int.from_bytes(data[:4], 'big') == 3
+    located = [int.from_bytes(data[4 + 4 * k:8 + 4 * k], 'big') for k in range(3)]
+    assert located[2] == 0xFFFFFFFF
+
+    # Les indices désignent les triangles de la réponse GET
+    offset = 4 + 8 * 4 + 4
+    for (x, y), t in zip(queries[:2], located[:2], strict=True):
+        start = offset + 12 * t
+        triangle = [
+            int.from_bytes(triangulation[start + 4 * k:start + 4 * k + 4], 'big')
+            for k in range(3)
+        ]
+        xs = [square[v][0] for v in triangle]
+        ys = [square[v][1] for v in triangle]
+        assert min(xs) <= x <= max(xs) and min(ys) <= y <= max(ys)
+
+
+def test_locate_reuses_index(client):
+    """Test que l'index de localisation est construit une seule fois."""
+    from triangulator.locate import PointLocator
+    from triangulator.utils import serialize_pointset
+
+    points = serialize_pointset([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    queries = serialize_pointset([(0.1, 0.1)])
+
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=points) as fetch, \
+         patch('triangulator.app.PointLocator', wraps=PointLocator) as build:
+        client.post('/triangulation/reuse-locate-id/locate', data=queries)
+        response = client.post('/triangulation/reuse-locate-id/locate', data=queries)
+
+    assert response.status_code == 200
+    assert build.call_count == 1
+    # Un seul appel au PointSetManager, même au premier calcul
+    assert fetch.call_count == 1
+
+
+def test_locate_uses_served_triangulation(client):
+    """Test que /locate repart du résultat servi par GET, ``base`` compris."""
+    from triangulator.utils import serialize_pointset
+
+    square = [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)]
+    version_2 = square + [(1.0, 3.0), (3.0, 1.0)]
+    queries = serialize_pointset([(1.0, 2.0), (3.5, 0.5)])
+
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(square)):
+        client.get('/triangulation/served-v1')
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=serialize_pointset(version_2)):
+        served = client.get('/triangulation/served-v2?base=served-v1').data
+
+    with patch('triangulator.app.fetch_pointset_from_manager') as fetch, \
+         patch('triangulator.app.compute_triangulation') as compute:
+        response = client.post('/triangulation/served-v2/locate', data=queries)
+    fetch.assert_not_called()
+    compute.assert_not_called()
+
+    data = response.data
+    offset = 4 + 8 * 6 + 4
+    for k, (x, y) in enumerate([(1.0, 2.0), (3.5, 0.5)]):
+        t = int.from_bytes(data[4 + 4 * k:8 + 4 * k], 'big')
+        start = offset + 12 * t
+        triangle = [
+            int.from_bytes(served[start + 4 * j:start + 4 * j + 4], 'big')
+            for j in range(3)
+        ]
+        xs = [version_2[v][0] for v in triangle]
+        ys = [version_2[v][1] for v in triangle]
+        assert min(xs) <= x <= max(xs) and min(ys) <= y <= max(ys)
+
+
+def test_kept_locators_are_bounded_by_points(client):
+    """Test que les index de localisation respectent leur budget en points."""
+    from triangulator import app as app_module
+    from triangulator.utils import serialize_pointset
+
+    queries = serialize_pointset([(0.1, 0.1)])
+    app.config['LOCATORS_MAX_POINTS'] = 10
+    try:
+        for k in range(4):
+            points = [(float(i), float(i * i % 7)) for i in range(4 + k)]
+            with patch('triangulator.app.fetch_pointset_from_manager',
+                       return_value=serialize_pointset(points)):
+                response = client.post(f'/triangulation/budget-{k}/locate',
+                                       data=queries)
+            assert response.status_code == 200
+        assert app_module._locators_points <= 10
+        assert list(app_module._locators) == ['budget-3']
+    finally:
+        app.config['LOCATORS_MAX_POINTS'] = 250_000
+
+
+def test_locate_invalid_body(client):
+    """Test POST /locate avec un corps tronqué."""
+    response = client.post('/triangulation/test-id/locate', data=b"\x00\x00")
+    assert response.status_code == 400
+    assert response.get_json()["code"] == "INVALID_DATA"
+
+
+@patch('triangulator.app.fetch_pointset_from_manager')
+def test_locate_pointset_not_found(mock_fetch, client):
+    """Test POST /locate quand le PointSet n'existe pas."""
+    mock_fetch.side_effect = PointSetManagerError("HTTP error 404", 404)
+    response = client.post('/triangulation/missing-id/locate',
+                           data=b"\x00\x00\x00\x00")
+    assert response.status_code == 404
+    assert response.get_json()["code"] == "NOT_FOUND"
+
+
 # ==================== Tests de cas limites d'ID ====================
 
 def test_empty_pointset_id(client):
@@ -0,0 +1,185 @@
+"""Tests for the ASGI application and its built-in server."""
+import asyncio
+import http.client
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from triangulator import asgi
+from triangulator.app import app as flask_app
+from triangulator.app import content_cache, result_cache
+from triangulator.client import PointSetManagerError
+from triangulator.server import start_server, stop_server
+
+SQUARE = (
+    b"\x00\x00\x00\x04"
+    b"\x00\x00\x00\x00\x00\x00\x00\x00"
+    b"\x3f\x80\x00\x00\x00\x00\x00\x00"
+    b"\x3f\x80\x00\x00\x3f\x80\x00\x00"
+    b"\x00\x00\x00\x00\x3f\x80\x00\x00"
+)
+
+
+@pytest.fixture(autouse=True)
+def caches():
+    """Start each test with empty caches and stop the pool afterwards."""
+    result_cache.clear()
+    content_cache.clear()
+    yield
+    asgi.shutdown()
+
+
+def request(path, method="GET", headers=()):
+    """Call the ASGI application; return ``(status, headers, body)``."""
+    path, _, query = path.partition("?")
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query.encode(),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in headers],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(asgi.app(scope, receive, send))
+    start, *bodies = messages
+    response_headers = {k.decode(): v.decode() for k, v in start["headers"]}
+    body = b"".join(message.get("body", b"") for message in bodies)
+    return start["status"], response_headers, body
+
+
+def test_asgi_matches_flask():
+    """Test that both applications send the same bytes and entity tag."""
+    with patch('triangulator.asgi.fetch_pointset_from_manager',
+               return_value=SQUARE):
+        status, headers, body = request('/triangulation/square')
+    assert status == 200
+    assert headers['content-type'] == 'application/octet-stream'
+
+    result_cache.clear()
+    content_cache.clear()
+    with patch('triangulator.app.fetch_pointset_from_manager',
+               return_value=SQUARE):
+        expected = flask_app.test_client().get('/triangulation/square')
+    assert body == expected.data
+    assert headers['etag'] == expected.headers['ETag']
+    assert int(headers['content-length']) == len(body)
+
+
+def test_asgi_not_modified_and_cache():
+    """Test the conditional requests and the ID cache."""
+    status, headers, _ = request('/triangulation/test-id')
+    assert status == 200
+
+    with patch('triangulator.asgi.build_result') as build:
+        status, _, body = request(
+            '/triangulation/test-id', headers=[('If-None-Match', headers['etag'])]
+        )
+    build.assert_not_called()
+    assert status == 304
+    assert body == b""
+
+
+def test_asgi_late_request_reuses_finished_flight():
+    """Test that a result cached just before entering the flight is served."""
+    key = ('late-id', 'triangles', 'application/octet-stream')
+    result_cache.put(key, 'tag', b'data')
+    with patch('triangulator.asgi.fetch_pointset') as fetch:
+        assert asyncio.run(asgi.build_result(*key)) == ('tag', b'data')
+    fetch.assert_not_called()
+
+
+def test_asgi_compressed_strips():
+    """Test the strips output with a negotiated compression."""
+    status, headers, _ = request(
+        '/triangulation/test-id?output=strips',
+        headers=[('Accept-Encoding', 'gzip')],
+    )
+    assert status == 200
+    assert headers['content-encoding'] == 'gzip'
+    assert headers['etag'].endswith('-gzip"')
+
+    # Deuxième requête : la version compressée vient du cache
+    with patch('triangulator.app.iter_compress') as compress:
+        _, again, body = request(
+            '/triangulation/test-id?output=strips',
+            headers=[('Accept-Encoding', 'gzip')],
+        )
+    compress.assert_not_called()
+    assert again['etag'] == headers['etag']
+    assert int(again['content-length']) == len(body)
+
+
+def test_asgi_errors():
+    """Test that the errors have the same JSON bodies as the Flask app."""
+    status, _, body = request('/triangulation/test-id?output=mesh')
+    assert status == 400
+    assert json.loads(body)["code"] == "INVALID_PARAMETER"
+
+    with patch('triangulator.asgi.fetch_pointset_from_manager',
+               return_value=SQUARE[:4 + 16].replace(b"\x04", b"\x02", 1)):
+        status, _, body = request('/triangulation/two-points')
+    assert status == 400
+    assert json.loads(body)["code"] == "INSUFFICIENT_POINTS"
+
+    with patch('triangulator.asgi.fetch_pointset_from_manager',
+               side_effect=PointSetManagerError("HTTP error 404", 404)):
+        status, _, body = request('/triangulation/x')
+    assert status == 404
+    assert json.loads(body)["code"] == "NOT_FOUND"
+
+
+def test_asgi_routing():
+    """Test the unknown paths and methods."""
+    status, _, body = request('/unknown')
+    assert status == 404
+    assert json.loads(body)["code"] == "NOT_FOUND"
+
+    status, _, _ = request('/triangulation/test-id', method="POST")
+    assert status == 405
+
+    status, _, body = request('/cache/stats')
+    assert status == 200
+    assert set(json.loads(body)) == {"id", "content", "coalesced"}
+
+
+def test_builtin_server_keep_alive():
+    """Test the built-in server end to end, on one keep-alive connection."""
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+    state = {}
+
+    async def run():
+        state["server"], state["lifespan"] = await start_server(asgi.app, port=0)
+        state["port"] = state["server"].sockets[0].getsockname()[1]
+        state["stop"] = asyncio.Event()
+        started.set()
+        await state["stop"].wait()
+        await stop_server(state["server"], state["lifespan"])
+
+    thread = threading.Thread(target=loop.run_until_complete, args=(run(),))
+    thread.start()
+    try:
+        assert started.wait(5)
+        connection = http.client.HTTPConnection("127.0.0.1", state["port"])
+        for _ in range(2):
+            connection.request("GET", "/triangulation/test-id")
+            response = connection.getresponse()
+            assert response.status == 200
+            assert len(response.read()) == 44
+        connection.request("GET", "/missing")
+        response = connection.getresponse()
+        assert response.status == 404
+        assert json.loads(response.read())["code"] == "NOT_FOUND"
+        connection.close()
+    finally:
+        loop.call_soon_threadsafe(state["stop"].set)
+        thread.join(5)
+        loop.close()
@@ -0,0 +1,50 @@
+"""Tests for the LRU cache of serialized results."""
+
+from triangulator.cache import ResultCache
+
+
+def test_cache_hits_and_misses():
+    """Test lookups and their counters."""
+    cache = ResultCache(100)
+    assert cache.get("a") is None
+    assert cache.put("a", "tag", b"x" * 10)
+    assert cache.get("a") == ("tag", b"x" * 10)
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 0)
+    assert (stats["entries"], stats["bytes"]) == (1, 10)
+
+    # Seconde consultation d'une même requête : compteurs inchangés
+    assert cache.get("b", count=False) is None
+    assert cache.get("a", count=False) == ("tag", b"x" * 10)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the byte budget evicts the least recently used entries."""
+    cache = ResultCache(30)
+    cache.put("a", "1", b"a" * 10)
+    cache.put("b", "2", b"b" * 10)
+    cache.put("c", "3", b"c" * 10)
+    cache.get("a")  # "b" devient la plus ancienne
+    cache.put("d", "4", b"d" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 30
+
+
+def test_cache_replaces_and_rejects_oversized():
+    """Test replacing an entry and refusing payloads above the budget."""
+    cache = ResultCache(20)
+    cache.put("a", "1", b"a" * 10)
+    cache.put("a", "2", b"a" * 5)
+    assert cache.stats()["bytes"] == 5
+    assert not cache.put("b", "3", b"b" * 21)
+    assert cache.get("b") is None
+
+    cache.clear()
+    assert cache.stats()["entries"] == 0
+    assert ResultCache(0).put("a", "1", b"") is True
@@ -0,0 +1,55 @@
+"""Tests for the duplicate and degenerate point pre-pass."""
+
+from triangulator.cleanup import dedupe_pointset, is_collinear, remap_triangles
+from triangulator.mesh import TriangleMesh
+from triangulator.utils import serialize_pointset
+
+
+def test_dedupe_keeps_first_occurrences():
+    """Test that exact duplicates are dropped and the first one is kept."""
+    data = serialize_pointset(
+        [(1.0, 2.0), (3.0, 4.0), (1.0, 2.0), (5.0, 6.0), (3.0, 4.0)]
+    )
+    points, original = dedupe_pointset(data)
+
+    assert points == [(1.0, 2.0), (3.0, 4.0), (5.0, 6.0)]
+    assert list(original) == [0, 1, 3]
+
+
+def test_dedupe_negative_zero():
+    """Test that -0.0 and 0.0 are the same coordinate."""
+    data = serialize_pointset([(0.0, 1.0), (-0.0, 1.0), (2.0, -0.0), (2.0, 0.0)])
+    points, original = dedupe_pointset(data)
+
+    assert len(points) == 2
+    assert list(original) == [0, 2]
+
+
+def test_dedupe_empty_pointset():
+    """Test the pre-pass on an empty PointSet."""
+    points, original = dedupe_pointset(b"\x00\x00\x00\x00")
+    assert len(points) == 0
+    assert len(original) == 0
+
+
+def test_dedupe_large_input_with_many_duplicates():
+    """Test the pre-pass on snapped points with many duplicates."""
+    raw = [(float(i % 37), float(i % 11)) for i in range(10000)]
+    points, original = dedupe_pointset(serialize_pointset(raw))
+
+    assert len(points) == len(set(raw))
+    assert all(raw[o] == p for o, p in zip(original, points, strict=True))
+
+
+def test_is_collinear():
+    """Test the detection of inputs without any triangle."""
+    assert is_collinear([])
+    assert is_collinear([(0.0, 0.0), (1.0, 1.0)])
+    assert is_collinear([(0.0, 0.0), (1.0, 1.0), (3.0, 3.0), (-2.0, -2.0)])
+    assert not is_collinear([(0.0, 0.0), (1.0, 1.0), (1.0, 0.0)])
+
+
+def test_remap_triangles():
+    """Test that triangles are renumbered to the input indices."""
+    triangles = TriangleMesh([(0, 1, 2), (1, 3, 2)])
+    assert remap_triangles(triangles, [0, 2, 5, 7]) == [(0, 2, 5), (2, 7, 5)]
@@ -0,0 +1,70 @@
+"""Tests for the offline batch triangulation CLI."""
+
+import random
+
+from triangulator.cli import collect_files, main, output_path
+from triangulator.services import triangulate
+from triangulator.utils import serialize_pointset, serialize_triangles
+
+
+def _write_pointsets(directory, count, size=200):
+    """Write random PointSet files and return their points."""
+    rng = random.Random(4)
+    pointsets = {}
+    for k in range(count):
+        points = [(float(rng.randrange(1000)), float(rng.randrange(1000)))
+                  for _ in range(size)]
+        path = directory / f"set{k}.pointset"
+        path.write_bytes(serialize_pointset(points))
+        pointsets[path] = points
+    return pointsets
+
+
+def test_cli_writes_triangles_files(tmp_path):
+    """Test that every PointSet file gets its Triangles file."""
+    pointsets = _write_pointsets(tmp_path, 3)
+
+    assert main([str(tmp_path), "--workers", "2", "--quiet"]) == 0
+
+    for path, points in pointsets.items():
+        expected = serialize_triangles(points, triangulate(points))
+        assert output_path(path).read_bytes() == expected
+
+
+def test_cli_skips_existing_unless_forced(tmp_path):
+    """Test that existing results are kept unless --force is given."""
+    pointsets = _write_pointsets(tmp_path, 1)
+    path = next(iter(pointsets))
+    output_path(path).write_bytes(b"old")
+
+    assert main([str(path), "-j", "1", "-q"]) == 0
+    assert output_path(path).read_bytes() == b"old"
+
+    assert main([str(path), "-j", "1", "-q", "--force"]) == 0
+    assert output_path(path).read_bytes() != b"old"
+
+
+def test_cli_reports_invalid_files(tmp_path, capsys):
+    """Test that invalid files are reported without stopping the batch."""
+    _write_pointsets(tmp_path, 1)
+    (tmp_path / "truncated.pointset").write_bytes(b"\x00\x00\x00\x05")
+    (tmp_path / "empty.pointset").write_bytes(b"")
+
+    assert main([str(tmp_path), "-j", "1"]) == 1
+
+    err = capsys.readouterr().err
+    assert "truncated.pointset: error: Data too short" in err
+    assert "1 file(s) triangulated, 2 failed" in err
+    assert not output_path(tmp_path / "truncated.pointset").exists()
+    assert not list(tmp_path.glob("*.part"))
+
+
+def test_collect_files(tmp_path):
+    """Test the expansion of directories into PointSet files."""
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "a.pointset").write_bytes(b"")
+    (tmp_path / "b.pointset").write_bytes(b"")
+    (tmp_path / "notes.txt").write_bytes(b"")
+
+    files = collect_files([str(tmp_path)])
+    assert [f.name for f in files] == ["b.pointset", "a.pointset"]
@@ -0,0 +1,50 @@
+"""Tests for the convex hull and the convex polygon check."""
+
+import random
+
+from triangulator.delaunay import sweep_hull
+from triangulator.hull import convex_hull, is_convex_polygon
+
+
+def test_convex_hull_square_with_interior_and_edge_points():
+    """Test that interior and collinear edge points are dropped."""
+    xs = [0.0, 2.0, 2.0, 0.0, 1.0, 1.0, 2.0]
+    ys = [0.0, 0.0, 2.0, 2.0, 1.0, 0.0, 1.0]
+    assert convex_hull(xs, ys) == [0, 1, 2, 3]
+
+
+def test_convex_hull_matches_triangulation_hull():
+    """Test the hull against the hull of the Delaunay triangulation."""
+    rng = random.Random(5)
+    xs = [rng.uniform(0, 10) for _ in range(500)]
+    ys = [rng.uniform(0, 10) for _ in range(500)]
+
+    hull = convex_hull(xs, ys)
+    _, _, reference = sweep_hull(xs, ys)
+    assert sorted(hull) == sorted(reference)
+
+
+def test_convex_hull_degenerate_inputs():
+    """Test empty, duplicate, collinear and non-finite inputs."""
+    assert convex_hull([], []) == []
+    assert convex_hull([1.0, 1.0], [2.0, 2.0]) == [0]
+    assert convex_hull([0.0, 2.0, 1.0], [0.0, 2.0, 1.0]) == [0, 1]
+    assert convex_hull(
+        [0.0, 1.0, 0.0, float('nan')], [0.0, 0.0, 1.0, 5.0]
+    ) == [0, 1, 2]
+
+
+def test_is_convex_polygon():
+    """Test the O(n) detection of ordered convex polygons."""
+    square = ([0.0, 1.0, 1.0, 0.0], [0.0, 0.0, 1.0, 1.0])
+    assert is_convex_polygon(*square) == 1
+    assert is_convex_polygon(square[0][::-1], square[1][::-1]) == -1
+    # Même points, ordre croisé
+    assert is_convex_polygon([0.0, 1.0, 0.0, 1.0], [0.0, 1.0, 1.0, 0.0]) == 0
+    # Sommet aligné
+    assert is_convex_polygon([0.0, 1.0, 2.0, 1.0], [0.0, 0.0, 0.0, 1.0]) == 0
+    # Pentagramme : tous les virages du même côté, mais deux tours
+    xs = [0.0, 0.95, 0.59, -0.59, -0.95]
+    ys = [1.0, 0.31, -0.81, -0.81, 0.31]
+    order = [0, 2, 4, 1, 3]
+    assert is_convex_polygon([xs[i] for i in order], [ys[i] for i in order]) == 0
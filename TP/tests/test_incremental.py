@@ -0,0 +1,168 @@
+"""Tests for the editable Delaunay triangulation."""
+import random
+
+import pytest
+from triangulator.incremental import DelaunayTriangulation
+from triangulator.predicates import incircle
+from triangulator.services import triangulate
+
+
+def _assert_delaunay(xs, ys, triangles, live):
+    """Check that no live point lies inside a triangle's circumcircle."""
+    for i, j, k in triangles:
+        for p in live:
+            assert incircle(
+                xs[i], ys[i], xs[j], ys[j], xs[k], ys[k], xs[p], ys[p]
+            ) <= 0
+
+
+def _random_points(n, seed):
+    """Generate n reproducible random points."""
+    rng = random.Random(seed)
+    return [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(n)]
+
+
+# ==================== Construction ====================
+
+def test_initial_triangulation_matches_triangulate():
+    """Test that the initial triangles are the ones of triangulate()."""
+    points = _random_points(100, 1)
+    mesh = DelaunayTriangulation(points)
+    assert sorted(mesh.triangles()) == sorted(triangulate(points))
+    assert len(mesh) == 100
+
+
+def test_collinear_then_insert():
+    """Test that a collinear set starts triangulating once a point breaks it."""
+    mesh = DelaunayTriangulation([(0.0, 0.0), (1.0, 0.0), (2.0, 0.0)])
+    assert mesh.triangles() == []
+
+    mesh.insert([(1.0, 1.0)])
+
+    assert len(mesh.triangles()) == 2
+
+
+# ==================== Insertion ====================
+
+def test_insert_inside_and_outside_hull():
+    """Test insertion of points inside and outside the current hull."""
+    points = _random_points(50, 2)
+    mesh = DelaunayTriangulation(points)
+
+    new = mesh.insert([(5.0, 5.0), (-3.0, 4.0), (12.0, 12.0)])
+
+    assert new == [50, 51, 52]
+    all_points = points + [(5.0, 5.0), (-3.0, 4.0), (12.0, 12.0)]
+    assert sorted(mesh.triangles()) == sorted(triangulate(all_points))
+
+
+def test_insert_duplicate_is_ignored():
+    """Test that a duplicate point gets an index but no triangle."""
+    mesh = DelaunayTriangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    (dup,) = mesh.insert([(1.0, 0.0)])
+
+    assert all(dup not in t for t in mesh.triangles())
+    assert len(mesh.triangles()) == 1
+
+
+# ==================== Suppression ====================
+
+def test_remove_interior_point():
+    """Test removal of an interior point."""
+    points = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0), (1.0, 1.2)]
+    mesh = DelaunayTriangulation(points)
+
+    mesh.remove([4])
+
+    triangles = mesh.triangles()
+    assert len(triangles) == 2
+    assert all(4 not in t for t in triangles)
+
+
+def test_remove_hull_point():
+    """Test removal of a hull vertex, the hull shrinks."""
+    points = _random_points(60, 3)
+    mesh = DelaunayTriangulation(points)
+    leftmost = min(range(60), key=lambda i: points[i][0])
+
+    mesh.remove([leftmost])
+
+    live = [i for i in range(60) if i != leftmost]
+    _assert_delaunay(mesh.xs, mesh.ys, mesh.triangles(), live)
+    expected = triangulate([points[i] for i in live])
+    assert len(mesh.triangles()) == len(expected)
+
+
+def test_remove_until_degenerate():
+    """Test removing points until no triangle is left."""
+    mesh = DelaunayTriangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)])
+    mesh.remove([3])
+    assert len(mesh.triangles()) == 1
+    mesh.remove([2])
+    assert mesh.triangles() == []
+
+
+def test_remove_reveals_hidden_duplicate():
+    """Test that removing a vertex lets its duplicate take its place."""
+    mesh = DelaunayTriangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 0.0)])
+    mesh.remove([1])
+    assert mesh.triangles() == [(0, 3, 2)]
+
+
+def test_remove_invalid_index():
+    """Test that removing an unknown or removed point raises IndexError."""
+    mesh = DelaunayTriangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    with pytest.raises(IndexError):
+        mesh.remove([3])
+    mesh.remove([0])
+    with pytest.raises(IndexError):
+        mesh.remove([0])
+
+
+def test_remove_duplicate_index():
+    """Test that an index given twice raises IndexError and removes nothing."""
+    mesh = DelaunayTriangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)])
+    with pytest.raises(IndexError, match="given twice"):
+        mesh.remove([3, 3])
+    assert len(mesh.triangles()) == 2
+
+
+def test_random_edits_stay_delaunay():
+    """Test a random sequence of insertions and removals."""
+    rng = random.Random(4)
+    mesh = DelaunayTriangulation(_random_points(30, 5))
+    for _ in range(40):
+        live = [i for i, gone in enumerate(mesh.removed) if not gone]
+        if rng.random() < 0.5:
+            mesh.remove(rng.sample(live, 2))
+        else:
+            mesh.insert([(rng.uniform(0, 10), rng.uniform(0, 10))])
+
+    live = [i for i, gone in enumerate(mesh.removed) if not gone]
+    _assert_delaunay(mesh.xs, mesh.ys, mesh.triangles(), live)
+    expected = triangulate([(mesh.xs[i], mesh.ys[i]) for i in live])
+    assert len(mesh.triangles()) == len(expected)
+
+
+# ==================== Nouvelle version d'un PointSet ====================
+
+def test_update_small_diff():
+    """Test that update() returns triangles indexed into the new version."""
+    points = _random_points(80, 6)
+    mesh = DelaunayTriangulation(points)
+
+    new_version = points[2:] + [(5.5, 5.5), (0.5, 9.5)]
+    triangles = mesh.update(new_version)
+
+    assert sorted(triangles) == sorted(triangulate(new_version))
+
+
+def test_update_large_diff_rebuilds():
+    """Test that a completely different version is rebuilt from scratch."""
+    mesh = DelaunayTriangulation(_random_points(20, 7))
+    new_version = _random_points(30, 8)
+
+    triangles = mesh.update(new_version)
+
+    assert sorted(triangles) == sorted(triangulate(new_version))
+    assert len(mesh.xs) == 30
@@ -0,0 +1,60 @@
+"""Tests for point location in a triangulation."""
+
+import random
+
+from triangulator.locate import OUTSIDE, PointLocator
+from triangulator.predicates import orient2d
+from triangulator.services import triangulate
+
+
+def _contains(points, triangle, x, y):
+    """Return True if (x, y) lies in the closed ccw triangle."""
+    return all(
+        orient2d(*points[triangle[k]], *points[triangle[(k + 1) % 3]], x, y) >= 0
+        for k in range(3)
+    )
+
+
+def test_locate_random_queries():
+    """Test that every located triangle contains its query point."""
+    rng = random.Random(21)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(500)]
+    triangles = triangulate(points)
+    locator = PointLocator(points, triangles)
+
+    for _ in range(300):
+        x, y = rng.uniform(-1, 11), rng.uniform(-1, 11)
+        t = locator.locate(x, y)
+        if t == OUTSIDE:
+            assert not any(_contains(points, tri, x, y) for tri in triangles)
+        else:
+            assert _contains(points, triangles[t], x, y)
+
+
+def test_locate_vertices_and_edges():
+    """Test queries lying exactly on vertices and edges."""
+    points = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+    triangles = triangulate(points)
+    locator = PointLocator(points, triangles)
+
+    for x, y in points + [(1.0, 0.0), (1.0, 1.0), (2.0, 1.0)]:
+        t = locator.locate(x, y)
+        assert t != OUTSIDE
+        assert _contains(points, triangles[t], x, y)
+
+
+def test_locate_outside_and_invalid():
+    """Test queries outside the hull or with non-finite coordinates."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    locator = PointLocator(points, triangulate(points))
+
+    assert locator.locate(0.2, 0.2) == 0
+    assert locator.locate(1.0, 1.0) == OUTSIDE
+    assert locator.locate(float('nan'), 0.0) == OUTSIDE
+    assert list(locator.locate_many([(0.1, 0.1), (-1.0, 0.0)])) == [0, OUTSIDE]
+
+
+def test_locate_empty_triangulation():
+    """Test that nothing is found without triangles."""
+    locator = PointLocator([(0.0, 0.0), (1.0, 1.0)], [])
+    assert locator.locate(0.5, 0.5) == OUTSIDE
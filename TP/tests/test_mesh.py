@@ -0,0 +1,118 @@
+"""Tests for the compact PointSet and TriangleMesh structures."""
+
+import pytest
+from triangulator.mesh import PointSet, PointSetView, TriangleMesh
+from triangulator.utils import (
+    deserialize_pointset,
+    serialize_pointset,
+    serialize_triangles,
+)
+
+
+def test_pointset_sequence_protocol():
+    """Test indexing, iteration and comparison of a PointSet."""
+    points = PointSet([(0.0, 1.0), (2.5, -3.0), (4.0, 5.0)])
+
+    assert len(points) == 3
+    assert points[1] == (2.5, -3.0)
+    assert points[-1] == (4.0, 5.0)
+    assert list(points) == [(0.0, 1.0), (2.5, -3.0), (4.0, 5.0)]
+    assert points == [(0.0, 1.0), (2.5, -3.0), (4.0, 5.0)]
+    assert points[1:] == [(2.5, -3.0), (4.0, 5.0)]
+    assert points.xs == [0.0, 2.5, 4.0]
+    with pytest.raises(IndexError):
+        points[3]
+
+
+def test_pointset_is_compact():
+    """Test that coordinates are stored as float32."""
+    points = PointSet([(0.1, 0.2)])
+    assert points.coords.typecode == 'f'
+    assert points.coords.itemsize == 4
+    assert points[0] != (0.1, 0.2)  # arrondi float32
+
+
+
+def test_pointset_view_decodes_on_access():
+    """Test that a view over PointSet bytes reads points lazily."""
+    points = [(0.0, 1.0), (2.5, -3.0), (4.0, 5.0), (-1.5, 0.25)]
+    data = serialize_pointset(points)
+    view = PointSetView(data)
+
+    assert len(view) == 4
+    assert view[1] == (2.5, -3.0)
+    assert view[-1] == (-1.5, 0.25)
+    assert list(view) == points
+    assert view == points
+    assert isinstance(view[1:3], PointSet)
+    assert view[1:3] == points[1:3]
+    assert view[::2] == points[::2]
+    assert view[3:1] == []
+    assert PointSet.from_coords(view.to_array()) == deserialize_pointset(data)
+    with pytest.raises(IndexError):
+        view[4]
+
+
+def test_pointset_view_reads_header_only():
+    """Test that only the header and the length are checked up front."""
+    # Coordonnées NaN : jamais décodées tant qu'on ne lit que le nombre
+    data = bytes([0, 0, 0, 2]) + b'\xff' * 16 + b'extra'
+    view = PointSetView(memoryview(data))
+    assert len(view) == 2
+
+    with pytest.raises(ValueError, match="too short"):
+        PointSetView(b'\x00\x00')
+    with pytest.raises(ValueError, match="expected 20 bytes"):
+        PointSetView(bytes([0, 0, 0, 2]) + b'\x00' * 8)
+
+def test_pointset_from_coords_odd_length():
+    """Test that an odd number of coordinates is rejected."""
+    from array import array
+    with pytest.raises(ValueError):
+        PointSet.from_coords(array('f', [1.0, 2.0, 3.0]))
+
+
+def test_triangle_mesh_sequence_protocol():
+    """Test indexing, iteration and comparison of a TriangleMesh."""
+    mesh = TriangleMesh([(0, 1, 2), (1, 3, 2)])
+
+    assert len(mesh) == 2
+    assert mesh[0] == (0, 1, 2)
+    assert mesh == [(0, 1, 2), (1, 3, 2)]
+    assert sorted(mesh, reverse=True) == [(1, 3, 2), (0, 1, 2)]
+    assert mesh[1:] == [(1, 3, 2)]
+    assert TriangleMesh() == []
+    assert mesh.indices.typecode == 'I'
+
+
+def test_triangle_mesh_rejects_negative_index():
+    """Test that indices must fit in an unsigned 32-bit integer."""
+    with pytest.raises(ValueError):
+        TriangleMesh([(0, -1, 2)])
+    with pytest.raises(ValueError):
+        TriangleMesh.from_flat([0, 1])
+
+
+def test_serializers_accept_compact_types():
+    """Test that compact types serialize exactly like lists of tuples."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = [(0, 1, 3), (0, 3, 2)]
+
+    assert serialize_pointset(PointSet(points)) == serialize_pointset(points)
+    assert serialize_triangles(
+        PointSet(points), TriangleMesh(triangles)
+    ) == serialize_triangles(points, triangles)
+
+
+def test_serialize_triangle_mesh_out_of_bounds():
+    """Test that an out-of-bounds TriangleMesh index is reported."""
+    points = PointSet([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    with pytest.raises(ValueError, match=r"\(0, 1, 3\)"):
+        serialize_triangles(points, TriangleMesh([(0, 1, 2), (0, 1, 3)]))
+
+
+def test_deserialize_returns_pointset():
+    """Test that deserialization gives a compact PointSet."""
+    points = deserialize_pointset(serialize_pointset([(1.0, 2.0), (3.0, 4.0)]))
+    assert isinstance(points, PointSet)
+    assert points == [(1.0, 2.0), (3.0, 4.0)]
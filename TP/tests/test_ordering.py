@@ -0,0 +1,61 @@
+"""Tests for the spatial ordering of the triangulation input."""
+import random
+
+from triangulator.ordering import brio_order, hilbert_keys, hilbert_order
+
+
+def test_hilbert_order_is_permutation():
+    """Test that the Hilbert order is a permutation of the indices."""
+    random.seed(1)
+    xs = [random.uniform(0, 100) for _ in range(200)]
+    ys = [random.uniform(0, 100) for _ in range(200)]
+    assert sorted(hilbert_order(xs, ys)) == list(range(200))
+
+
+def test_hilbert_order_visits_grid_by_neighbours():
+    """Test that consecutive cells along the curve are adjacent."""
+    xs = [float(i % 8) for i in range(64)]
+    ys = [float(i // 8) for i in range(64)]
+    order = hilbert_order(xs, ys)
+    for a, b in zip(order, order[1:], strict=False):
+        assert abs(xs[a] - xs[b]) + abs(ys[a] - ys[b]) == 1.0
+
+
+def test_hilbert_keys_degenerate_inputs():
+    """Test Hilbert keys on identical and non-finite points."""
+    assert hilbert_keys([1.0, 1.0], [2.0, 2.0]) == [0, 0]
+    assert hilbert_keys([float('nan')], [0.0]) == [0]
+    assert hilbert_keys([], []) == []
+
+
+def test_brio_order_is_permutation():
+    """Test that the BRIO order is a permutation of the indices."""
+    random.seed(2)
+    xs = [random.uniform(0, 1) for _ in range(500)]
+    ys = [random.uniform(0, 1) for _ in range(500)]
+    assert sorted(brio_order(xs, ys)) == list(range(500))
+
+
+def test_brio_order_is_reproducible():
+    """Test that the same seed gives the same order."""
+    xs = [float(i % 13) for i in range(100)]
+    ys = [float(i % 7) for i in range(100)]
+    assert brio_order(xs, ys, seed=5) == brio_order(xs, ys, seed=5)
+
+
+def test_brio_last_round_holds_about_half_the_points():
+    """Test that the final round (a Hilbert-sorted run) is the largest one."""
+    random.seed(3)
+    n = 1024
+    xs = [random.uniform(0, 1) for _ in range(n)]
+    ys = [random.uniform(0, 1) for _ in range(n)]
+    keys = hilbert_keys(xs, ys)
+    order = brio_order(xs, ys)
+
+    # Longueur de la dernière série croissante selon la clé de Hilbert
+    run = 1
+    for a, b in zip(reversed(order[:-1]), reversed(order[1:]), strict=True):
+        if keys[a] > keys[b]:
+            break
+        run += 1
+    assert n // 4 < run < 3 * n // 4
@@ -0,0 +1,90 @@
+"""Tests for the robust geometric predicates."""
+import math
+import struct
+from fractions import Fraction
+
+from triangulator.predicates import incircle, orient2d
+
+
+def _exact_orient_sign(a, b, c):
+    """Compute the reference orientation sign with fractions."""
+    ax, ay, bx, by, cx, cy = (Fraction(v) for v in (*a, *b, *c))
+    det = (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+    return (det > 0) - (det < 0)
+
+
+def _sign(value):
+    """Return the sign of a float as -1, 0 or 1."""
+    return (value > 0) - (value < 0)
+
+
+def _float32(value):
+    """Round a Python float to the nearest float32."""
+    return struct.unpack('>f', struct.pack('>f', value))[0]
+
+
+# ==================== Tests d'orientation ====================
+
+def test_orient2d_counterclockwise():
+    """Test that a counterclockwise triangle gives a positive value."""
+    assert orient2d(0.0, 0.0, 1.0, 0.0, 0.0, 1.0) > 0
+
+
+def test_orient2d_clockwise():
+    """Test that a clockwise triangle gives a negative value."""
+    assert orient2d(0.0, 0.0, 0.0, 1.0, 1.0, 0.0) < 0
+
+
+def test_orient2d_collinear():
+    """Test that collinear points give exactly zero."""
+    assert orient2d(0.0, 0.0, 1.0, 1.0, 2.0, 2.0) == 0
+
+
+def test_orient2d_near_degenerate_matches_exact():
+    """Test the exact sign on nearly collinear points (naive float fails)."""
+    ulp = math.ulp(0.5)
+    b = (12.0, 12.0)
+    c = (24.0, 24.0)
+    for i in range(32):
+        for j in range(32):
+            a = (0.5 + i * ulp, 0.5 + j * ulp)
+            assert _sign(orient2d(*a, *b, *c)) == _exact_orient_sign(a, b, c)
+
+
+def test_orient2d_float32_inputs():
+    """Test the exact sign on float32-rounded, nearly collinear inputs."""
+    for k in range(1, 200):
+        a = (_float32(0.1 * k), _float32(0.3 * k))
+        b = (_float32(0.1 * (k + 1)), _float32(0.3 * (k + 1)))
+        c = (_float32(0.1 * (k + 2)), _float32(0.3 * (k + 2)))
+        assert _sign(orient2d(*a, *b, *c)) == _exact_orient_sign(a, b, c)
+
+
+def test_orient2d_non_finite():
+    """Test that non-finite coordinates do not raise."""
+    result = orient2d(float('nan'), 0.0, 1.0, 0.0, 0.0, 1.0)
+    assert math.isnan(result)
+
+
+# ==================== Tests du cercle circonscrit ====================
+
+def test_incircle_inside():
+    """Test a point strictly inside the circumcircle."""
+    assert incircle(0.0, 0.0, 2.0, 0.0, 0.0, 2.0, 0.5, 0.5) > 0
+
+
+def test_incircle_outside():
+    """Test a point strictly outside the circumcircle."""
+    assert incircle(0.0, 0.0, 2.0, 0.0, 0.0, 2.0, 3.0, 3.0) < 0
+
+
+def test_incircle_cocircular_is_zero():
+    """Test that the fourth corner of a square is exactly cocircular."""
+    assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0) == 0
+
+
+def test_incircle_near_cocircular():
+    """Test that a tiny perturbation of a cocircular point is detected."""
+    eps = math.ulp(1.0)
+    assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, eps, 1.0 - eps) > 0
+    assert incircle(0.0, 0.0, 1.0, 0.0, 1.0, 1.0, -eps, 1.0 + eps) < 0
@@ -1,10 +1,21 @@
 """Tests for PointSet and Triangles binary serialization."""
 
+import io
+
 import pytest
 from triangulator.utils import (
+    PointSetTooLargeError,
+    decode_varint_deltas,
     deserialize_pointset,
+    deserialize_triangles,
+    encode_varint_deltas,
+    iter_compress,
+    iter_serialize_triangles,
+    iter_serialize_triangles_varint,
+    read_pointset,
     serialize_pointset,
     serialize_triangles,
+    triangles_size,
 )
 
 # ==================== Tests de désérialisation PointSet ====================
@@ -162,6 +173,27 @@ def test_deserialize_inconsistent_count():
         deserialize_pointset(data)
 
 
+def test_deserialize_accepts_buffers():
+    """Test deserialization from bytearray and memoryview buffers."""
+    data = serialize_pointset([(1.0, 2.0), (-3.5, 4.25)])
+    expected = [(1.0, 2.0), (-3.5, 4.25)]
+
+    assert deserialize_pointset(bytearray(data)) == expected
+    assert deserialize_pointset(memoryview(data)) == expected
+    # Les octets au-delà des points annoncés sont ignorés
+    assert deserialize_pointset(data + b"\xff\xff") == expected
+
+
+def test_deserialize_large_pointset():
+    """Test that a large PointSet is decoded in order."""
+    points = [(float(i), float(-i)) for i in range(10000)]
+    result = deserialize_pointset(serialize_pointset(points))
+
+    assert len(result) == 10000
+    assert result[9999] == (9999.0, -9999.0)
+    assert result == points
+
+
 # ==================== Tests de sérialisation des Triangles ====================
 
 def test_serialize_triangles_empty():
@@ -257,4 +289,174 @@ def test_serialize_triangles_out_of_bounds_index():
     
     # Devrait lever une exception avec la nouvelle validation
     with pytest.raises(ValueError, match="out of bounds"):
-        serialize_triangles(vertices, triangles)
\ No newline at end of file
+        serialize_triangles(vertices, triangles)
+
+def test_serialize_triangles_matches_reference_encoding():
+    """Test that bulk encoding gives the per-value big-endian layout."""
+    import struct
+    vertices = [(0.5 * i, -1.25 * i) for i in range(50)]
+    triangles = [(i, i + 1, i + 2) for i in range(48)]
+
+    expected = struct.pack('>I', 50)
+    for x, y in vertices:
+        expected += struct.pack('>ff', x, y)
+    expected += struct.pack('>I', 48)
+    for i, j, k in triangles:
+        expected += struct.pack('>III', i, j, k)
+
+    assert serialize_triangles(vertices, triangles) == expected
+
+
+def test_deserialize_triangles_roundtrip():
+    """Test that deserialize_triangles reads back serialize_triangles."""
+    vertices = [(0.5 * i, -1.25 * i) for i in range(50)]
+    triangles = [(i, i + 1, i + 2) for i in range(48)]
+    data = serialize_triangles(vertices, triangles)
+
+    points, mesh = deserialize_triangles(data)
+    assert list(points) == vertices
+    assert list(mesh) == triangles
+    assert mesh.num_vertices == 50
+
+    with pytest.raises(ValueError, match="Invalid length"):
+        deserialize_triangles(data[:-1])
+    with pytest.raises(ValueError, match="triangle count"):
+        deserialize_triangles(data[:4 + 8 * 50])
+    with pytest.raises(ValueError, match="Invalid triangle index"):
+        deserialize_triangles(data[:-4] + (50).to_bytes(4, 'big'))
+
+
+def test_serialize_triangles_reports_first_invalid_triangle():
+    """Test that the error names the first invalid triangle."""
+    vertices = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    with pytest.raises(ValueError, match=r"out of bounds in triangle \(0, 1, 7\)"):
+        serialize_triangles(vertices, [(0, 1, 2), (0, 1, 7), (0, -1, 2)])
+    with pytest.raises(ValueError, match=r"Negative index in triangle: \(0, -1, 2\)"):
+        serialize_triangles(vertices, [(0, 1, 2), (0, -1, 2), (0, 1, 7)])
+
+
+def test_serialize_triangles_trusts_engine_output():
+    """Test that triangles of the pipeline are written without bound check."""
+    from triangulator.mesh import TriangleMesh, TrustedMesh
+    from triangulator.services import triangulate
+
+    vertices = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    triangles = triangulate(vertices)
+    assert isinstance(triangles, TrustedMesh)
+    assert serialize_triangles(vertices, triangles) == serialize_triangles(
+        vertices, list(triangles)
+    )
+
+    # Garantie portée par le type : une copie ordinaire est vérifiée
+    broken = TriangleMesh([(0, 1, 9)])
+    assert serialize_triangles(vertices, TrustedMesh(broken, 4))[-4:] == (
+        b"\x00\x00\x00\x09"
+    )
+    with pytest.raises(ValueError, match="out of bounds"):
+        serialize_triangles(vertices, broken)
+
+
+# ==================== Tests de la sérialisation en flux ====================
+
+def test_iter_serialize_triangles_matches_serialize():
+    """Test that the chunks concatenate to the full serialization."""
+    from triangulator.mesh import PointSet, TriangleMesh
+    vertices = [(float(i), float(i % 7)) for i in range(100)]
+    triangles = [(i, i + 1, i + 2) for i in range(98)]
+    expected = serialize_triangles(vertices, triangles)
+
+    for v, t in ((vertices, triangles), (PointSet(vertices), TriangleMesh(triangles))):
+        chunks = list(iter_serialize_triangles(v, t, chunk_size=16))
+        assert b"".join(chunks) == expected
+        # Morceaux bornés : 16 points (128 octets) ou 16 triangles (192 octets)
+        assert max(len(chunk) for chunk in chunks) <= 192
+    assert triangles_size(100, 98) == len(expected)
+
+
+def test_iter_serialize_triangles_validates_before_streaming():
+    """Test that invalid indices are rejected before the first chunk."""
+    vertices = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    with pytest.raises(ValueError, match="out of bounds"):
+        iter_serialize_triangles(vertices, [(0, 1, 3)])
+
+
+def test_iter_serialize_triangles_empty():
+    """Test streaming of an empty triangulation."""
+    data = b"".join(iter_serialize_triangles([], []))
+    assert data == serialize_triangles([], [])
+    assert len(data) == triangles_size(0, 0)
+
+
+# ==================== Tests des formats compacts ====================
+
+def test_iter_serialize_triangles_little_endian():
+    """Test the little-endian variant of the Triangles format."""
+    import struct
+    vertices = [(1.5, -2.0), (3.0, 4.0), (0.0, 1.0)]
+    data = b"".join(iter_serialize_triangles(vertices, [(0, 1, 2)], byteorder='little'))
+
+    assert data == struct.pack('<I6fI3I', 3, 1.5, -2.0, 3.0, 4.0, 0.0, 1.0, 1, 0, 1, 2)
+
+
+def test_varint_deltas_round_trip():
+    """Test that varint deltas decode back to the same indices."""
+    indices = [0, 1, 2, 300, 299, 70000, 5, 2**32 - 1, 0]
+    data = encode_varint_deltas(indices)
+
+    decoded, size = decode_varint_deltas(data + b"tail", len(indices))
+    assert list(decoded) == indices
+    assert size == len(data)
+    with pytest.raises(ValueError, match="too short"):
+        decode_varint_deltas(data[:-1], len(indices))
+
+
+def test_varint_chunks_match_single_encoding():
+    """Test that chunked varint encoding continues across chunks."""
+    vertices = [(float(i), 0.0) for i in range(1000)]
+    triangles = [(i, (i * 37) % 1000, 999 - i) for i in range(500)]
+    data = b"".join(iter_serialize_triangles_varint(vertices, triangles, chunk_size=7))
+
+    offset = 4 + 8 * 1000
+    assert data[:offset] == serialize_pointset(vertices)
+    assert int.from_bytes(data[offset:offset + 4], 'big') == 500
+    flat = [v for t in triangles for v in t]
+    assert data[offset + 4:] == encode_varint_deltas(flat)
+
+
+def test_iter_compress():
+    """Test gzip and deflate compression of a chunk stream."""
+    import gzip
+    import zlib
+    chunks = [b"abc" * 100, b"", b"xyz" * 50]
+    raw = b"".join(chunks)
+
+    assert gzip.decompress(b"".join(iter_compress(chunks, 'gzip'))) == raw
+    assert zlib.decompress(b"".join(iter_compress(chunks, 'deflate'))) == raw
+
+
+# ==================== Tests de lecture en flux ====================
+
+def test_read_pointset_stops_after_points():
+    """Test that a streamed PointSet is read exactly, up to its last point."""
+    data = serialize_pointset([(1.0, 2.0), (3.0, 4.0)])
+    stream = io.BytesIO(data + b"trailing")
+    result = read_pointset(stream, len(data))
+    assert result == data
+    assert deserialize_pointset(result) == deserialize_pointset(data)
+    assert stream.read() == b"trailing"
+
+
+def test_read_pointset_refuses_large_header():
+    """Test that an oversized PointSet is refused before its points are read."""
+    stream = io.BytesIO(b"\x00\x00\x00\x04" + b"\x00" * 32)
+    with pytest.raises(PointSetTooLargeError, match="36 bytes"):
+        read_pointset(stream, 35)
+    assert stream.tell() == 4
+
+
+def test_read_pointset_truncated():
+    """Test the truncated streams, with the messages of deserialize_pointset."""
+    with pytest.raises(ValueError, match="point count"):
+        read_pointset(io.BytesIO(b"\x00\x00"), 100)
+    with pytest.raises(ValueError, match="expected 20 bytes, got 12"):
+        read_pointset(io.BytesIO(b"\x00\x00\x00\x02" + b"\x00" * 8), 100)
@@ -1,8 +1,149 @@
 """Tests for triangulator services."""
+import asyncio
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from triangulator.client import (
+    AsyncPointSetClient,
+    PointSetClient,
+    PointSetManagerError,
+)
+
 
 def test_fetch_pointset_from_manager_returns_bytes():
     """Test that fetch_pointset_from_manager returns binary data."""
     from triangulator.services import fetch_pointset_from_manager
     result = fetch_pointset_from_manager("dummy_id")
     assert isinstance(result, bytes)
-    assert len(result) > 0
\ No newline at end of file
+    assert len(result) > 0
+
+
+# ==================== Tests du client PointSetManager ====================
+
+POINTSET = b"\x00\x00\x00\x01" + b"\x00" * 8
+
+
+@pytest.fixture
+def manager():
+    """Start a local PointSetManager answering with a list of statuses."""
+    state = {"statuses": [], "connections": set(), "paths": []}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            state["connections"].add(self.client_address)
+            state["paths"].append(self.path)
+            status = state["statuses"].pop(0) if state["statuses"] else 200
+            body = POINTSET if status == 200 else b"{}"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state["url"] = f"http://127.0.0.1:{server.server_port}"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+def test_client_reuses_connection(manager):
+    """Test that consecutive requests share one keep-alive connection."""
+    client = PointSetClient(manager["url"])
+    assert client.get_pointset("a") == POINTSET
+    assert client.get_pointset("b") == POINTSET
+    client.close()
+
+    assert manager["paths"] == ["/pointset/a", "/pointset/b"]
+    assert len(manager["connections"]) == 1
+
+
+def test_client_retries_server_errors(manager):
+    """Test that 5xx answers are retried, up to the configured count."""
+    manager["statuses"] = [503, 500]
+    client = PointSetClient(manager["url"], retries=2, backoff=0)
+    assert client.get_pointset("a") == POINTSET
+
+    manager["statuses"] = [503, 503]
+    client = PointSetClient(manager["url"], retries=1, backoff=0)
+    with pytest.raises(RuntimeError, match="HTTP error 503"):
+        client.get_pointset("a")
+
+
+def test_client_does_not_retry_not_found(manager):
+    """Test that a 404 is reported at once."""
+    manager["statuses"] = [404, 200]
+    client = PointSetClient(manager["url"], backoff=0)
+    with pytest.raises(PointSetManagerError, match="HTTP error 404") as error:
+        client.get_pointset("missing")
+    assert error.value.status == 404
+    assert len(manager["paths"]) == 1
+
+
+def test_client_connection_error():
+    """Test that an unreachable manager gives a RuntimeError after retries."""
+    client = PointSetClient(
+        "http://127.0.0.1:9", connect_timeout=0.5, retries=1, backoff=0
+    )
+    with pytest.raises(RuntimeError, match="URL error"):
+        client.get_pointset("a")
+
+
+def test_client_read_timeout():
+    """Test that a stalled manager does not hang the caller."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    try:
+        port = listener.getsockname()[1]
+        client = PointSetClient(
+            f"http://127.0.0.1:{port}", read_timeout=0.2, retries=0
+        )
+        with pytest.raises(RuntimeError, match="timed out"):
+            client.get_pointset("a")
+    finally:
+        listener.close()
+
+
+def test_async_client_reuses_connection(manager):
+    """Test that the asyncio client also keeps its connection alive."""
+    async def fetch():
+        client = AsyncPointSetClient(manager["url"])
+        try:
+            return [await client.get_pointset(i) for i in ("a", "b")]
+        finally:
+            client.close()
+
+    assert asyncio.run(fetch()) == [POINTSET, POINTSET]
+    assert manager["paths"] == ["/pointset/a", "/pointset/b"]
+    assert len(manager["connections"]) == 1
+
+
+def test_async_client_retries_and_reports_errors(manager):
+    """Test the retries and error messages of the asyncio client."""
+    async def fetch(client, pointset_id):
+        try:
+            return await client.get_pointset(pointset_id)
+        finally:
+            client.close()
+
+    manager["statuses"] = [503]
+    client = AsyncPointSetClient(manager["url"], retries=1, backoff=0)
+    assert asyncio.run(fetch(client, "a")) == POINTSET
+
+    manager["statuses"] = [404]
+    client = AsyncPointSetClient(manager["url"], backoff=0)
+    with pytest.raises(RuntimeError, match="HTTP error 404"):
+        asyncio.run(fetch(client, "missing"))
+
+    client = AsyncPointSetClient(
+        "http://127.0.0.1:9", connect_timeout=0.5, retries=0
+    )
+    with pytest.raises(RuntimeError, match="URL error"):
+        asyncio.run(fetch(client, "a"))
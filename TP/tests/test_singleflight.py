@@ -0,0 +1,121 @@
+"""Tests for the coalescing of concurrent identical calls."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from triangulator.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def _run_concurrently(group, key, function, count):
+    """Call ``group.do`` from ``count`` threads while the first one blocks."""
+    release = threading.Event()
+    outcomes = [None] * count
+
+    def blocked():
+        release.wait(5)
+        return function()
+
+    def worker(i):
+        try:
+            outcomes[i] = ("result", group.do(key, blocked))
+        except Exception as e:
+            outcomes[i] = ("error", e)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    # Le premier appel calcule, les autres doivent l'attendre
+    deadline = time.monotonic() + 5
+    while group.coalesced < count - 1 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_single_flight_shares_result():
+    """Test that one call computes and every concurrent caller gets it."""
+    group = SingleFlight()
+    calls = []
+    outcomes = _run_concurrently(
+        group, "k", lambda: calls.append(1) or "value", 8
+    )
+
+    assert len(calls) == 1
+    assert outcomes == [("result", "value")] * 8
+    assert group.coalesced == 7
+
+
+def test_single_flight_fans_out_errors():
+    """Test that the exception of the leader is raised in every caller."""
+    group = SingleFlight()
+
+    def fail():
+        raise RuntimeError("HTTP error 503")
+
+    outcomes = _run_concurrently(group, "k", fail, 4)
+    assert all(kind == "error" for kind, _ in outcomes)
+    assert all(str(e) == "HTTP error 503" for _, e in outcomes)
+
+
+def test_single_flight_later_calls_recompute():
+    """Test that only concurrent calls are coalesced."""
+    group = SingleFlight()
+    assert group.do("k", lambda: 1) == 1
+    assert group.do("k", lambda: 2) == 2
+    with pytest.raises(ValueError):
+        group.do("k", lambda: int("x"))
+    assert group.do("k", lambda: 3) == 3
+    assert group.coalesced == 0
+
+
+def test_async_single_flight_survives_leader_cancellation():
+    """Test that cancelling the first caller does not fail the others."""
+    async def scenario():
+        group = AsyncSingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await release.wait()
+            return "result"
+
+        leader = asyncio.create_task(group.do("k", compute))
+        follower = asyncio.create_task(group.do("k", compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await follower == "result"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert len(calls) == 1
+        assert group.coalesced == 1
+
+        # Appel terminé : le suivant recalcule
+        assert await group.do("k", compute) == "result"
+        assert len(calls) == 2
+
+    asyncio.run(scenario())
+
+
+def test_async_single_flight_fans_out_errors():
+    """Test that every concurrent caller gets the exception."""
+    async def scenario():
+        group = AsyncSingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0)
+            raise RuntimeError("HTTP error 503")
+
+        return await asyncio.gather(
+            group.do("k", fail), group.do("k", fail), return_exceptions=True
+        )
+
+    outcomes = asyncio.run(scenario())
+    assert [str(e) for e in outcomes] == ["HTTP error 503"] * 2
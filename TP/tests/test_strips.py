@@ -0,0 +1,70 @@
+"""Tests for the triangle strip output."""
+
+import random
+
+from triangulator.mesh import TriangleMesh
+from triangulator.services import triangulate
+from triangulator.strips import (
+    STRIP_RESTART,
+    strips_to_triangles,
+    triangle_strips,
+)
+from triangulator.utils import serialize_triangle_strips, serialize_triangles
+
+
+def _canonical(triangles):
+    """Return the triangles as a sorted list, each rotated to its minimum."""
+    result = []
+    for t in triangles:
+        i = t.index(min(t))
+        result.append(tuple(t[i:]) + tuple(t[:i]))
+    return sorted(result)
+
+
+def test_strips_single_triangle():
+    """Test that one triangle gives one strip of three indices."""
+    strips = triangle_strips(TriangleMesh([(0, 1, 2)]))
+    assert list(strips) == [0, 1, 2]
+    assert strips_to_triangles(strips) == [(0, 1, 2)]
+
+
+def test_strips_fan():
+    """Test that a fan around a vertex needs a single strip."""
+    fan = [(0, i, i + 1) for i in range(1, 7)]
+    strips = triangle_strips(fan)
+
+    assert STRIP_RESTART not in strips
+    assert _canonical(strips_to_triangles(strips)) == _canonical(fan)
+
+
+def test_strips_empty():
+    """Test that no triangle gives no strip."""
+    assert len(triangle_strips(TriangleMesh())) == 0
+    assert strips_to_triangles([]) == []
+
+
+def test_strips_round_trip_keeps_orientation():
+    """Test that decoding the strips gives back the same oriented triangles."""
+    rng = random.Random(5)
+    points = [(rng.random(), rng.random()) for _ in range(2000)]
+    triangles = triangulate(points)
+    strips = triangle_strips(triangles)
+
+    assert _canonical(strips_to_triangles(strips)) == _canonical(triangles)
+    # Au moins deux fois moins d'indices qu'en liste de triangles
+    assert 2 * len(strips) < 3 * len(triangles)
+
+
+def test_serialize_triangle_strips():
+    """Test the binary layout: vertices, index count, indices."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    triangles = [(0, 1, 2), (0, 2, 3)]
+    data = serialize_triangle_strips(points, triangle_strips(triangles))
+
+    vertex_part = serialize_triangles(points, triangles)[:4 + 8 * 4]
+    assert data[:36] == vertex_part
+    count = int.from_bytes(data[36:40], 'big')
+    assert count == 4
+    strips = [int.from_bytes(data[k:k + 4], 'big') for k in range(40, 56, 4)]
+    assert _canonical(strips_to_triangles(strips)) == _canonical(triangles)
+    assert len(data) == 56
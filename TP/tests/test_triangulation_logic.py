@@ -1,5 +1,8 @@
 """Tests for the core triangulation logic."""
 
+import pytest
+from triangulator.delaunay import sweep_hull
+from triangulator.mesh import TriangleMesh
 from triangulator.services import triangulate
 
 # ==================== Tests de base ====================
@@ -153,8 +156,8 @@ def test_triangulate_with_interior_point():
     ]
     triangles = triangulate(points)
     
-    # Doit produire des triangles (nombre dépend de l'algo)
-    assert len(triangles) == 3  # n-2 pour fan triangulation
+    # Delaunay : 4 triangles autour du centre
+    assert len(triangles) == 4
     
     # Tous les points doivent être utilisés
     used = set()
@@ -173,7 +176,7 @@ def test_triangulate_collinear_points():
     
     # Comportement attendu : soit [] soit [un triangle dégénéré]
     # Selon votre implémentation, accepter les deux
-    assert isinstance(triangles, list)
+    assert isinstance(triangles, TriangleMesh)
     
     if len(triangles) > 0:
         # Si un triangle est créé, vérifier qu'il a des indices valides
@@ -190,7 +193,7 @@ def test_triangulate_duplicate_points():
     triangles = triangulate(points)
     
     # Doit gérer sans planter
-    assert isinstance(triangles, list)
+    assert isinstance(triangles, TriangleMesh)
     
     # Vérifier que les indices sont valides
     for i, j, k in triangles:
@@ -211,10 +214,33 @@ def test_triangulate_very_close_points():
     triangles = triangulate(points)
     
     # Doit produire un résultat (même si numériquement instable)
-    assert isinstance(triangles, list)
+    assert isinstance(triangles, TriangleMesh)
     assert len(triangles) >= 0
 
 
+@pytest.mark.parametrize("scale", [1e-14, 1e-16, 1e-30])
+def test_triangulate_small_scale_uses_every_point(scale):
+    """Test that tiny coordinates are not mistaken for duplicates."""
+    import random
+
+    rng = random.Random(1)
+    points = [(rng.random() * scale, rng.random() * scale) for _ in range(200)]
+    for algorithm in ("delaunay", "incremental"):
+        triangles = triangulate(points, algorithm)
+        used = {i for triangle in triangles for i in triangle}
+        assert used == set(range(len(points)))
+
+
+def test_triangulate_keeps_tiny_cluster_in_large_set():
+    """Test that close points far below the extent are all triangulated."""
+    points = [
+        (0.0, 0.0), (1e6, 0.0), (0.0, 1e6), (1e6, 1e6),
+        (1e-12, 1e-12), (2e-12, 3e-12),
+    ]
+    used = {i for triangle in triangulate(points) for i in triangle}
+    assert used == set(range(len(points)))
+
+
 # ==================== Tests géométriques ====================
 
 def calculate_triangle_area(p1, p2, p3):
@@ -253,8 +279,9 @@ def test_triangulate_random_points():
     points = [(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(30)]
     triangles = triangulate(points)
     
-    # Vérifier propriétés de base
-    assert len(triangles) == len(points) - 2  # Fan triangulation
+    # Vérifier propriétés de base : 2n - 2 - h triangles (h = sommets de l'enveloppe)
+    _, _, hull = sweep_hull([x for x, _ in points], [y for _, y in points])
+    assert len(triangles) == 2 * len(points) - 2 - len(hull)
     
     # Tous les indices valides
     for i, j, k in triangles:
@@ -270,7 +297,213 @@ def test_triangulate_formula_n_minus_2():
     """Test that fan triangulation produces exactly n-2 triangles."""
     for n in [3, 4, 5, 10, 20, 50]:
         points = [(i * 0.1, i * 0.2) for i in range(n)]
-        triangles = triangulate(points)
+        triangles = triangulate(points, algorithm="fan")
         expected = n - 2
         assert len(triangles) == expected, \
-            f"Expected {expected} triangles for {n} points, got {len(triangles)}"
\ No newline at end of file
+            f"Expected {expected} triangles for {n} points, got {len(triangles)}"
+
+# ==================== Tests de la propriété de Delaunay ====================
+
+def _in_circumcircle(a, b, c, p):
+    """Return True if p is strictly inside the circumcircle of ccw (a, b, c)."""
+    ax, ay = a[0] - p[0], a[1] - p[1]
+    bx, by = b[0] - p[0], b[1] - p[1]
+    cx, cy = c[0] - p[0], c[1] - p[1]
+    det = (
+        (ax * ax + ay * ay) * (bx * cy - cx * by)
+        - (bx * bx + by * by) * (ax * cy - cx * ay)
+        + (cx * cx + cy * cy) * (ax * by - bx * ay)
+    )
+    return det > 1e-9
+
+
+def test_triangulate_empty_circumcircle():
+    """Test that no point lies inside the circumcircle of any triangle."""
+    import random
+    random.seed(7)
+
+    points = [(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(60)]
+    triangles = triangulate(points)
+
+    for i, j, k in triangles:
+        for p in range(len(points)):
+            if p in (i, j, k):
+                continue
+            assert not _in_circumcircle(points[i], points[j], points[k], points[p])
+
+
+def test_triangulate_counterclockwise():
+    """Test that Delaunay triangles are counterclockwise with smallest index first."""
+    points = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0), (1.0, 1.0)]
+    triangles = triangulate(points)
+
+    for i, j, k in triangles:
+        assert i < j and i < k
+        (ax, ay), (bx, by), (cx, cy) = points[i], points[j], points[k]
+        assert (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) > 0
+
+
+def test_triangulate_unordered_non_convex():
+    """Test that unordered input does not produce overlapping triangles."""
+    # Le fan (0, i, i+1) croise ses triangles sur cet ordre
+    points = [(0.0, 0.0), (2.0, 2.0), (2.0, 0.0), (0.0, 2.0), (1.0, 0.5)]
+    triangles = triangulate(points)
+
+    total_area = sum(
+        calculate_triangle_area(points[i], points[j], points[k])
+        for i, j, k in triangles
+    )
+    # L'union des triangles couvre exactement l'enveloppe convexe (aire 4)
+    assert total_area == pytest.approx(4.0)
+
+
+def test_triangulate_collinear_returns_no_triangle():
+    """Test that Delaunay triangulation of collinear points is empty."""
+    points = [(i * 0.5, i * 0.25) for i in range(10)]
+    assert triangulate(points) == []
+
+
+def test_triangulate_fan_algorithm():
+    """Test that the fan algorithm stays available as a cheap fallback."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+    assert triangulate(points, algorithm="fan") == [(0, 1, 2), (0, 2, 3)]
+
+
+def test_triangulate_auto_convex_polygon():
+    """Test that "auto" uses the fan on an ordered convex polygon."""
+    hexagon = [
+        (2.0, 0.0), (1.0, 1.7), (-1.0, 1.7), (-2.0, 0.0), (-1.0, -1.7), (1.0, -1.7)
+    ]
+    assert triangulate(hexagon, algorithm="auto") == [
+        (0, 1, 2), (0, 2, 3), (0, 3, 4), (0, 4, 5)
+    ]
+    # Sens horaire : triangles retournés pour rester trigonométriques
+    clockwise = hexagon[::-1]
+    for i, j, k in triangulate(clockwise, algorithm="auto"):
+        assert calculate_triangle_area(clockwise[i], clockwise[j], clockwise[k]) > 0
+
+
+def test_triangulate_auto_falls_back_to_delaunay():
+    """Test that "auto" gives the Delaunay triangulation otherwise."""
+    points = [(0.0, 0.0), (2.0, 2.0), (2.0, 0.0), (0.0, 2.0), (1.0, 0.5)]
+    assert sorted(triangulate(points, algorithm="auto")) == sorted(triangulate(points))
+
+
+def test_triangulate_unknown_algorithm():
+    """Test that an unknown algorithm raises ValueError."""
+    with pytest.raises(ValueError, match="Unknown algorithm"):
+        triangulate([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], algorithm="magic")
+
+
+@pytest.mark.parametrize("algorithm", ["delaunay", "incremental", "fan", "auto"])
+@pytest.mark.parametrize("bad", [float('nan'), float('inf'), float('-inf')])
+def test_triangulate_non_finite_rejected(algorithm, bad):
+    """Test that every algorithm raises ValueError on a non-finite coordinate."""
+    points = [(0.0, 0.0), (1.0, 0.0), (1.0, bad), (0.0, 1.0)]
+    with pytest.raises(ValueError, match="Non-finite coordinate in point 2"):
+        triangulate(points, algorithm=algorithm)
+
+
+# ==================== Tests de l'insertion incrémentale ====================
+
+def test_triangulate_incremental_matches_delaunay():
+    """Test that incremental insertion gives the same triangles as sweep-hull."""
+    import random
+    random.seed(11)
+
+    points = [(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(200)]
+
+    incremental = triangulate(points, algorithm="incremental")
+    sweep = triangulate(points)
+
+    assert sorted(incremental) == sorted(sweep)
+
+
+def test_triangulate_incremental_clustered_points():
+    """Test incremental insertion on clustered points with duplicates."""
+    import random
+    random.seed(12)
+
+    points = []
+    for cx, cy in [(0.0, 0.0), (100.0, 0.0), (50.0, 80.0)]:
+        points += [
+            (cx + random.gauss(0, 1), cy + random.gauss(0, 1)) for _ in range(50)
+        ]
+    points += points[:10]  # doublons exacts
+    triangles = triangulate(points, algorithm="incremental")
+
+    # Un seul exemplaire de chaque doublon est utilisé
+    used = {v for t in triangles for v in t}
+    assert len(used) == 150
+    assert {points[v] for v in used} == set(points)
+    _, _, hull = sweep_hull([x for x, _ in points], [y for _, y in points])
+    assert len(triangles) == 2 * 150 - 2 - len(hull)
+
+
+def test_triangulate_incremental_grid():
+    """Test incremental insertion on a cocircular grid."""
+    points = [(float(i % 10), float(i // 10)) for i in range(100)]
+    triangles = triangulate(points, algorithm="incremental")
+
+    assert len(triangles) == 162
+    for i, j, k in triangles:
+        assert calculate_triangle_area(points[i], points[j], points[k]) > 0
+
+
+def test_triangulate_incremental_collinear():
+    """Test that incremental insertion of collinear points gives no triangle."""
+    points = [(i * 1.0, i * 2.0) for i in range(8)]
+    assert triangulate(points, algorithm="incremental") == []
+
+
+def test_triangulate_parallel_matches_delaunay():
+    """Test that the strip-parallel triangulation equals the sequential one."""
+    import random
+    random.seed(13)
+
+    points = [(random.uniform(0, 10), random.uniform(0, 10)) for _ in range(1000)]
+
+    parallel = triangulate(points, parallel_threshold=0, workers=3)
+    sweep = triangulate(points)
+
+    assert sorted(parallel) == sorted(sweep)
+
+
+def test_triangulate_parallel_grid():
+    """Test the strip-parallel triangulation on a cocircular grid."""
+    points = [(float(i % 20), float(i // 20)) for i in range(400)]
+    triangles = triangulate(points, parallel_threshold=0, workers=4)
+
+    assert len(triangles) == 2 * 400 - 2 - 76
+    for i, j, k in triangles:
+        assert calculate_triangle_area(points[i], points[j], points[k]) > 0
+        for p in points:
+            assert not _in_circumcircle(points[i], points[j], points[k], p)
+
+
+def test_triangulate_parallel_reuses_pool():
+    """Test that consecutive parallel triangulations share one process pool."""
+    from triangulator import parallel
+
+    points = [(float(i % 20), float(i // 20) + i % 3 / 10) for i in range(400)]
+    try:
+        triangulate(points, parallel_threshold=0, workers=2)
+        pool = parallel._pool
+        assert pool is not None
+        triangulate(points, parallel_threshold=0, workers=2)
+        assert parallel._pool is pool
+    finally:
+        parallel.shutdown_pool()
+    assert parallel._pool is None
+
+
+def test_triangulate_parallel_below_threshold(monkeypatch):
+    """Test that small inputs never start the process pool."""
+    import triangulator.services as services
+
+    def fail(*args, **kwargs):
+        raise AssertionError("process pool used below the threshold")
+
+    monkeypatch.setattr(services, "parallel_delaunay", fail)
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 1.0)]
+    assert len(triangulate(points, parallel_threshold=5)) == 2
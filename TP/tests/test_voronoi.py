@@ -0,0 +1,56 @@
+"""Tests for the Voronoi diagram derived from the triangulation."""
+
+import math
+import random
+
+from triangulator.services import triangulate
+from triangulator.utils import serialize_voronoi
+from triangulator.voronoi import UNBOUNDED, voronoi_dual
+
+
+def test_voronoi_square():
+    """Test the dual of a square: one interior edge, four rays."""
+    points = [(0.0, 0.0), (2.0, 0.0), (2.0, 2.0), (0.0, 2.0)]
+    triangles = triangulate(points)
+    centers, edges = voronoi_dual(points, triangles)
+
+    # Les deux triangles ont le même centre circonscrit (1, 1)
+    assert list(centers) == [1.0, 1.0, 1.0, 1.0]
+    records = [tuple(edges[k:k + 4]) for k in range(0, len(edges), 4)]
+    assert len(records) == 5
+    assert sum(1 for r in records if r[3] == UNBOUNDED) == 4
+
+
+def test_voronoi_edges_are_equidistant():
+    """Test that every Voronoi edge lies on the bisector of its two sites."""
+    rng = random.Random(3)
+    points = [(rng.uniform(0, 10), rng.uniform(0, 10)) for _ in range(200)]
+    triangles = triangulate(points)
+    centers, edges = voronoi_dual(points, triangles)
+
+    assert len(centers) == 2 * len(triangles)
+    interior = 0
+    for k in range(0, len(edges), 4):
+        i, j, u, v = edges[k:k + 4]
+        for w in (u, v):
+            if w == UNBOUNDED:
+                continue
+            cx, cy = centers[2 * w], centers[2 * w + 1]
+            di = math.dist((cx, cy), points[i])
+            dj = math.dist((cx, cy), points[j])
+            assert math.isclose(di, dj, rel_tol=1e-9, abs_tol=1e-9)
+        interior += v != UNBOUNDED
+    # Chaque arête intérieure est partagée par deux triangles
+    hull_edges = len(edges) // 4 - interior
+    assert 3 * len(triangles) == 2 * interior + hull_edges
+
+
+def test_serialize_voronoi_layout():
+    """Test the binary layout of the Voronoi format."""
+    data = serialize_voronoi([1.0, 2.0], [0, 1, 0, UNBOUNDED])
+
+    assert int.from_bytes(data[:4], 'big') == 1
+    assert int.from_bytes(data[12:16], 'big') == 1
+    assert data[16:] == (
+        b"\x00\x00\x00\x00" b"\x00\x00\x00\x01" b"\x00\x00\x00\x00" b"\xff\xff\xff\xff"
+    )
@@ -0,0 +1,6 @@
+"""Point d'entrée ``python -m triangulator``."""
+import sys
+
+from .cli import main
+
+sys.exit(main())
@@ -1,15 +1,460 @@
 """Application Flask pour le service de triangulation."""
-from flask import Flask, Response, jsonify
+import hashlib
+import json
+import math
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-from .services import fetch_pointset_from_manager, triangulate
-from .utils import deserialize_pointset, serialize_triangles
+from flask import Flask, Response, jsonify, request
+from werkzeug.http import quote_etag
+
+from .cache import ResultCache
+from .client import MANAGER_URL, PointSetManagerError, manager_client
+from .hull import convex_hull
+from .incremental import DelaunayTriangulation
+from .locate import PointLocator
+from .mesh import PointSet
+from .parallel import PARALLEL_THRESHOLD, shutdown_pool
+from .services import (
+    InsufficientPointsError,
+    fetch_pointset_from_manager,
+    triangulate,
+    triangulate_pointset,
+)
+from .singleflight import SingleFlight
+from .strips import triangle_strips
+from .utils import (
+    PointSetTooLargeError,
+    deserialize_pointset,
+    deserialize_triangles,
+    iter_compress,
+    iter_serialize_triangles,
+    iter_serialize_triangles_varint,
+    read_pointset,
+    serialize_batch_frame,
+    serialize_locations,
+    serialize_pointset,
+    serialize_triangle_strips,
+    serialize_voronoi,
+    triangles_size,
+)
+from .voronoi import voronoi_dual
 
 app = Flask(__name__)
 
+# Accès au PointSetManager, surchargeable par l'environnement
+# (TRIANGULATOR_POINTSET_MANAGER_URL=..., TRIANGULATOR_POINTSET_MANAGER_MOCK=false)
+app.config.from_mapping(
+    POINTSET_MANAGER_MOCK=True,
+    POINTSET_MANAGER_URL=MANAGER_URL,
+    POINTSET_MANAGER_CONNECT_TIMEOUT=2.0,
+    POINTSET_MANAGER_READ_TIMEOUT=10.0,
+    POINTSET_MANAGER_RETRIES=2,
+    RESULT_CACHE_MAX_BYTES=64 * 1024 * 1024,
+    RESULT_CACHE_MAX_AGE=3600,
+    CONTENT_CACHE_MAX_BYTES=64 * 1024 * 1024,
+    CPU_WORKERS=None,
+    PARALLEL_THRESHOLD=PARALLEL_THRESHOLD,
+    PARALLEL_WORKERS=None,
+    VERSIONS_MAX_POINTS=250_000,
+    LOCATORS_MAX_POINTS=250_000,
+    BATCH_MAX_IDS=10000,
+    BATCH_FETCH_WORKERS=8,
+    UPLOAD_MAX_BYTES=64 * 1024 * 1024,
+)
+app.config.from_prefixed_env("TRIANGULATOR")
+
+# Formats de sortie de GET /triangulation/<pointset_id>
+OUTPUTS = ("triangles", "strips", "voronoi")
+
+# Variantes du format Triangles, négociées par l'en-tête Accept (la
+# première est celle par défaut)
+TRIANGLES_MIMETYPE = 'application/octet-stream'
+TRIANGLES_LE_MIMETYPE = 'application/x-triangles-le'
+TRIANGLES_VARINT_MIMETYPE = 'application/x-triangles-varint'
+TRIANGLE_MIMETYPES = (
+    TRIANGLES_MIMETYPE,
+    TRIANGLES_LE_MIMETYPE,
+    TRIANGLES_VARINT_MIMETYPE,
+)
+
+# Flux de résultats de POST /triangulation/batch
+BATCH_MIMETYPE = 'application/x-triangles-batch'
+
+# Compressions acceptées via Accept-Encoding, par ordre de préférence
+ENCODINGS = ('gzip', 'deflate')
+
+# Les réponses binaires dépendent de ces en-têtes de la requête
+VARY = 'Accept, Accept-Encoding'
+
+# Résultats sérialisés, par (pointset_id, output, mimetype), puis par
+# empreinte des octets du PointSet : un même contenu publié sous plusieurs
+# IDs n'est triangulé qu'une fois
+result_cache = ResultCache(app.config["RESULT_CACHE_MAX_BYTES"])
+content_cache = ResultCache(app.config["CONTENT_CACHE_MAX_BYTES"])
+
+# Calculs en cours, partagés par les requêtes simultanées
+flights = SingleFlight()
+
+# Pool de processus des triangulations hors requête (lots, application
+# ASGI), créé au premier usage
+_executor = None
+_executor_lock = threading.Lock()
+
+# Triangulations modifiables des versions demandées avec ``?base=``, par
+# ID de version ; bornées en nombre total de points (quelques centaines
+# d'octets par point)
+MAX_KEPT_TRIANGULATIONS = 32
+_versions = OrderedDict()
+_versions_points = 0
+_versions_lock = threading.Lock()
+
+# Index de localisation, par ID de PointSet (immuable) ; bornés comme les
+# versions, en nombre total de points
+_locators = OrderedDict()
+_locators_points = 0
+_locators_lock = threading.Lock()
+
+
+def fetch_pointset(pointset_id):
+    """Fetch a PointSet from the PointSetManager configured for the app.
+
+    Args:
+        pointset_id: UUID of the PointSet
+
+    Returns:
+        bytes: PointSet in its binary format
+
+    Raises:
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    config = app.config
+    if config["POINTSET_MANAGER_MOCK"]:
+        return fetch_pointset_from_manager(pointset_id, use_mock=True)
+    client = manager_client(
+        config["POINTSET_MANAGER_URL"],
+        connect_timeout=config["POINTSET_MANAGER_CONNECT_TIMEOUT"],
+        read_timeout=config["POINTSET_MANAGER_READ_TIMEOUT"],
+        retries=config["POINTSET_MANAGER_RETRIES"],
+    )
+    return fetch_pointset_from_manager(
+        pointset_id, use_mock=False, client=client
+    )
+
+
+def triangulate_version(pointset_id, base_id, points):
+    """Triangulate a new version of a PointSet from the one it derives from.
+
+    When the triangulation of ``base_id`` is still kept, only the points
+    that changed are removed or inserted; otherwise the triangulation is
+    built from scratch. Either way it is then kept for ``pointset_id``, the
+    base of the next version. It is taken out of the shared table while it
+    is updated, so concurrent requests never edit the same object.
+
+    Args:
+        pointset_id: UUID of the new version
+        base_id: UUID of the version it was derived from
+        points: PointSet (or list of (x, y) tuples) of the new version
+
+    Returns:
+        TriangleMesh: Triangles as (i, j, k) indices into ``points``
+
+    """
+    global _versions_points
+    with _versions_lock:
+        mesh = _versions.pop(base_id, None)
+        if mesh is not None:
+            _versions_points -= len(mesh.xs)
+
+    if mesh is None:
+        mesh = DelaunayTriangulation(points)
+        triangles = mesh.triangles()
+    else:
+        triangles = mesh.update(points)
+
+    # Les points retirés gardent leur indice : ils comptent jusqu'à la
+    # prochaine reconstruction
+    size = len(mesh.xs)
+    max_points = app.config["VERSIONS_MAX_POINTS"]
+    if size <= max_points:
+        with _versions_lock:
+            previous = _versions.pop(pointset_id, None)
+            if previous is not None:
+                _versions_points -= len(previous.xs)
+            _versions[pointset_id] = mesh
+            _versions_points += size
+            while _versions_points > max_points or (
+                len(_versions) > MAX_KEPT_TRIANGULATIONS
+            ):
+                _, evicted = _versions.popitem(last=False)
+                _versions_points -= len(evicted.xs)
+    return triangles
+
+
+def compute_triangulation(pointset_id, pointset_bytes=None, base_id=None):
+    """Fetch a PointSet and triangulate it.
+
+    Args:
+        pointset_id: UUID of the PointSet to triangulate
+        pointset_bytes: PointSet already fetched for this ID, if any
+        base_id: UUID of the PointSet this one is a new version of, to
+            update its triangulation instead of starting from scratch
+
+    Returns:
+        tuple: ``(pointset_bytes, points, triangles)``, the raw PointSet,
+        its decoded points and the triangles indexing them
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    # Fetch PointSet from manager
+    if pointset_bytes is None:
+        pointset_bytes = fetch_pointset(pointset_id)
+
+    if base_id is None:
+        points, triangles = triangulate_pointset(
+            pointset_bytes, triangulate_configured
+        )
+    else:
+        # Nouvelle version déclarée : mise à jour de la précédente
+        points, triangles = triangulate_pointset(
+            pointset_bytes,
+            lambda unique: triangulate_version(pointset_id, base_id, unique),
+        )
+    return pointset_bytes, points, triangles
+
+
+def triangulate_configured(points):
+    """Triangulate distinct points with the app's parallel settings.
+
+    Args:
+        points: PointSet of distinct points
+
+    Returns:
+        TrustedMesh: Triangles as (i, j, k) indices into ``points``
+
+    """
+    return triangulate(
+        points,
+        parallel_threshold=app.config["PARALLEL_THRESHOLD"],
+        workers=app.config["PARALLEL_WORKERS"],
+    )
+
+
+def compute_result(pointset_bytes, output, mimetype):
+    """Triangulate and serialize a PointSet, in a worker process.
+
+    The triangulation stays sequential: the worker already is one of
+    ``CPU_WORKERS`` processes, a strip pool of its own would oversubscribe
+    the cores.
+
+    Args:
+        pointset_bytes: PointSet in its binary format
+        output: One of ``OUTPUTS``
+        mimetype: One of ``TRIANGLE_MIMETYPES`` for the triangles output
+
+    Returns:
+        tuple: ``(etag, data)``, the serialized result and its entity tag
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid
+
+    """
+    points, triangles = triangulate_pointset(
+        pointset_bytes,
+        lambda unique: triangulate(unique, parallel_threshold=math.inf),
+    )
+    chunks, _ = serialize_result(output, mimetype, points, triangles)
+    data = b"".join(chunks)
+    return hashlib.blake2b(data, digest_size=16).hexdigest(), data
+
+
+def cpu_executor():
+    """Return the process pool running ``compute_result``."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # Pas de fork depuis un processus qui a des threads (serveur,
+            # boucle d'événements) : les processus partent d'un serveur neutre
+            _executor = ProcessPoolExecutor(
+                max_workers=app.config["CPU_WORKERS"],
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _executor
+
+
+def shutdown_executor():
+    """Stop the process pools (results and strips), if they were started."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(cancel_futures=True)
+    shutdown_pool()
+
+
+def content_key(pointset_bytes, output, mimetype):
+    """Return the key of a result in the cache by PointSet content."""
+    return (
+        hashlib.blake2b(pointset_bytes, digest_size=16).digest(),
+        output,
+        mimetype,
+    )
+
+
+def locator_for(pointset_id):
+    """Return the point-location index of a PointSet.
+
+    The index is built over the triangulation GET serves for this ID, read
+    back from the ID cache (or computed and cached as GET would), so the
+    triangle indices it returns match that payload. PointSets are
+    immutable: a kept index is used without calling the PointSetManager.
+
+    Args:
+        pointset_id: UUID of the PointSet
+
+    Returns:
+        PointLocator: Index over the triangles served for this PointSet
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    global _locators_points
+    with _locators_lock:
+        locator = _locators.get(pointset_id)
+        if locator is not None:
+            _locators.move_to_end(pointset_id)
+            return locator
+
+    key = (pointset_id, 'triangles', TRIANGLES_MIMETYPE)
+    cached = result_cache.get(key)
+    if cached is not None:
+        points, triangles = deserialize_triangles(cached[1])
+    else:
+        _, data, triangulation = flights.do(
+            key,
+            lambda: build_result(pointset_id, 'triangles', TRIANGLES_MIMETYPE),
+        )
+        if data is None:
+            # Trop gros pour le cache : triangulation transmise telle quelle
+            points, triangles = triangulation
+        else:
+            points, triangles = deserialize_triangles(data)
+    locator = PointLocator(points, triangles)
+
+    size = len(points)
+    max_points = app.config["LOCATORS_MAX_POINTS"]
+    if size <= max_points:
+        with _locators_lock:
+            previous = _locators.pop(pointset_id, None)
+            if previous is not None:
+                _locators_points -= len(previous.xs)
+            _locators[pointset_id] = locator
+            _locators_points += size
+            while _locators_points > max_points or (
+                len(_locators) > MAX_KEPT_TRIANGULATIONS
+            ):
+                _, evicted = _locators.popitem(last=False)
+                _locators_points -= len(evicted.xs)
+    return locator
+
+
+def error_payload(error, pointset_id):
+    """Describe an exception of the triangulation pipeline as a JSON error.
+
+    Args:
+        error: Exception raised while fetching or triangulating
+        pointset_id: UUID of the requested PointSet
+
+    Returns:
+        tuple: Error object (``code`` and ``message``) and HTTP status code
+
+    """
+    if isinstance(error, InsufficientPointsError):
+        return {
+            "code": "INSUFFICIENT_POINTS",
+            "message": str(error)
+        }, 400
+
+    if isinstance(error, PointSetTooLargeError):
+        return {
+            "code": "PAYLOAD_TOO_LARGE",
+            "message": str(error)
+        }, 413
+
+    if isinstance(error, ValueError):
+        # Erreurs de désérialisation
+        return {
+            "code": "INVALID_DATA",
+            "message": f"Invalid PointSet data: {str(error)}"
+        }, 400
+
+    if isinstance(error, PointSetManagerError):
+        # Erreurs de communication avec PointSetManager, selon le statut
+        # HTTP reçu (le message contient l'URL, donc l'ID)
+        if error.status == 404:
+            return {
+                "code": "NOT_FOUND",
+                "message": f"PointSet {pointset_id} not found"
+            }, 404
+
+        elif error.status in (None, 503):
+            return {
+                "code": "SERVICE_UNAVAILABLE",
+                "message": "PointSetManager service is unavailable"
+            }, 503
+
+        else:
+            return {
+                "code": "UPSTREAM_ERROR",
+                "message": f"Error communicating with PointSetManager: {str(error)}"
+            }, 502
+
+    # Erreur inattendue
+    return {
+        "code": "INTERNAL_ERROR",
+        "message": f"Internal server error: {str(error)}"
+    }, 500
+
+
+def error_response(error, pointset_id):
+    """Convert an exception of the triangulation pipeline to a JSON error.
+
+    Args:
+        error: Exception raised while fetching or triangulating
+        pointset_id: UUID of the requested PointSet
+
+    Returns:
+        tuple: JSON response and HTTP status code
+
+    """
+    payload, status = error_payload(error, pointset_id)
+    return jsonify(payload), status
+
 
 @app.route('/triangulation/<pointset_id>', methods=['GET'])
 def get_triangulation(pointset_id):
     """Calculate the triangulation of a PointSet given its ID.
+
+    The ``output`` query parameter selects the payload: ``triangles``
+    (default), ``strips`` for the same triangles as triangle strips, or
+    ``voronoi`` for the dual Voronoi diagram. The triangles
+    format is negotiated with ``Accept`` (see ``TRIANGLE_MIMETYPES``) and
+    the response is compressed when ``Accept-Encoding`` allows gzip or
+    deflate; without these headers, the standard format is sent as is.
+    A client publishing a new version of a PointSet can name the ID of
+    the previous one in ``base``: its triangulation is then updated
+    instead of recomputed.
     
     Args:
         pointset_id: UUID of the PointSet to triangulate
@@ -18,66 +463,426 @@ def get_triangulation(pointset_id):
         Binary response containing triangulated data, or JSON error
 
     """
+    output = request.args.get('output', 'triangles')
+    if output not in OUTPUTS:
+        return jsonify({
+            "code": "INVALID_PARAMETER",
+            "message": f"Unknown output {output!r}, expected one of {OUTPUTS}"
+        }), 400
+
+    mimetype = TRIANGLES_MIMETYPE
+    if output == 'triangles':
+        mimetype = request.accept_mimetypes.best_match(
+            TRIANGLE_MIMETYPES, default=TRIANGLES_MIMETYPE
+        )
+    encoding = request.accept_encodings.best_match(ENCODINGS)
+    base_id = request.args.get('base')
+
+    # Résultat déjà sérialisé : servi sans rappeler le PointSetManager.
+    # Sinon, les requêtes simultanées sur le même résultat attendent celle
+    # qui le calcule.
+    key = (pointset_id, output, mimetype)
+    cached = result_cache.get(key)
+    if cached is None:
+        try:
+            etag, data, triangulation = flights.do(
+                key, lambda: build_result(pointset_id, output, mimetype, base_id)
+            )
+            if data is None:
+                # Trop gros pour le cache : envoi en flux, sans ETag
+                chunks, length = serialize_result(
+                    output, mimetype, *triangulation
+                )
+                return binary_response(chunks, length, mimetype, encoding)
+        except Exception as e:
+            return error_response(e, pointset_id)
+        cached = (etag, data)
+    etag, data = cached
+
+    # Un ETag fort par représentation, donc par compression
+    if encoding is not None:
+        etag = f"{etag}-{encoding}"
+    headers = {
+        'ETag': quote_etag(etag),
+        'Cache-Control': f"public, max-age={app.config['RESULT_CACHE_MAX_AGE']}",
+    }
+    if request.if_none_match.contains_weak(etag):
+        headers['Vary'] = VARY
+        return Response(status=304, headers=headers)
+    if encoding is not None:
+        data = compressed_result(key, etag, data, encoding)
+        headers['Content-Encoding'] = encoding
+    return binary_response([data], len(data), mimetype, None, headers)
+
+
+def compressed_result(key, etag, data, encoding):
+    """Return a result of the ID cache compressed, compressing it only once.
+
+    The compressed payload is kept in the ID cache next to the raw one,
+    under ``(*key, encoding)``, so cache hits skip the compression.
+
+    Args:
+        key: ``(pointset_id, output, mimetype)`` of the raw result
+        etag: Entity tag of the compressed representation
+        data: Raw serialized result
+        encoding: One of ``ENCODINGS``
+
+    Returns:
+        bytes: The compressed payload
+
+    """
+    compressed_key = (*key, encoding)
+    cached = result_cache.get(compressed_key, count=False)
+    # L'ETag dérive des octets bruts : une entrée d'un autre résultat ne
+    # peut pas être servie
+    if cached is not None and cached[0] == etag:
+        return cached[1]
+    compressed = b"".join(iter_compress([data], encoding))
+    result_cache.put(compressed_key, etag, compressed)
+    return compressed
+
+
+def build_result(pointset_id, output, mimetype, base_id=None):
+    """Fetch, triangulate and serialize a result missing from the ID cache.
+
+    Args:
+        pointset_id: UUID of the PointSet
+        output: One of ``OUTPUTS``
+        mimetype: One of ``TRIANGLE_MIMETYPES`` for the triangles output
+        base_id: UUID of the PointSet this one is a new version of, if any
+
+    Returns:
+        tuple: ``(etag, data, triangulation)``. ``data`` is the serialized
+        result, now in the caches, and ``etag`` its entity tag. For a
+        result too large for the caches, both are None and
+        ``triangulation`` holds the ``(points, triangles)`` to serialize.
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    # Calcul identique terminé entre la consultation du cache et l'entrée
+    # dans le groupe d'appels
+    cached = result_cache.get((pointset_id, output, mimetype), count=False)
+    if cached is not None:
+        return *cached, None
+
+    pointset_bytes = fetch_pointset(pointset_id)
+
+    # Même géométrie sous un autre ID : résultat déjà calculé
+    key = content_key(pointset_bytes, output, mimetype)
+    cached = content_cache.get(key)
+    if cached is None:
+        _, points, triangles = compute_triangulation(
+            pointset_id, pointset_bytes, base_id
+        )
+        if triangles_size(len(points), len(triangles)) > result_cache.max_bytes:
+            return None, None, (points, triangles)
+        chunks, _ = serialize_result(output, mimetype, points, triangles)
+        data = b"".join(chunks)
+        etag = hashlib.blake2b(data, digest_size=16).hexdigest()
+        content_cache.put(key, etag, data)
+        cached = (etag, data)
+    result_cache.put((pointset_id, output, mimetype), *cached)
+    return *cached, None
+
+
+def serialize_result(output, mimetype, points, triangles):
+    """Serialize a triangulation in the requested output and format.
+
+    Args:
+        output: One of ``OUTPUTS``
+        mimetype: One of ``TRIANGLE_MIMETYPES`` for the triangles output
+        points: PointSet of the vertices
+        triangles: TriangleMesh indexing ``points``
+
+    Returns:
+        tuple: ``(chunks, length)``, an iterable of bytes and its total
+        size, None when it is only known once encoded
+
+    Raises:
+        ValueError: If triangle indices are invalid
+
+    """
+    if output == 'voronoi':
+        result_bytes = serialize_voronoi(*voronoi_dual(points, triangles))
+        return [result_bytes], len(result_bytes)
+    if output == 'strips':
+        result_bytes = serialize_triangle_strips(
+            points, triangle_strips(triangles)
+        )
+        return [result_bytes], len(result_bytes)
+    # Envoi en flux : seuls les morceaux en cours d'envoi sont encodés en
+    # mémoire
+    if mimetype == TRIANGLES_VARINT_MIMETYPE:
+        return iter_serialize_triangles_varint(points, triangles), None
+    byteorder = 'little' if mimetype == TRIANGLES_LE_MIMETYPE else 'big'
+    chunks = iter_serialize_triangles(points, triangles, byteorder=byteorder)
+    return chunks, triangles_size(len(points), len(triangles))
+
+
+def binary_response(chunks, length, mimetype, encoding, headers=None):
+    """Build a streamed binary response, compressed if an encoding is given.
+
+    Args:
+        chunks: Iterable of bytes
+        length: Total size of the chunks, or None if unknown
+        mimetype: Media type of the payload
+        encoding: One of ``ENCODINGS``, or None
+        headers: Other response headers
+
+    Returns:
+        Response: The response
+
+    """
+    headers = {**(headers or {}), 'Vary': VARY}
+    if encoding is not None:
+        chunks = iter_compress(chunks, encoding)
+        headers['Content-Encoding'] = encoding
+        length = None
+    if length is not None:
+        headers['Content-Length'] = str(length)
+    return Response(chunks, mimetype=mimetype, headers=headers)
+
+
+@app.route('/triangulation', methods=['POST'])
+def post_triangulation():
+    """Triangulate a PointSet sent in the request, without the PointSetManager.
+
+    The request body is a PointSet in its binary format, read as it
+    arrives and refused as soon as its header announces more than
+    ``UPLOAD_MAX_BYTES``. The result is negotiated and compressed as for
+    ``GET /triangulation/<pointset_id>``; it is not cached.
+
+    Returns:
+        Binary response containing triangulated data, or JSON error
+
+    """
+    mimetype = request.accept_mimetypes.best_match(
+        TRIANGLE_MIMETYPES, default=TRIANGLES_MIMETYPE
+    )
+    encoding = request.accept_encodings.best_match(ENCODINGS)
     try:
-        # Fetch PointSet from manager
-        pointset_bytes = fetch_pointset_from_manager(pointset_id, use_mock=True)
-        
-        # Deserialize to points
+        pointset_bytes = read_pointset(
+            request.stream, app.config["UPLOAD_MAX_BYTES"]
+        )
+        points, triangles = triangulate_pointset(
+            pointset_bytes, triangulate_configured
+        )
+    except Exception as e:
+        return error_response(e, None)
+
+    chunks, length = serialize_result('triangles', mimetype, points, triangles)
+    return binary_response(chunks, length, mimetype, encoding)
+
+
+@app.route('/triangulation/batch', methods=['POST'])
+def post_triangulation_batch():
+    """Triangulate a batch of PointSets given their IDs.
+
+    The request body is a JSON array of PointSet IDs. The PointSets are
+    fetched concurrently over the pooled connections to the
+    PointSetManager, then triangulated in a process pool; each result is
+    sent as soon as it is ready, so frames arrive in completion order, not
+    in request order.
+
+    Returns:
+        Binary stream in the Batch format (number of frames, then one frame
+        per ID: its index in the request, an HTTP status and a payload in
+        the Triangles format, or the JSON error of the GET endpoint), or
+        JSON error
+
+    """
+    pointset_ids = request.get_json(force=True, silent=True)
+    if not isinstance(pointset_ids, list) or not pointset_ids or not all(
+        isinstance(pointset_id, str) and pointset_id
+        for pointset_id in pointset_ids
+    ):
+        return jsonify({
+            "code": "INVALID_DATA",
+            "message": "Expected a non-empty JSON array of PointSet IDs"
+        }), 400
+
+    max_ids = app.config["BATCH_MAX_IDS"]
+    if len(pointset_ids) > max_ids:
+        return jsonify({
+            "code": "INVALID_PARAMETER",
+            "message": f"Too many PointSet IDs: {len(pointset_ids)}, "
+                       f"at most {max_ids} per batch"
+        }), 400
+
+    return Response(iter_batch(pointset_ids), mimetype=BATCH_MIMETYPE)
+
+
+def iter_batch(pointset_ids):
+    """Yield the Batch stream of a list of IDs, frames in completion order.
+
+    Args:
+        pointset_ids: UUIDs of the PointSets
+
+    Yields:
+        bytes: Number of frames (4 bytes), then one frame per ID
+
+    """
+    yield len(pointset_ids).to_bytes(4, byteorder='big')
+    pool = ThreadPoolExecutor(max_workers=app.config["BATCH_FETCH_WORKERS"])
+    try:
+        futures = {
+            pool.submit(batch_result, pointset_id): index
+            for index, pointset_id in enumerate(pointset_ids)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                payload, status = future.result(), 200
+            except Exception as e:
+                error, status = error_payload(e, pointset_ids[index])
+                payload = json.dumps(error).encode()
+            yield serialize_batch_frame(index, status, payload)
+    finally:
+        # Client parti avant la fin : les IDs pas encore commencés sont
+        # abandonnés, et ceux en cours finissent sans bloquer le serveur
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def batch_result(pointset_id):
+    """Return the standard Triangles payload of one PointSet of a batch.
+
+    Shares the caches and the calls in progress with the GET endpoint.
+
+    Args:
+        pointset_id: UUID of the PointSet
+
+    Returns:
+        bytes: Triangulation in the Triangles format
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    key = (pointset_id, 'triangles', TRIANGLES_MIMETYPE)
+    cached = result_cache.get(key)
+    if cached is not None:
+        return cached[1]
+    _, data, triangulation = flights.do(
+        key, lambda: build_batch_result(pointset_id)
+    )
+    if data is None:
+        # Résultat trop gros pour le cache, calculé par une requête GET
+        chunks, _ = serialize_result(
+            'triangles', TRIANGLES_MIMETYPE, *triangulation
+        )
+        data = b"".join(chunks)
+    return data
+
+
+def build_batch_result(pointset_id):
+    """Fetch a PointSet and triangulate it in the process pool.
+
+    Returns:
+        tuple: ``(etag, data, None)``, as ``build_result``; the result is
+        now in the caches if small enough
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    # Voir ``build_result``
+    cached = result_cache.get(
+        (pointset_id, 'triangles', TRIANGLES_MIMETYPE), count=False
+    )
+    if cached is not None:
+        return *cached, None
+
+    pointset_bytes = fetch_pointset(pointset_id)
+    key = content_key(pointset_bytes, 'triangles', TRIANGLES_MIMETYPE)
+    cached = content_cache.get(key)
+    if cached is None:
+        cached = cpu_executor().submit(
+            compute_result, pointset_bytes, 'triangles', TRIANGLES_MIMETYPE
+        ).result()
+        content_cache.put(key, *cached)
+    result_cache.put((pointset_id, 'triangles', TRIANGLES_MIMETYPE), *cached)
+    return *cached, None
+
+
+@app.route('/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Report the counters of the result caches, to size them.
+
+    Returns:
+        JSON object with the hits, misses, evictions, entries, bytes and
+        max_bytes of the cache by PointSet ID (``id``) and of the cache by
+        PointSet content (``content``, only looked up on ``id`` misses),
+        and the number of requests that waited for an identical one in
+        progress (``coalesced``)
+
+    """
+    return jsonify({
+        "id": result_cache.stats(),
+        "content": content_cache.stats(),
+        "coalesced": flights.coalesced,
+    })
+
+
+@app.route('/triangulation/<pointset_id>/hull', methods=['GET'])
+def get_hull(pointset_id):
+    """Calculate the convex hull of a PointSet given its ID.
+
+    Args:
+        pointset_id: UUID of the PointSet
+
+    Returns:
+        Binary response with the hull vertices in the PointSet format
+        (counterclockwise order), or JSON error
+
+    """
+    try:
+        pointset_bytes = fetch_pointset(pointset_id)
         points = deserialize_pointset(pointset_bytes)
-        
-        # Check if we have enough points
-        if len(points) < 3:
-            return jsonify({
-                "code": "INSUFFICIENT_POINTS",
-                "message": (
-                    f"Need at least 3 points for triangulation, "
-                    f"got {len(points)}"
-                )
-            }), 400
-        
-        # Triangulate
-        triangles = triangulate(points)
-        
-        # Serialize result
-        result_bytes = serialize_triangles(points, triangles)
-        
+        hull = convex_hull(points.xs, points.ys)
+        result_bytes = serialize_pointset(PointSet(points[i] for i in hull))
         return Response(result_bytes, mimetype='application/octet-stream')
-        
+
+    except Exception as e:
+        return error_response(e, pointset_id)
+
+
+@app.route('/triangulation/<pointset_id>/locate', methods=['POST'])
+def locate_points(pointset_id):
+    """Find the triangle containing each query point.
+
+    The request body is a batch of query points in the PointSet format.
+
+    Args:
+        pointset_id: UUID of the triangulated PointSet
+
+    Returns:
+        Binary response in the Locations format (one triangle index per
+        query point, as in the GET triangulation payload), or JSON error
+
+    """
+    try:
+        queries = deserialize_pointset(request.get_data())
     except ValueError as e:
-        # Erreurs de désérialisation
         return jsonify({
             "code": "INVALID_DATA",
-            "message": f"Invalid PointSet data: {str(e)}"
+            "message": f"Invalid query points: {str(e)}"
         }), 400
-        
-    except RuntimeError as e:
-        # Erreurs de communication avec PointSetManager
-        error_msg = str(e).lower()
-        
-        if "404" in error_msg or "not found" in error_msg:
-            return jsonify({
-                "code": "NOT_FOUND",
-                "message": f"PointSet {pointset_id} not found"
-            }), 404
-            
-        elif "503" in error_msg or "unavailable" in error_msg:
-            return jsonify({
-                "code": "SERVICE_UNAVAILABLE",
-                "message": "PointSetManager service is unavailable"
-            }), 503
-            
-        else:
-            return jsonify({
-                "code": "UPSTREAM_ERROR",
-                "message": f"Error communicating with PointSetManager: {str(e)}"
-            }), 502
-            
+
+    try:
+        locator = locator_for(pointset_id)
+        result_bytes = serialize_locations(locator.locate_many(queries))
+        return Response(result_bytes, mimetype='application/octet-stream')
+
     except Exception as e:
-        # Erreur inattendue
-        return jsonify({
-            "code": "INTERNAL_ERROR",
-            "message": f"Internal server error: {str(e)}"
-        }), 500
+        return error_response(e, pointset_id)
 
 
 @app.errorhandler(404)
@@ -0,0 +1,302 @@
+"""Application ASGI du service de triangulation.
+
+Même contrat que ``GET /triangulation/<pointset_id>`` dans ``app.py``
+(sorties, négociation du format et de la compression, cache, ETag et codes
+d'erreur), mais sur asyncio : la récupération du PointSet ne bloque pas la
+boucle d'événements, et la triangulation et la sérialisation tournent dans
+un pool de processus. La boucle reste libre d'accepter d'autres requêtes
+pendant les calculs.
+
+Lancement local, sans dépendance : ``python -m triangulator.asgi``. Tout
+serveur ASGI convient aussi (``uvicorn triangulator.asgi:app``).
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import weakref
+from urllib.parse import parse_qs
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header, parse_etags, quote_etag
+
+from .app import (
+    ENCODINGS,
+    OUTPUTS,
+    TRIANGLE_MIMETYPES,
+    TRIANGLES_MIMETYPE,
+    VARY,
+    compressed_result,
+    compute_result,
+    content_cache,
+    content_key,
+    cpu_executor,
+    error_payload,
+    result_cache,
+    shutdown_executor,
+)
+from .app import app as flask_app
+from .client import AsyncPointSetClient
+from .server import serve
+from .services import fetch_pointset_from_manager
+from .singleflight import AsyncSingleFlight
+
+# Calculs en cours, partagés par les requêtes simultanées
+flights = AsyncSingleFlight()
+
+# Clients du PointSetManager, un par boucle d'événements
+_clients = weakref.WeakKeyDictionary()
+
+
+async def fetch_pointset(pointset_id):
+    """Fetch a PointSet without blocking the event loop.
+
+    Args:
+        pointset_id: UUID of the PointSet
+
+    Returns:
+        bytes: PointSet in its binary format
+
+    Raises:
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    config = flask_app.config
+    if config["POINTSET_MANAGER_MOCK"]:
+        return fetch_pointset_from_manager(pointset_id, use_mock=True)
+
+    settings = (
+        config["POINTSET_MANAGER_URL"],
+        config["POINTSET_MANAGER_CONNECT_TIMEOUT"],
+        config["POINTSET_MANAGER_READ_TIMEOUT"],
+        config["POINTSET_MANAGER_RETRIES"],
+    )
+    loop = asyncio.get_running_loop()
+    cached = _clients.get(loop)
+    if cached is None or cached[0] != settings:
+        url, connect_timeout, read_timeout, retries = settings
+        client = AsyncPointSetClient(
+            url,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retries=retries,
+        )
+        _clients[loop] = cached = (settings, client)
+    return await cached[1].get_pointset(pointset_id)
+
+
+async def build_result(pointset_id, output, mimetype):
+    """Fetch, triangulate and serialize a result missing from the ID cache.
+
+    Args:
+        pointset_id: UUID of the PointSet
+        output: One of ``OUTPUTS``
+        mimetype: One of ``TRIANGLE_MIMETYPES`` for the triangles output
+
+    Returns:
+        tuple: ``(etag, data)``, now in the caches if small enough
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid
+        PointSetManagerError: If the PointSetManager could not be reached
+
+    """
+    # Calcul identique terminé entre la consultation du cache et l'entrée
+    # dans le groupe d'appels
+    cached = result_cache.get((pointset_id, output, mimetype), count=False)
+    if cached is not None:
+        return cached
+
+    pointset_bytes = await fetch_pointset(pointset_id)
+
+    # Même géométrie sous un autre ID : résultat déjà calculé
+    key = content_key(pointset_bytes, output, mimetype)
+    cached = content_cache.get(key)
+    if cached is None:
+        cached = await asyncio.get_running_loop().run_in_executor(
+            cpu_executor(), compute_result, pointset_bytes, output, mimetype
+        )
+        content_cache.put(key, *cached)
+    result_cache.put((pointset_id, output, mimetype), *cached)
+    return cached
+
+
+async def _send(send, status, headers, body=b""):
+    """Send a complete response."""
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in headers.items()
+    ]
+    if status != 304:
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    await send({"type": "http.response.start", "status": status,
+                "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send, payload, status):
+    """Send a JSON response, as ``jsonify`` in the Flask application."""
+    body = json.dumps(payload).encode() + b"\n"
+    await _send(send, status, {"Content-Type": "application/json"}, body)
+
+
+async def get_triangulation(pointset_id, query, headers, send):
+    """Serve the triangulation of a PointSet (see ``app.get_triangulation``).
+
+    Args:
+        pointset_id: UUID of the PointSet to triangulate
+        query: Parsed query string
+        headers: Request headers, by lower-case name
+        send: ASGI send callable
+
+    """
+    output = query.get('output', ['triangles'])[0]
+    if output not in OUTPUTS:
+        await _send_json(send, {
+            "code": "INVALID_PARAMETER",
+            "message": f"Unknown output {output!r}, expected one of {OUTPUTS}"
+        }, 400)
+        return
+
+    mimetype = TRIANGLES_MIMETYPE
+    if output == 'triangles':
+        mimetype = parse_accept_header(
+            headers.get('accept'), MIMEAccept
+        ).best_match(TRIANGLE_MIMETYPES, default=TRIANGLES_MIMETYPE)
+    encoding = parse_accept_header(
+        headers.get('accept-encoding')
+    ).best_match(ENCODINGS)
+
+    key = (pointset_id, output, mimetype)
+    cached = result_cache.get(key)
+    if cached is None:
+        try:
+            cached = await flights.do(
+                key, lambda: build_result(pointset_id, output, mimetype)
+            )
+        except Exception as e:
+            await _send_json(send, *error_payload(e, pointset_id))
+            return
+    etag, data = cached
+
+    # Un ETag fort par représentation, donc par compression
+    if encoding is not None:
+        etag = f"{etag}-{encoding}"
+    response_headers = {
+        'ETag': quote_etag(etag),
+        'Cache-Control': f"public, max-age={flask_app.config['RESULT_CACHE_MAX_AGE']}",
+        'Vary': VARY,
+    }
+    if parse_etags(headers.get('if-none-match')).contains_weak(etag):
+        await _send(send, 304, response_headers)
+        return
+
+    response_headers['Content-Type'] = mimetype
+    if encoding is not None:
+        data = await asyncio.to_thread(
+            compressed_result, key, etag, data, encoding
+        )
+        response_headers['Content-Encoding'] = encoding
+    await _send(send, 200, response_headers, data)
+
+
+async def get_cache_stats(send):
+    """Report the cache counters (see ``app.get_cache_stats``)."""
+    await _send_json(send, {
+        "id": result_cache.stats(),
+        "content": content_cache.stats(),
+        "coalesced": flights.coalesced,
+    }, 200)
+
+
+def shutdown():
+    """Stop the process pool and close the idle upstream connections."""
+    shutdown_executor()
+    for _, client in list(_clients.values()):
+        client.close()
+    _clients.clear()
+
+
+async def _lifespan(receive, send):
+    """Handle the ASGI lifespan protocol."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            shutdown()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI entry point.
+
+    Args:
+        scope: ASGI connection scope
+        receive: ASGI receive callable
+        send: ASGI send callable
+
+    """
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    path = scope["path"]
+    pointset_id = path.removeprefix("/triangulation/")
+    if path != "/cache/stats" and (
+        pointset_id == path or not pointset_id or "/" in pointset_id
+    ):
+        await _send_json(send, {
+            "code": "NOT_FOUND",
+            "message": "The requested resource was not found"
+        }, 404)
+        return
+    if scope["method"] != "GET":
+        await _send_json(send, {
+            "code": "METHOD_NOT_ALLOWED",
+            "message": "The HTTP method is not allowed for this endpoint"
+        }, 405)
+        return
+
+    if path == "/cache/stats":
+        await get_cache_stats(send)
+        return
+    headers = {
+        name.decode("latin-1"): value.decode("latin-1")
+        for name, value in scope["headers"]
+    }
+    query = parse_qs(scope["query_string"].decode("latin-1"))
+    await get_triangulation(pointset_id, query, headers, send)
+
+
+def main(argv=None):
+    """Serve the ASGI application with the built-in server.
+
+    Args:
+        argv: Command line arguments (default: ``sys.argv[1:]``)
+
+    Returns:
+        int: Exit status
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m triangulator.asgi",
+        description="Serve the triangulation API with asyncio.",
+    )
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="interface to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000,
+                        help="TCP port (default: 8000)")
+    args = parser.parse_args(argv)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(app, args.host, args.port))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Module du cache des résultats sérialisés.
+
+Un PointSet ne change plus une fois son ID attribué par le PointSetManager :
+le résultat sérialisé d'une triangulation peut être resservi tel quel, sans
+nouvel appel au PointSetManager. Le cache est borné en octets et évince les
+entrées les moins récemment utilisées.
+"""
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Thread-safe LRU cache of byte payloads, bounded by their total size.
+
+    Attributes:
+        max_bytes: Budget for the total size of the cached payloads
+        hits: Number of lookups that found an entry
+        misses: Number of lookups that did not
+        evictions: Number of entries removed to respect the budget
+
+    """
+
+    def __init__(self, max_bytes):
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Budget for the total size of the cached payloads (0
+                disables the cache)
+
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key, count=True):
+        """Return the ``(etag, data)`` entry of a key, or None.
+
+        Args:
+            key: Hashable key of the entry
+            count: Update the hit and miss counters (False for a second
+                lookup of the same request)
+
+        Returns:
+            tuple | None: The entry, marked as the most recently used
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += count
+                return None
+            self.hits += count
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, etag, data):
+        """Store a payload, evicting the least recently used ones if needed.
+
+        Payloads larger than the whole budget are not stored.
+
+        Args:
+            key: Hashable key of the entry
+            etag: Entity tag of the payload
+            data: Payload bytes
+
+        Returns:
+            bool: True if the payload was stored
+
+        """
+        if len(data) > self.max_bytes:
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+            self._entries[key] = (etag, data)
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+        return True
+
+    def clear(self):
+        """Remove every entry; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self):
+        """Return the counters and the current occupation of the cache.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``evictions``, ``entries``,
+            ``bytes`` and ``max_bytes``
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,88 @@
+"""Module de nettoyage des PointSets avant triangulation.
+
+Les doublons exacts sont éliminés directement sur les enregistrements
+binaires de 8 octets (X et Y en float32), sans décodage en flottants, et
+les entrées entièrement alignées sont détectées avant d'appeler le moteur.
+"""
+import sys
+from array import array
+
+from .mesh import PointSet, TriangleMesh
+from .predicates import orient2d
+
+# Masques des moitiés X et Y d'un enregistrement lu comme entier 64 bits
+# natif, et motif de -0.0 (même point que 0.0) dans chacune
+_X_MASK = int.from_bytes(b"\xff" * 4 + bytes(4), sys.byteorder)
+_Y_MASK = int.from_bytes(bytes(4) + b"\xff" * 4, sys.byteorder)
+_X_NEG_ZERO = int.from_bytes(b"\x80" + bytes(7), sys.byteorder)
+_Y_NEG_ZERO = int.from_bytes(bytes(4) + b"\x80" + bytes(3), sys.byteorder)
+
+
+def dedupe_pointset(data):
+    """Keep the first occurrence of every distinct point of a binary PointSet.
+
+    Points are compared on their raw 8-byte records, read as 64-bit
+    integers, so the comparison costs a single hash per point.
+
+    Args:
+        data: Binary data in the PointSet format, already validated by
+            ``deserialize_pointset``
+
+    Returns:
+        tuple: ``(points, original)`` where ``points`` is the PointSet of
+        the distinct points and ``original[k]`` the index of the k-th one
+        in ``data``
+
+    """
+    num_points = int.from_bytes(data[:4], byteorder='big')
+    with memoryview(data) as view:
+        records = view[4:4 + 8 * num_points].cast('Q')
+        first = {}
+        for i, key in enumerate(records):
+            if key & _X_MASK == _X_NEG_ZERO:
+                key &= ~_X_MASK
+            if key & _Y_MASK == _Y_NEG_ZERO:
+                key &= ~_Y_MASK
+            first.setdefault(key, i)
+        records.release()
+
+    original = array('I', first.values())
+    coords = array('f')
+    coords.frombytes(array('Q', first).tobytes())
+    if sys.byteorder == 'little':
+        coords.byteswap()
+    return PointSet.from_coords(coords), original
+
+
+def is_collinear(points):
+    """Tell whether all the points lie on a single line.
+
+    Args:
+        points: Sequence of distinct (x, y) points
+
+    Returns:
+        bool: True if no triangle can be formed (fewer than three points
+        or all of them aligned)
+
+    """
+    if len(points) < 3:
+        return True
+    ax, ay = points[0]
+    bx, by = points[1]
+    return all(orient2d(ax, ay, bx, by, x, y) == 0 for x, y in points)
+
+
+def remap_triangles(triangles, original):
+    """Translate triangles on the distinct points back to the input indices.
+
+    Args:
+        triangles: TriangleMesh indexing the deduplicated points
+        original: Index in the input of each deduplicated point
+
+    Returns:
+        TriangleMesh: The same triangles indexing the input points
+
+    """
+    return TriangleMesh.from_flat(
+        array('I', [original[v] for v in triangles.indices])
+    )
@@ -0,0 +1,200 @@
+"""Interface en ligne de commande pour trianguler des fichiers PointSet.
+
+Usage : ``python -m triangulator [options] CHEMIN...``
+
+Chaque fichier PointSet (format binaire du PointSetManager) est projeté en
+mémoire, triangulé dans un pool de processus, et le résultat est écrit au
+format Triangles à côté du fichier d'origine.
+"""
+import argparse
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .parallel import PARALLEL_THRESHOLD
+from .services import ALGORITHMS, triangulate, triangulate_pointset
+from .utils import mapped_file, write_triangles
+
+POINTSET_PATTERN = "*.pointset"
+TRIANGLES_SUFFIX = ".triangles"
+
+
+def output_path(path):
+    """Return the path of the Triangles file written for a PointSet file."""
+    return path.with_suffix(TRIANGLES_SUFFIX)
+
+
+def collect_files(paths, pattern=POINTSET_PATTERN):
+    """List the PointSet files to process.
+
+    Args:
+        paths: Files, or directories searched recursively for ``pattern``
+        pattern: Glob pattern of the PointSet files in directories
+
+    Returns:
+        list: Paths of the files, in a stable order
+
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob(pattern)))
+        else:
+            files.append(path)
+    return files
+
+
+def triangulate_file(path, algorithm="delaunay", parallel_threshold=math.inf,
+                     workers=None):
+    """Triangulate one PointSet file and write its Triangles file.
+
+    The file is written under a temporary name then renamed, so an
+    interrupted run never leaves a truncated result behind.
+
+    Args:
+        path: Path of the PointSet file
+        algorithm: Triangulation algorithm (see ``triangulate``)
+        parallel_threshold: From this number of points, the triangulation
+            is split over a process pool (default: never, the files are
+            already spread over the processes)
+        workers: Number of processes of that pool
+
+    Returns:
+        tuple: ``(num_points, num_triangles, num_bytes)`` of the result
+
+    Raises:
+        ValueError: If the PointSet data is invalid or too small
+        OSError: If a file cannot be read or written
+
+    """
+    with mapped_file(path) as data:
+        points, triangles = triangulate_pointset(
+            data,
+            lambda unique: triangulate(
+                unique, algorithm, parallel_threshold, workers
+            ),
+        )
+
+    target = output_path(path)
+    partial = target.with_name(target.name + ".part")
+    try:
+        with open(partial, 'wb') as f:
+            size = write_triangles(f, points, triangles)
+        os.replace(partial, target)
+    finally:
+        if partial.exists():
+            partial.unlink()
+    return len(points), len(triangles), size
+
+
+def _run(files, workers, algorithm):
+    """Yield ``(path, result, error)`` for every file as it completes."""
+    if workers == 1 or len(files) == 1:
+        # Un seul fichier : ce sont ses bandes qui se partagent les
+        # processus, au-delà du seuil du mode parallèle
+        for path in files:
+            try:
+                result = triangulate_file(
+                    path, algorithm, PARALLEL_THRESHOLD, workers
+                )
+                yield path, result, None
+            except (ValueError, OSError) as e:
+                yield path, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(triangulate_file, path, algorithm): path
+            for path in files
+        }
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except (ValueError, OSError) as e:
+                yield futures[future], None, e
+
+
+def main(argv=None):
+    """Run the command line interface.
+
+    Args:
+        argv: Command line arguments (default: ``sys.argv[1:]``)
+
+    Returns:
+        int: Exit status, 0 if every file was triangulated, 1 otherwise
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m triangulator",
+        description=(
+            "Triangulate PointSet files and write a Triangles file "
+            f"({TRIANGLES_SUFFIX}) next to each of them."
+        ),
+    )
+    parser.add_argument(
+        "paths", nargs="+",
+        help=f"PointSet files, or directories searched for {POINTSET_PATTERN}",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=os.cpu_count() or 1,
+        help="number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "-a", "--algorithm", choices=ALGORITHMS, default="delaunay",
+        help="triangulation algorithm (default: delaunay)",
+    )
+    parser.add_argument(
+        "--pattern", default=POINTSET_PATTERN,
+        help=f"glob pattern used in directories (default: {POINTSET_PATTERN})",
+    )
+    parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="overwrite existing Triangles files instead of skipping them",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="only report errors and the final summary",
+    )
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    files = collect_files(args.paths, args.pattern)
+    if not args.force:
+        files = [path for path in files if not output_path(path).exists()]
+
+    total = len(files)
+    done = failed = points = triangles = written = 0
+    start = time.perf_counter()
+    for path, result, error in _run(files, args.workers, args.algorithm):
+        done += 1
+        elapsed = time.perf_counter() - start
+        if error is not None:
+            failed += 1
+            print(f"[{done}/{total}] {path}: error: {error}", file=sys.stderr)
+            continue
+        num_points, num_triangles, size = result
+        points += num_points
+        triangles += num_triangles
+        written += size
+        if not args.quiet:
+            print(
+                f"[{done}/{total}] {path}: {num_points} points, "
+                f"{num_triangles} triangles "
+                f"({points / max(elapsed, 1e-9):,.0f} points/s)",
+                file=sys.stderr,
+            )
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"{done - failed} file(s) triangulated, {failed} failed in "
+        f"{elapsed:.2f}s: {points} points, {triangles} triangles, "
+        f"{written / 1e6:.1f} MB written "
+        f"({points / max(elapsed, 1e-9):,.0f} points/s, "
+        f"{(done - failed) / max(elapsed, 1e-9):.1f} files/s)",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
@@ -0,0 +1,360 @@
+"""Client HTTP du PointSetManager.
+
+Les connexions sont gardées ouvertes (keep-alive) dans un petit pool et
+réutilisées d'une requête à l'autre : chaque récupération de PointSet ne
+paie plus l'ouverture d'une connexion TCP. Les délais de connexion et de
+lecture sont bornés, et les erreurs de connexion et réponses 5xx sont
+retentées un nombre limité de fois, avec un délai aléatoire croissant.
+"""
+import asyncio
+import http.client
+import os
+import random
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+# Adresse du PointSetManager par défaut (nom du service dans le réseau)
+MANAGER_URL = "http://pointset-manager:5000"
+
+
+class PointSetManagerError(RuntimeError):
+    """Raised when the PointSetManager answers with an error or is unreachable.
+
+    Attributes:
+        status: HTTP status code of the answer, or None if no answer was
+            received (connection error, timeout...)
+
+    """
+
+    def __init__(self, message, status=None):
+        """Describe the failure.
+
+        Args:
+            message: Error message
+            status: HTTP status code of the answer, if any
+
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class PointSetClient:
+    """Pooled, persistent-connection client of the PointSetManager.
+
+    Safe to share between threads; a client must not be shared between
+    processes (see ``manager_client``).
+    """
+
+    def __init__(self, base_url=MANAGER_URL, connect_timeout=2.0,
+                 read_timeout=10.0, retries=2, backoff=0.1, pool_size=8):
+        """Configure the client; connections are opened on first use.
+
+        Args:
+            base_url: URL of the PointSetManager (``http`` or ``https``,
+                with an optional path prefix)
+            connect_timeout: Seconds allowed to open a connection
+            read_timeout: Seconds allowed for each read of the response
+            retries: Number of new attempts after a connection error or a
+                5xx response
+            backoff: Base delay in seconds before a new attempt; attempt
+                ``n`` waits a random delay up to ``backoff * 2 ** n``
+            pool_size: Number of idle connections kept open
+
+        Raises:
+            ValueError: If the URL scheme is not supported
+
+        """
+        url = urlsplit(base_url)
+        if url.scheme == "http":
+            self._connection_class = http.client.HTTPConnection
+        elif url.scheme == "https":
+            self._connection_class = http.client.HTTPSConnection
+        else:
+            raise ValueError(f"Unsupported PointSetManager URL {base_url!r}")
+        self.base_url = base_url.rstrip("/")
+        self._host = url.netloc
+        self._prefix = url.path.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def get_pointset(self, pointset_id):
+        """Fetch the binary PointSet of an ID.
+
+        Args:
+            pointset_id: UUID of the PointSet
+
+        Returns:
+            bytes: PointSet in its binary format
+
+        Raises:
+            PointSetManagerError: If the PointSetManager answers with an
+                error or cannot be reached after the retries
+
+        """
+        resource = f"/pointset/{quote(pointset_id, safe='')}"
+        path = self._prefix + resource
+        url = self.base_url + resource
+        attempt = 0
+        while True:
+            try:
+                status, body = self._request("GET", path)
+            except (OSError, http.client.HTTPException) as e:
+                if attempt >= self.retries:
+                    raise PointSetManagerError(f"URL error for {url}: {e}") from e
+            else:
+                if status == 200:
+                    return body
+                if status < 500 or attempt >= self.retries:
+                    raise PointSetManagerError(
+                        f"HTTP error {status} for {url}", status
+                    )
+            # Délai aléatoire (« full jitter ») : les workers qui ont échoué
+            # ensemble ne reviennent pas tous au même instant
+            time.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+            attempt += 1
+
+    def _request(self, method, path):
+        """Send a request on a pooled connection and read the whole body."""
+        connection, reused = self._acquire()
+        try:
+            try:
+                connection.request(method, path)
+                response = connection.getresponse()
+            except (ConnectionError, http.client.BadStatusLine):
+                if not reused:
+                    raise
+                # Connexion inactive fermée par le serveur entre-temps :
+                # une seule nouvelle tentative, sur une connexion neuve
+                connection.close()
+                connection, reused = self._connect(), False
+                connection.request(method, path)
+                response = connection.getresponse()
+            body = response.read()
+        except BaseException:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(connection)
+        return response.status, body
+
+    def _acquire(self):
+        """Return ``(connection, reused)``, an idle connection if any."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        return self._connect(), False
+
+    def _connect(self):
+        """Open a connection with the connect timeout, then the read one."""
+        connection = self._connection_class(
+            self._host, timeout=self.connect_timeout
+        )
+        try:
+            connection.connect()
+            connection.sock.settimeout(self.read_timeout)
+        except BaseException:
+            connection.close()
+            raise
+        return connection
+
+    def _release(self, connection):
+        """Put a connection back in the pool, or close it if it is full."""
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self):
+        """Close the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class AsyncPointSetClient:
+    """Asyncio version of ``PointSetClient``, for the ASGI application.
+
+    Requests never block the event loop. A client is bound to the event
+    loop that first uses it.
+    """
+
+    def __init__(self, base_url=MANAGER_URL, connect_timeout=2.0,
+                 read_timeout=10.0, retries=2, backoff=0.1, pool_size=8):
+        """Configure the client; see ``PointSetClient`` for the arguments.
+
+        ``read_timeout`` bounds the reading of each whole response.
+
+        Raises:
+            ValueError: If the URL scheme is not supported
+
+        """
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported PointSetManager URL {base_url!r}")
+        self.base_url = base_url.rstrip("/")
+        self._ssl = url.scheme == "https"
+        self._hostname = url.hostname
+        self._port = url.port or (443 if self._ssl else 80)
+        self._host = url.netloc
+        self._prefix = url.path.rstrip("/")
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self._idle = []
+
+    async def get_pointset(self, pointset_id):
+        """Fetch the binary PointSet of an ID.
+
+        Args:
+            pointset_id: UUID of the PointSet
+
+        Returns:
+            bytes: PointSet in its binary format
+
+        Raises:
+            PointSetManagerError: If the PointSetManager answers with an
+                error or cannot be reached after the retries
+
+        """
+        resource = f"/pointset/{quote(pointset_id, safe='')}"
+        path = self._prefix + resource
+        url = self.base_url + resource
+        attempt = 0
+        while True:
+            try:
+                status, body = await self._request(path)
+            except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+                if attempt >= self.retries:
+                    message = str(e) or type(e).__name__
+                    raise PointSetManagerError(
+                        f"URL error for {url}: {message}"
+                    ) from e
+            else:
+                if status == 200:
+                    return body
+                if status < 500 or attempt >= self.retries:
+                    raise PointSetManagerError(
+                        f"HTTP error {status} for {url}", status
+                    )
+            await asyncio.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+            attempt += 1
+
+    async def _request(self, path):
+        """Send a GET on a pooled connection and read the whole response."""
+        reused = bool(self._idle)
+        reader, writer = self._idle.pop() if reused else await self._connect()
+        try:
+            try:
+                status, body, keep_alive = await self._exchange(
+                    reader, writer, path
+                )
+            except (ConnectionError, asyncio.IncompleteReadError):
+                if not reused:
+                    raise
+                # Connexion inactive fermée par le serveur entre-temps
+                writer.close()
+                reader, writer = await self._connect()
+                status, body, keep_alive = await self._exchange(
+                    reader, writer, path
+                )
+        except BaseException:
+            writer.close()
+            raise
+        if keep_alive and len(self._idle) < self.pool_size:
+            self._idle.append((reader, writer))
+        else:
+            writer.close()
+        return status, body
+
+    async def _connect(self):
+        """Open a connection within the connect timeout."""
+        return await asyncio.wait_for(
+            asyncio.open_connection(self._hostname, self._port, ssl=self._ssl),
+            self.connect_timeout,
+        )
+
+    async def _exchange(self, reader, writer, path):
+        """Write the request and read ``(status, body, keep_alive)``."""
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {self._host}\r\n"
+            "Accept: application/octet-stream\r\n\r\n".encode("latin-1")
+        )
+        await writer.drain()
+        return await asyncio.wait_for(_read_response(reader), self.read_timeout)
+
+    def close(self):
+        """Close the idle connections."""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+
+
+async def _read_response(reader):
+    """Read an HTTP/1.1 response: ``(status, body, keep_alive)``.
+
+    Raises:
+        ValueError: If the response is malformed
+
+    """
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Connection closed by the server")
+    version, status, *_ = status_line.decode("latin-1").split()
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    keep_alive = (
+        version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    )
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        body = bytearray()
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            body += await reader.readexactly(size)
+            await reader.readexactly(2)
+        while await reader.readline() not in (b"\r\n", b"\n", b""):
+            pass
+        return int(status), bytes(body), keep_alive
+    if "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+        return int(status), body, keep_alive
+    # Ni longueur ni morceaux : le corps va jusqu'à la fermeture
+    return int(status), await reader.read(), False
+
+
+# Un pool par processus : des connexions héritées d'un fork seraient
+# partagées avec le processus parent
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def manager_client(base_url=MANAGER_URL, **options):
+    """Return the client of this process for a PointSetManager URL.
+
+    Args:
+        base_url: URL of the PointSetManager
+        **options: Other ``PointSetClient`` arguments (timeouts, retries...)
+
+    Returns:
+        PointSetClient: The same client for the same settings in a process
+
+    """
+    key = (os.getpid(), base_url, tuple(sorted(options.items())))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = PointSetClient(base_url, **options)
+        return client
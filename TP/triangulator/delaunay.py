@@ -0,0 +1,344 @@
+"""Module de triangulation de Delaunay par enveloppe balayée (sweep-hull)."""
+import math
+from array import array
+from itertools import chain
+
+from .mesh import TriangleMesh
+from .predicates import incircle, orient2d
+
+
+def _circumradius(ax, ay, bx, by, cx, cy):
+    """Return the squared circumradius of (a, b, c), or inf if collinear."""
+    dx = bx - ax
+    dy = by - ay
+    ex = cx - ax
+    ey = cy - ay
+    denom = dx * ey - dy * ex
+    if denom == 0:
+        return math.inf
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = 0.5 / denom
+    x = (ey * bl - dy * cl) * d
+    y = (dx * cl - ex * bl) * d
+    return x * x + y * y
+
+
+def _circumcenter(ax, ay, bx, by, cx, cy):
+    """Return the circumcenter of the non-degenerate triangle (a, b, c)."""
+    dx = bx - ax
+    dy = by - ay
+    ex = cx - ax
+    ey = cy - ay
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = 0.5 / (dx * ey - dy * ex)
+    return ax + (ey * bl - dy * cl) * d, ay + (dx * cl - ex * bl) * d
+
+
+def _pseudo_angle(dx, dy):
+    """Monotonic approximation of atan2 mapped to [0, 1)."""
+    p = dx / (abs(dx) + abs(dy))
+    return (3 - p if dy > 0 else 1 + p) / 4
+
+
+def sweep_hull(xs, ys):
+    """Compute the Delaunay triangulation of a set of 2D points.
+
+    Points are inserted in order of distance from a seed triangle while a
+    convex hull is maintained and the new edges are legalized by flips,
+    which gives an O(n log n) construction (the cost is dominated by the
+    initial sort).
+
+    Args:
+        xs: Sequence of X coordinates
+        ys: Sequence of Y coordinates, same length as ``xs``
+
+    Returns:
+        tuple: ``(triangles, halfedges, hull)`` where ``triangles`` is a flat
+        list of vertex indices (three per counterclockwise triangle),
+        ``halfedges[e]`` is the index of the opposite half-edge of ``e``
+        (or -1 on the hull) and ``hull`` lists the hull vertices in
+        counterclockwise order. ``triangles`` is empty when all points are
+        collinear; ``hull`` then lists the distinct points along the line.
+
+    """
+    n = len(xs)
+    if n == 0:
+        return [], [], []
+
+    min_x = min(xs)
+    max_x = max(xs)
+    min_y = min(ys)
+    max_y = max(ys)
+    cx = (min_x + max_x) / 2
+    cy = (min_y + max_y) / 2
+
+    # Graine : le point le plus proche du centre de la boîte englobante
+    i0 = min(
+        range(n), key=lambda i: (xs[i] - cx) ** 2 + (ys[i] - cy) ** 2
+    )
+    i0x = xs[i0]
+    i0y = ys[i0]
+
+    # Le point le plus proche de la graine (distance non nulle)
+    i1 = -1
+    min_dist = math.inf
+    for i in range(n):
+        if i == i0:
+            continue
+        d = (xs[i] - i0x) ** 2 + (ys[i] - i0y) ** 2
+        if 0 < d < min_dist:
+            i1 = i
+            min_dist = d
+
+    # Le troisième point qui forme le plus petit cercle circonscrit
+    i2 = -1
+    min_radius = math.inf
+    if i1 != -1:
+        i1x = xs[i1]
+        i1y = ys[i1]
+        for i in range(n):
+            if i in (i0, i1):
+                continue
+            r = _circumradius(i0x, i0y, i1x, i1y, xs[i], ys[i])
+            if r < min_radius:
+                i2 = i
+                min_radius = r
+
+    if min_radius == math.inf:
+        # Tous les points sont alignés : pas de triangle, l'enveloppe est
+        # la liste des points distincts ordonnés le long de la droite
+        x0 = xs[0]
+        y0 = ys[0]
+        dists = [(xs[i] - x0) or (ys[i] - y0) for i in range(n)]
+        hull = []
+        last = -math.inf
+        for i in sorted(range(n), key=dists.__getitem__):
+            if dists[i] > last:
+                hull.append(i)
+                last = dists[i]
+        return [], [], hull
+
+    i1x = xs[i1]
+    i1y = ys[i1]
+    i2x = xs[i2]
+    i2y = ys[i2]
+    if orient2d(i0x, i0y, i1x, i1y, i2x, i2y) < 0:
+        i1, i2 = i2, i1
+        i1x, i1y, i2x, i2y = i2x, i2y, i1x, i1y
+
+    ccx, ccy = _circumcenter(i0x, i0y, i1x, i1y, i2x, i2y)
+    dists = [(xs[i] - ccx) ** 2 + (ys[i] - ccy) ** 2 for i in range(n)]
+    ids = sorted(range(n), key=dists.__getitem__)
+
+    hash_size = max(1, math.ceil(math.sqrt(n)))
+
+    def hash_key(x, y):
+        dx = x - ccx
+        dy = y - ccy
+        if dx == 0 and dy == 0:
+            return 0
+        return math.floor(_pseudo_angle(dx, dy) * hash_size) % hash_size
+
+    triangles = []
+    halfedges = []
+    hull_prev = [0] * n
+    hull_next = [0] * n
+    hull_tri = [0] * n
+    hull_hash = [-1] * hash_size
+
+    def link(a, b):
+        halfedges[a] = b
+        if b != -1:
+            halfedges[b] = a
+
+    def add_triangle(v0, v1, v2, a, b, c):
+        t = len(triangles)
+        triangles.extend((v0, v1, v2))
+        halfedges.extend((-1, -1, -1))
+        link(t, a)
+        link(t + 1, b)
+        link(t + 2, c)
+        return t
+
+    hull_start = i0
+    edge_stack = []
+
+    def legalize(a):
+        # Basculement des arêtes illégales, récursion remplacée par une pile
+        #
+        #           pl                    pl
+        #          /||\                  /  \
+        #       al/ || \bl            al/    \a
+        #        /  ||  \              /      \
+        #       /  a||b  \    flip    /___ar___\
+        #     p0\   ||   /p1   =>   p0\---bl---/p1
+        #        \  ||  /              \      /
+        #       ar\ || /br             b\    /br
+        #          \||/                  \  /
+        #           pr                    pr
+        while True:
+            b = halfedges[a]
+            a0 = a - a % 3
+            ar = a0 + (a + 2) % 3
+            if b == -1:
+                if not edge_stack:
+                    break
+                a = edge_stack.pop()
+                continue
+            b0 = b - b % 3
+            al = a0 + (a + 1) % 3
+            bl = b0 + (b + 2) % 3
+            p0 = triangles[ar]
+            pr = triangles[a]
+            pl = triangles[al]
+            p1 = triangles[bl]
+            if incircle(
+                xs[p0], ys[p0], xs[pr], ys[pr], xs[pl], ys[pl], xs[p1], ys[p1]
+            ) > 0:
+                triangles[a] = p1
+                triangles[b] = p0
+                hbl = halfedges[bl]
+                if hbl == -1:
+                    # Arête basculée de l'autre côté de l'enveloppe (rare)
+                    e = hull_start
+                    while True:
+                        if hull_tri[e] == bl:
+                            hull_tri[e] = a
+                            break
+                        e = hull_prev[e]
+                        if e == hull_start:
+                            break
+                link(a, hbl)
+                link(b, halfedges[ar])
+                link(ar, bl)
+                edge_stack.append(b0 + (b + 1) % 3)
+            else:
+                if not edge_stack:
+                    break
+                a = edge_stack.pop()
+        return ar
+
+    hull_size = 3
+    hull_next[i0] = hull_prev[i2] = i1
+    hull_next[i1] = hull_prev[i0] = i2
+    hull_next[i2] = hull_prev[i1] = i0
+    hull_tri[i0] = 0
+    hull_tri[i1] = 1
+    hull_tri[i2] = 2
+    hull_hash[hash_key(i0x, i0y)] = i0
+    hull_hash[hash_key(i1x, i1y)] = i1
+    hull_hash[hash_key(i2x, i2y)] = i2
+    add_triangle(i0, i1, i2, -1, -1, -1)
+
+    xp = yp = None
+    for k, i in enumerate(ids):
+        x = xs[i]
+        y = ys[i]
+
+        # Répétitions exactes ignorées ; des points distincts, même très
+        # proches, sont départagés par les prédicats exacts
+        if k > 0 and x == xp and y == yp:
+            continue
+        xp = x
+        yp = y
+
+        if i in (i0, i1, i2):
+            continue
+
+        # Recherche d'une arête visible de l'enveloppe via la table d'angles
+        start = 0
+        key = hash_key(x, y)
+        for j in range(hash_size):
+            start = hull_hash[(key + j) % hash_size]
+            if start != -1 and start != hull_next[start]:
+                break
+
+        start = hull_prev[start]
+        e = start
+        while True:
+            q = hull_next[e]
+            if orient2d(xs[e], ys[e], xs[q], ys[q], x, y) < 0:
+                break
+            e = q
+            if e == start:
+                e = -1
+                break
+        if e == -1:
+            # Point sur l'enveloppe ou doublon : rien à ajouter
+            continue
+
+        t = add_triangle(e, i, hull_next[e], -1, -1, hull_tri[e])
+        hull_tri[i] = legalize(t + 2)
+        hull_tri[e] = t
+        hull_size += 1
+
+        # Parcours vers l'avant de l'enveloppe
+        nxt = hull_next[e]
+        while True:
+            q = hull_next[nxt]
+            if orient2d(xs[nxt], ys[nxt], xs[q], ys[q], x, y) >= 0:
+                break
+            t = add_triangle(nxt, i, q, hull_tri[i], -1, hull_tri[nxt])
+            hull_tri[i] = legalize(t + 2)
+            hull_next[nxt] = nxt
+            hull_size -= 1
+            nxt = q
+
+        # Parcours vers l'arrière
+        if e == start:
+            while True:
+                q = hull_prev[e]
+                if orient2d(xs[q], ys[q], xs[e], ys[e], x, y) >= 0:
+                    break
+                t = add_triangle(q, i, e, -1, hull_tri[e], hull_tri[q])
+                legalize(t + 2)
+                hull_tri[q] = t
+                hull_next[e] = e
+                hull_size -= 1
+                e = q
+
+        hull_start = hull_prev[i] = e
+        hull_next[e] = hull_prev[nxt] = i
+        hull_next[i] = nxt
+
+        hull_hash[hash_key(x, y)] = i
+        hull_hash[hash_key(xs[e], ys[e])] = e
+
+    hull = []
+    e = hull_start
+    for _ in range(hull_size):
+        hull.append(e)
+        e = hull_next[e]
+
+    return triangles, halfedges, hull
+
+
+def index_triangles(flat):
+    """Group a flat vertex list into a TriangleMesh.
+
+    Each triangle is rotated to start with its smallest index, which keeps
+    its orientation, and the triangles are sorted: the output only depends
+    on the triangulation, not on the engine or the order it was built in.
+
+    Args:
+        flat: Flat list of vertex indices, three per triangle
+
+    Returns:
+        TriangleMesh: Triangles, iterable as (i, j, k) tuples
+
+    """
+    triangles = []
+    for t in range(0, len(flat), 3):
+        i, j, k = flat[t], flat[t + 1], flat[t + 2]
+        # Rotation pour commencer par le plus petit indice (sortie stable)
+        if j < i and j < k:
+            i, j, k = j, k, i
+        elif k < i and k < j:
+            i, j, k = k, i, j
+        triangles.append((i, j, k))
+    # Ordre canonique : balayage, insertion ou mise à jour d'une version
+    # donnent les mêmes octets, donc le même ETag
+    triangles.sort()
+    return TriangleMesh.from_flat(array('I', chain.from_iterable(triangles)))
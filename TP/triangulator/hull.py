@@ -0,0 +1,95 @@
+"""Module de calcul de l'enveloppe convexe (chaîne monotone d'Andrew)."""
+import math
+
+from .predicates import orient2d
+
+
+def convex_hull(xs, ys):
+    """Compute the convex hull of a set of 2D points.
+
+    Points are sorted by (x, y), then the lower and upper chains are built
+    in a single pass each, which gives an O(n log n) hull dominated by the
+    sort. Orientation tests are exact, so collinear points on the hull
+    edges are dropped reliably.
+
+    Args:
+        xs: Sequence of X coordinates
+        ys: Sequence of Y coordinates, same length as ``xs``
+
+    Returns:
+        list: Indices of the hull vertices in counterclockwise order,
+        starting from the lowest-leftmost point. Duplicates and points
+        with non-finite coordinates are ignored; when all points are
+        collinear, only the two extreme points are returned (one or none
+        for fewer distinct points).
+
+    """
+    order = sorted(
+        (i for i in range(len(xs)) if math.isfinite(xs[i]) and math.isfinite(ys[i])),
+        key=lambda i: (xs[i], ys[i]),
+    )
+    distinct = []
+    for i in order:
+        if not distinct or (xs[i], ys[i]) != (xs[distinct[-1]], ys[distinct[-1]]):
+            distinct.append(i)
+    if len(distinct) < 3:
+        return distinct
+
+    def chain(indices):
+        result = []
+        for i in indices:
+            while len(result) >= 2 and orient2d(
+                xs[result[-2]], ys[result[-2]],
+                xs[result[-1]], ys[result[-1]],
+                xs[i], ys[i],
+            ) <= 0:
+                result.pop()
+            result.append(i)
+        return result
+
+    lower = chain(distinct)
+    upper = chain(reversed(distinct))
+    return lower[:-1] + upper[:-1]
+
+
+def is_convex_polygon(xs, ys):
+    """Tell whether the points, in the given order, form a convex polygon.
+
+    Every turn must be strict and in the same direction, and the edge
+    directions must sweep a single turn (the X direction of the edges
+    changes sign twice at most), which rules out self-intersecting stars.
+    The check is O(n).
+
+    Args:
+        xs: Sequence of X coordinates
+        ys: Sequence of Y coordinates, same length as ``xs``
+
+    Returns:
+        int: 1 for a counterclockwise convex polygon, -1 for a clockwise
+        one, 0 otherwise (fewer than three points included)
+
+    """
+    n = len(xs)
+    if n < 3:
+        return 0
+    direction = 0
+    flips = 0
+    previous_dx = 0.0
+    for k in range(n):
+        a = k - 2
+        b = k - 1
+        turn = orient2d(xs[a], ys[a], xs[b], ys[b], xs[k], ys[k])
+        sign = (turn > 0) - (turn < 0)
+        if sign == 0 or (direction and sign != direction):
+            return 0
+        direction = sign
+        dx = xs[k] - xs[b]
+        if dx:
+            if previous_dx and (dx > 0) != (previous_dx > 0):
+                flips += 1
+            previous_dx = dx
+    # Le changement de signe entre la dernière et la première arête
+    first_dx = next((xs[k] - xs[k - 1] for k in range(n) if xs[k] != xs[k - 1]), 0.0)
+    if first_dx and previous_dx and (first_dx > 0) != (previous_dx > 0):
+        flips += 1
+    return direction if flips <= 2 else 0
@@ -0,0 +1,639 @@
+"""Module de triangulation de Delaunay par insertion incrémentale (Bowyer-Watson)."""
+from .delaunay import index_triangles, sweep_hull
+from .hull import convex_hull
+from .mesh import TriangleMesh
+from .ordering import brio_order
+from .predicates import incircle, orient2d
+
+GHOST = -1
+
+# Au-delà de cette proportion de points modifiés, on recalcule tout
+REBUILD_RATIO = 0.25
+
+
+class IncrementalDelaunay:
+    """Mutable Delaunay triangulation built by point insertion.
+
+    Triangles are stored in flat lists: triangle ``t`` has the vertices
+    ``tri[3t:3t+3]`` in counterclockwise order and ``nbr[3t + k]`` is the
+    triangle across its edge ``k`` (from vertex ``k`` to vertex ``k + 1``).
+    Every hull edge is closed by a "ghost" triangle whose third vertex is
+    ``GHOST``, so that points outside the hull are inserted like the others.
+    Vertex indices refer to the coordinate lists given at construction.
+    """
+
+    def __init__(self, xs, ys):
+        """Create an empty triangulation over the given coordinates.
+
+        Args:
+            xs: List of X coordinates
+            ys: List of Y coordinates
+
+        """
+        self.xs = xs
+        self.ys = ys
+        self.tri = []
+        self.nbr = []
+        self.alive = []
+        self.free = []
+        self.vertex_tri = [-1] * len(xs)
+        self.last = -1
+
+    # ==================== Structure ====================
+
+    def _new_triangle(self, a, b, c):
+        """Allocate a triangle slot, reusing a freed one if possible."""
+        if self.free:
+            t = self.free.pop()
+            self.tri[3 * t:3 * t + 3] = (a, b, c)
+            self.nbr[3 * t:3 * t + 3] = (-1, -1, -1)
+            self.alive[t] = True
+        else:
+            t = len(self.alive)
+            self.tri.extend((a, b, c))
+            self.nbr.extend((-1, -1, -1))
+            self.alive.append(True)
+        return t
+
+    def _kill(self, t):
+        """Release a triangle slot."""
+        self.alive[t] = False
+        self.free.append(t)
+
+    def _is_ghost(self, t):
+        """Return True if t is a ghost triangle."""
+        tri = self.tri
+        return GHOST in (tri[3 * t], tri[3 * t + 1], tri[3 * t + 2])
+
+    def triangles(self):
+        """Return the solid triangles as a flat list of vertex indices."""
+        tri = self.tri
+        flat = []
+        for t, alive in enumerate(self.alive):
+            if alive and not self._is_ghost(t):
+                flat.extend(tri[3 * t:3 * t + 3])
+        return flat
+
+    # ==================== Construction ====================
+
+    def start(self, a, b, c):
+        """Create the first triangle and its three ghost triangles.
+
+        Args:
+            a: Index of the first vertex
+            b: Index of the second vertex
+            c: Index of the third vertex, (a, b, c) not collinear
+
+        """
+        xs = self.xs
+        ys = self.ys
+        if orient2d(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) < 0:
+            b, c = c, b
+        t = self._new_triangle(a, b, c)
+        g_ab = self._new_triangle(b, a, GHOST)
+        g_bc = self._new_triangle(c, b, GHOST)
+        g_ca = self._new_triangle(a, c, GHOST)
+        nbr = self.nbr
+        nbr[3 * t:3 * t + 3] = (g_ab, g_bc, g_ca)
+        nbr[3 * g_ab:3 * g_ab + 3] = (t, g_ca, g_bc)
+        nbr[3 * g_bc:3 * g_bc + 3] = (t, g_ab, g_ca)
+        nbr[3 * g_ca:3 * g_ca + 3] = (t, g_bc, g_ab)
+        self.vertex_tri[a] = self.vertex_tri[b] = self.vertex_tri[c] = t
+        self.last = t
+
+    def _locate(self, px, py):
+        """Walk from the last created triangle towards the point.
+
+        Returns:
+            int: A solid triangle containing the point (possibly on its
+            boundary), or the ghost triangle of a hull edge that sees it
+
+        """
+        xs = self.xs
+        ys = self.ys
+        tri = self.tri
+        nbr = self.nbr
+        t = self.last
+        came_from = -1
+        while True:
+            if self._is_ghost(t):
+                return t
+            base = 3 * t
+            for k in range(3):
+                o = nbr[base + k]
+                if o == came_from:
+                    continue
+                u = tri[base + k]
+                v = tri[base + (k + 1) % 3]
+                if orient2d(xs[u], ys[u], xs[v], ys[v], px, py) < 0:
+                    came_from = t
+                    t = o
+                    break
+            else:
+                # L'arête d'arrivée ne peut pas séparer le point du triangle
+                return t
+
+    def _conflicts(self, t, px, py):
+        """Return True if the point lies in the circumcircle of t.
+
+        For a ghost triangle the "circumcircle" is the open half-plane
+        outside its hull edge, plus the edge itself.
+        """
+        xs = self.xs
+        ys = self.ys
+        a, b, c = self.tri[3 * t:3 * t + 3]
+        if GHOST in (a, b, c):
+            # Rotation pour que le sommet fantôme soit en dernier
+            if a == GHOST:
+                a, b = b, c
+            elif b == GHOST:
+                a, b = c, a
+            o = orient2d(xs[a], ys[a], xs[b], ys[b], px, py)
+            if o != 0:
+                return o > 0
+            ax = xs[a]
+            ay = ys[a]
+            bx = xs[b]
+            by = ys[b]
+            return (
+                (px - ax) * (bx - ax) + (py - ay) * (by - ay) > 0
+                and (px - bx) * (ax - bx) + (py - by) * (ay - by) > 0
+            )
+        return incircle(
+            xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], px, py
+        ) > 0
+
+    def insert_vertex(self, p):
+        """Insert the vertex p by re-triangulating its conflict cavity.
+
+        Args:
+            p: Index of the point to insert
+
+        Returns:
+            bool: False if the point duplicates an existing vertex
+
+        """
+        xs = self.xs
+        ys = self.ys
+        tri = self.tri
+        nbr = self.nbr
+        px = xs[p]
+        py = ys[p]
+
+        t = self._locate(px, py)
+        if not self._is_ghost(t):
+            for v in tri[3 * t:3 * t + 3]:
+                if xs[v] == px and ys[v] == py:
+                    return False
+
+        # Cavité : triangles dont le cercle circonscrit contient le point
+        cavity = {t}
+        stack = [t]
+        boundary = []
+        while stack:
+            c = stack.pop()
+            for k in range(3):
+                o = nbr[3 * c + k]
+                if o in cavity:
+                    continue
+                if self._conflicts(o, px, py):
+                    cavity.add(o)
+                    stack.append(o)
+                else:
+                    boundary.append((tri[3 * c + k], tri[3 * c + (k + 1) % 3], o))
+
+        # Arête de retour (v -> u) côté triangle extérieur
+        links = []
+        for u, v, o in boundary:
+            base = 3 * o
+            for j in range(3):
+                if tri[base + j] == v and tri[base + (j + 1) % 3] == u:
+                    links.append(j)
+                    break
+
+        for c in cavity:
+            self._kill(c)
+
+        by_start = {}
+        by_end = {}
+        created = []
+        for (u, v, o), j in zip(boundary, links, strict=True):
+            n = self._new_triangle(u, v, p)
+            nbr[3 * n] = o
+            nbr[3 * o + j] = n
+            by_start[u] = n
+            by_end[v] = n
+            created.append(n)
+
+        vertex_tri = self.vertex_tri
+        for n in created:
+            u = tri[3 * n]
+            v = tri[3 * n + 1]
+            nbr[3 * n + 1] = by_start[v]
+            nbr[3 * n + 2] = by_end[u]
+            if u != GHOST and v != GHOST:
+                vertex_tri[u] = vertex_tri[v] = vertex_tri[p] = n
+                self.last = n
+        return True
+
+    @classmethod
+    def from_halfedges(cls, xs, ys, triangles, halfedges):
+        """Build the mutable structure from a sweep-hull triangulation.
+
+        Args:
+            xs: List of X coordinates
+            ys: List of Y coordinates
+            triangles: Flat list of counterclockwise triangle vertices
+            halfedges: Opposite half-edge of each half-edge, -1 on the hull
+
+        Returns:
+            IncrementalDelaunay: The same triangulation, closed by ghosts
+
+        """
+        mesh = cls(xs, ys)
+        count = len(triangles) // 3
+        mesh.tri = list(triangles)
+        mesh.nbr = [e // 3 if e != -1 else -1 for e in halfedges]
+        mesh.alive = [True] * count
+
+        by_first = {}
+        by_second = {}
+        for e, opposite in enumerate(halfedges):
+            if opposite != -1:
+                continue
+            t = e // 3
+            u = triangles[e]
+            v = triangles[t * 3 + (e + 1) % 3]
+            g = mesh._new_triangle(v, u, GHOST)
+            mesh.nbr[e] = g
+            mesh.nbr[3 * g] = t
+            by_first[v] = g
+            by_second[u] = g
+        for g in by_first.values():
+            v = mesh.tri[3 * g]
+            u = mesh.tri[3 * g + 1]
+            mesh.nbr[3 * g + 1] = by_first[u]
+            mesh.nbr[3 * g + 2] = by_second[v]
+
+        vertex_tri = mesh.vertex_tri
+        for t in range(count):
+            for v in triangles[3 * t:3 * t + 3]:
+                vertex_tri[v] = t
+        mesh.last = 0
+        return mesh
+
+    def solid_count(self):
+        """Return the number of solid (non-ghost) triangles."""
+        return sum(
+            1 for t, alive in enumerate(self.alive)
+            if alive and not self._is_ghost(t)
+        )
+
+    def remove_vertex(self, v):
+        """Remove the vertex v and re-triangulate the hole it leaves.
+
+        The hole (the star of v) is filled by cutting Delaunay ears from
+        its boundary polygon: an ear is a convex corner whose circumcircle
+        contains no other polygon vertex. When v is on the hull, the part
+        of the polygon left without ears becomes the new hull.
+
+        Args:
+            v: Index of the vertex to remove
+
+        Returns:
+            bool: False if the hole could not be filled (the caller must
+            then rebuild the triangulation)
+
+        """
+        xs = self.xs
+        ys = self.ys
+        tri = self.tri
+        nbr = self.nbr
+
+        # Étoile du sommet : triangles (fantômes compris) qui contiennent v
+        start = self.vertex_tri[v]
+        star = {start}
+        stack = [start]
+        while stack:
+            t = stack.pop()
+            for k in range(3):
+                o = nbr[3 * t + k]
+                if o not in star and v in tri[3 * o:3 * o + 3]:
+                    star.add(o)
+                    stack.append(o)
+
+        # Polygone bord de la cavité, orienté comme les triangles
+        following = {}
+        outside = {}
+        for t in star:
+            for k in range(3):
+                a = tri[3 * t + k]
+                b = tri[3 * t + (k + 1) % 3]
+                if v in (a, b):
+                    continue
+                o = nbr[3 * t + k]
+                following[a] = b
+                for j in range(3):
+                    if tri[3 * o + j] == b and tri[3 * o + (j + 1) % 3] == a:
+                        outside[(a, b)] = (o, j)
+                        break
+        first = GHOST if GHOST in following else next(iter(following))
+        polygon = [first]
+        while following[polygon[-1]] != first:
+            polygon.append(following[polygon[-1]])
+
+        faces = []
+        while len(polygon) > 3 or (GHOST not in polygon and len(polygon) == 3):
+            if len(polygon) == 3:
+                faces.append(tuple(polygon))
+                polygon = []
+                break
+            size = len(polygon)
+            for i in range(size):
+                a = polygon[i - 1]
+                b = polygon[i]
+                c = polygon[(i + 1) % size]
+                if GHOST in (a, b, c):
+                    continue
+                if orient2d(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) <= 0:
+                    continue
+                if any(
+                    incircle(
+                        xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], xs[q], ys[q]
+                    ) > 0
+                    for q in polygon
+                    if q not in (a, b, c, GHOST)
+                ):
+                    continue
+                faces.append((a, b, c))
+                del polygon[i]
+                break
+            else:
+                if GHOST not in polygon:
+                    return False
+                # Chaîne convexe restante : nouvelle enveloppe
+                break
+
+        if polygon:
+            g = polygon.index(GHOST)
+            chain = polygon[g + 1:] + polygon[:g]
+            faces.extend(
+                (chain[i], chain[i + 1], GHOST) for i in range(len(chain) - 1)
+            )
+
+        for t in star:
+            self._kill(t)
+        self.vertex_tri[v] = -1
+
+        edges = {}
+        created = []
+        for a, b, c in faces:
+            t = self._new_triangle(a, b, c)
+            created.append(t)
+            for k, edge in enumerate(((a, b), (b, c), (c, a))):
+                edges[edge] = (t, k)
+        for (a, b), (t, k) in edges.items():
+            twin = edges.get((b, a))
+            if twin is not None:
+                nbr[3 * t + k] = twin[0]
+            else:
+                o, j = outside[(a, b)]
+                nbr[3 * t + k] = o
+                nbr[3 * o + j] = t
+
+        # Les emplacements libérés ont pu être réutilisés : on réaffecte un
+        # triangle à chaque sommet du bord, de préférence non fantôme
+        vertex_tri = self.vertex_tri
+        solids = [t for t in created if not self._is_ghost(t)]
+        for t in [t for t in created if self._is_ghost(t)] + solids:
+            for u in tri[3 * t:3 * t + 3]:
+                if u != GHOST:
+                    vertex_tri[u] = t
+        if solids:
+            self.last = solids[-1]
+        elif self.last in star:
+            self.last = next(
+                (t for t, alive in enumerate(self.alive)
+                 if alive and not self._is_ghost(t)),
+                -1,
+            )
+        return True
+
+
+def incremental_delaunay(xs, ys, order):
+    """Compute the Delaunay triangulation by inserting points one by one.
+
+    Args:
+        xs: List of X coordinates
+        ys: List of Y coordinates
+        order: Insertion order, a permutation of the point indices
+
+    Returns:
+        list: Flat list of vertex indices, three per counterclockwise
+        triangle, referring to the original (unpermuted) indices. Empty
+        when all points are collinear.
+
+    """
+    hull = convex_hull(xs, ys)
+    if len(hull) < 3:
+        return []
+
+    # Graine : trois sommets consécutifs de l'enveloppe, jamais alignés
+    a, b, c = hull[:3]
+    mesh = IncrementalDelaunay(xs, ys)
+    mesh.start(a, b, c)
+    for i in order:
+        if i not in (a, b, c):
+            mesh.insert_vertex(i)
+    return mesh.triangles()
+
+
+class DelaunayTriangulation:
+    """Delaunay triangulation of a PointSet that can be edited in place.
+
+    Vertex indices are stable: inserted points get new indices at the end
+    and removed points keep theirs (they simply no longer appear in any
+    triangle). Only the cavity around each edited point is re-triangulated.
+    """
+
+    def __init__(self, pointset):
+        """Triangulate an initial set of points.
+
+        Args:
+            pointset: Sequence of (x, y) tuples
+
+        """
+        self._reset(pointset)
+
+    def _reset(self, pointset):
+        """Drop the current state and triangulate pointset from scratch."""
+        self.xs = [float(x) for x, _ in pointset]
+        self.ys = [float(y) for _, y in pointset]
+        self.removed = [False] * len(self.xs)
+        self._mesh = None
+        self._unused = set()
+        self._build()
+
+    def __len__(self):
+        """Return the number of points that have not been removed."""
+        return self.removed.count(False)
+
+    def _live(self):
+        """Return the indices of the points that have not been removed."""
+        return [i for i, gone in enumerate(self.removed) if not gone]
+
+    def _build(self):
+        """Triangulate all live points from scratch."""
+        live = self._live()
+        xs = [self.xs[i] for i in live]
+        ys = [self.ys[i] for i in live]
+        flat, halfedges, _ = sweep_hull(xs, ys)
+        self._mesh = None
+        self._unused = set(live)
+        if not flat:
+            return
+
+        # Les indices compacts de sweep_hull sont ramenés aux indices stables
+        mesh = IncrementalDelaunay.from_halfedges(xs, ys, flat, halfedges)
+        mesh.xs = self.xs
+        mesh.ys = self.ys
+        mesh.tri = [live[v] if v != GHOST else GHOST for v in mesh.tri]
+        vertex_tri = [-1] * len(self.xs)
+        for compact, t in enumerate(mesh.vertex_tri):
+            vertex_tri[live[compact]] = t
+        mesh.vertex_tri = vertex_tri
+        self._mesh = mesh
+        self._unused = {i for i in live if vertex_tri[i] == -1}
+
+    def _insert_unused(self):
+        """Try to insert the live points that are not part of the mesh yet."""
+        if self._mesh is None:
+            unused = sorted(self._unused)
+            if len(convex_hull(
+                [self.xs[i] for i in unused], [self.ys[i] for i in unused]
+            )) < 3:
+                return
+            self._build()
+            return
+        mesh = self._mesh
+        for i in sorted(self._unused):
+            if mesh.insert_vertex(i):
+                self._unused.discard(i)
+
+    def insert(self, points):
+        """Insert new points and repair only the cavities they create.
+
+        Args:
+            points: Sequence of (x, y) tuples
+
+        Returns:
+            list: The indices assigned to the new points
+
+        """
+        first = len(self.xs)
+        xs = [float(x) for x, _ in points]
+        ys = [float(y) for _, y in points]
+        self.xs.extend(xs)
+        self.ys.extend(ys)
+        self.removed.extend([False] * len(xs))
+        indices = list(range(first, len(self.xs)))
+
+        if self._mesh is None:
+            self._unused.update(indices)
+            self._insert_unused()
+            return indices
+
+        mesh = self._mesh
+        mesh.vertex_tri.extend([-1] * len(xs))
+        for k in brio_order(xs, ys):
+            if not mesh.insert_vertex(first + k):
+                self._unused.add(first + k)
+        return indices
+
+    def remove(self, indices):
+        """Remove points and fill the holes they leave.
+
+        Args:
+            indices: Indices of the points to remove
+
+        Raises:
+            IndexError: If an index does not refer to a live point or is
+                given twice
+
+        """
+        seen = set()
+        for i in indices:
+            if not 0 <= i < len(self.xs) or self.removed[i]:
+                raise IndexError(f"No point with index {i}")
+            if i in seen:
+                raise IndexError(f"Index {i} given twice")
+            seen.add(i)
+
+        for i in indices:
+            self.removed[i] = True
+            if i in self._unused:
+                self._unused.discard(i)
+                continue
+            mesh = self._mesh
+            if not mesh.remove_vertex(i) or mesh.solid_count() == 0:
+                self._build()
+        if self._unused:
+            # Un doublon masqué peut devenir utile une fois l'original retiré
+            self._insert_unused()
+
+    def triangles(self):
+        """Return the triangles as (i, j, k) tuples of stable indices.
+
+        Returns:
+            TriangleMesh: Counterclockwise triangles, smallest index first
+
+        """
+        if self._mesh is None:
+            return TriangleMesh()
+        return index_triangles(self._mesh.triangles())
+
+    def update(self, pointset):
+        """Bring the triangulation to a new version of the PointSet.
+
+        Points are matched by coordinates: the ones that disappeared are
+        removed, the new ones inserted. If too many points changed, the
+        triangulation is rebuilt instead.
+
+        Args:
+            pointset: Sequence of (x, y) tuples, the new version
+
+        Returns:
+            TriangleMesh: Triangles as (i, j, k) indices into ``pointset``
+
+        """
+        positions = {}
+        for position, (x, y) in enumerate(pointset):
+            positions.setdefault((float(x), float(y)), []).append(position)
+
+        mapping = {}
+        to_remove = []
+        for i in self._live():
+            candidates = positions.get((self.xs[i], self.ys[i]))
+            if candidates:
+                mapping[i] = candidates.pop()
+            else:
+                to_remove.append(i)
+        added = [p for remaining in positions.values() for p in remaining]
+
+        changed = len(to_remove) + len(added)
+        if changed > REBUILD_RATIO * max(len(pointset), 1) or (
+            len(self.xs) + len(added) > 2 * max(len(pointset), 1)
+        ):
+            # Trop de changements (ou trop d'indices morts) : on repart de zéro
+            self._reset(pointset)
+            return self.triangles()
+
+        if to_remove:
+            self.remove(to_remove)
+        if added:
+            new = self.insert([pointset[p] for p in added])
+            mapping.update(zip(new, added, strict=True))
+
+        if self._mesh is None:
+            return TriangleMesh()
+        return index_triangles([mapping[v] for v in self._mesh.triangles()])
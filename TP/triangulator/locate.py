@@ -0,0 +1,171 @@
+"""Module de localisation de points dans une triangulation (jump-and-walk).
+
+Un index construit une fois par triangulation associe à chaque case d'une
+grille régulière un triangle de départ proche ; chaque requête marche
+ensuite de triangle en triangle vers le point cherché.
+"""
+import math
+from array import array
+
+from .predicates import orient2d
+
+# Indice renvoyé pour un point hors de l'enveloppe convexe
+OUTSIDE = 0xFFFFFFFF
+
+# Nombre moyen de sommets par case de la grille
+_VERTICES_PER_CELL = 2
+
+
+class PointLocator:
+    """Answer "which triangle contains (x, y)?" queries on a triangulation.
+
+    Attributes:
+        xs: X coordinates of the vertices
+        ys: Y coordinates of the vertices
+        tri: Flat vertex indices, three per counterclockwise triangle
+        nbr: ``nbr[3t + k]`` is the triangle across the edge from vertex
+            ``k`` to vertex ``k + 1`` of triangle ``t`` (-1 on the hull)
+
+    """
+
+    __slots__ = ("xs", "ys", "tri", "nbr", "_grid", "_side", "_min_x",
+                 "_min_y", "_scale")
+
+    def __init__(self, points, triangles):
+        """Build the adjacency and the grid index.
+
+        Args:
+            points: Sequence of (x, y) vertices
+            triangles: Sequence of counterclockwise (i, j, k) triangles
+
+        """
+        self.xs = [float(x) for x, _ in points]
+        self.ys = [float(y) for _, y in points]
+        self.tri = array('l')
+        for triangle in triangles:
+            self.tri.extend(triangle)
+        count = len(self.tri)
+
+        # Adjacence : l'arête (a, b) d'un triangle est l'arête (b, a) du voisin
+        self.nbr = array('l', [-1]) * count
+        edges = {}
+        for e in range(count):
+            a = self.tri[e]
+            b = self.tri[e - e % 3 + (e + 1) % 3]
+            twin = edges.pop((b, a), None)
+            if twin is None:
+                edges[(a, b)] = e
+            else:
+                self.nbr[e] = twin // 3
+                self.nbr[twin] = e // 3
+
+        self._build_grid()
+
+    def _build_grid(self):
+        """Map every grid cell to a triangle incident to a nearby vertex."""
+        used = sorted(set(self.tri))
+        if not used:
+            self._grid = array('l')
+            self._side = 0
+            return
+        self._min_x = min(self.xs[v] for v in used)
+        self._min_y = min(self.ys[v] for v in used)
+        extent = max(
+            max(self.xs[v] for v in used) - self._min_x,
+            max(self.ys[v] for v in used) - self._min_y,
+        )
+        self._side = max(1, math.isqrt(len(used) // _VERTICES_PER_CELL))
+        self._scale = self._side / extent if extent > 0 else 0.0
+
+        grid = array('l', [-1]) * (self._side * self._side)
+        for e in range(len(self.tri)):
+            v = self.tri[e]
+            cell = self._cell(self.xs[v], self.ys[v])
+            if grid[cell] == -1:
+                grid[cell] = e // 3
+
+        # Cases vides : triangle de la case remplie précédente (ou suivante)
+        previous = -1
+        for cell in range(len(grid)):
+            if grid[cell] == -1:
+                grid[cell] = previous
+            else:
+                previous = grid[cell]
+        for cell in range(len(grid) - 1, -1, -1):
+            if grid[cell] == -1:
+                grid[cell] = previous
+            else:
+                previous = grid[cell]
+        self._grid = grid
+
+    def _cell(self, x, y):
+        """Return the grid cell containing (x, y), clamped to the grid."""
+        side = self._side
+        ix = min(side - 1, max(0, int((x - self._min_x) * self._scale)))
+        iy = min(side - 1, max(0, int((y - self._min_y) * self._scale)))
+        return iy * side + ix
+
+    def locate(self, x, y):
+        """Find a triangle containing the point (x, y).
+
+        Args:
+            x: X coordinate of the query point
+            y: Y coordinate of the query point
+
+        Returns:
+            int: Index of the triangle (a point on an edge or a vertex gets
+            one of the triangles sharing it), or ``OUTSIDE`` if the point is
+            outside the triangulation
+
+        """
+        if not self._grid or not (math.isfinite(x) and math.isfinite(y)):
+            return OUTSIDE
+        xs = self.xs
+        ys = self.ys
+        tri = self.tri
+        t = self._grid[self._cell(x, y)]
+
+        # Marche par visibilité : elle termine sur une triangulation de Delaunay
+        for _ in range(len(tri) // 3 + 1):
+            base = 3 * t
+            for k in range(3):
+                a = tri[base + k]
+                b = tri[base + (k + 1) % 3]
+                if orient2d(xs[a], ys[a], xs[b], ys[b], x, y) < 0:
+                    t = self.nbr[base + k]
+                    if t == -1:
+                        return OUTSIDE
+                    break
+            else:
+                return base // 3
+        return self._scan(x, y)
+
+    def _scan(self, x, y):
+        """Test every triangle (fallback for non-Delaunay inputs)."""
+        xs = self.xs
+        ys = self.ys
+        tri = self.tri
+        for base in range(0, len(tri), 3):
+            if all(
+                orient2d(
+                    xs[tri[base + k]], ys[tri[base + k]],
+                    xs[tri[base + (k + 1) % 3]], ys[tri[base + (k + 1) % 3]],
+                    x, y,
+                ) >= 0
+                for k in range(3)
+            ):
+                return base // 3
+        return OUTSIDE
+
+    def locate_many(self, points):
+        """Locate a batch of points.
+
+        Args:
+            points: Sequence of (x, y) query points
+
+        Returns:
+            array: ``array('I')`` of triangle indices (``OUTSIDE`` for the
+            points outside the triangulation)
+
+        """
+        return array('I', [self.locate(x, y) for x, y in points])
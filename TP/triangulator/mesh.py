@@ -0,0 +1,307 @@
+"""Module des structures compactes pour les points et les triangles.
+
+Les coordonnées et les indices sont stockés dans des ``array`` typés
+(4 octets par valeur) plutôt que dans des listes de tuples Python. Les deux
+classes respectent le protocole de séquence et renvoient des tuples à
+l'accès, ce qui les rend interchangeables avec les listes existantes.
+"""
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+_POINT = struct.Struct('>ff')
+
+
+def _sequence_eq(left, right):
+    """Compare two sequences of tuples element by element."""
+    if not isinstance(right, Sequence) or isinstance(right, (str, bytes)):
+        return NotImplemented
+    if len(left) != len(right):
+        return False
+    return all(a == tuple(b) for a, b in zip(left, right, strict=True))
+
+
+class PointSet(Sequence):
+    """2D points stored as interleaved float32 coordinates.
+
+    Attributes:
+        coords: ``array('f')`` holding ``x0, y0, x1, y1, ...``
+
+    """
+
+    __slots__ = ("coords",)
+
+    def __init__(self, points=()):
+        """Build a PointSet from (x, y) pairs.
+
+        Args:
+            points: Iterable of (x, y) pairs
+
+        """
+        self.coords = array('f')
+        for x, y in points:
+            self.coords.append(x)
+            self.coords.append(y)
+
+    @classmethod
+    def from_coords(cls, coords):
+        """Wrap interleaved coordinates without copying them.
+
+        Args:
+            coords: ``array('f')`` of even length
+
+        Returns:
+            PointSet: Points backed by ``coords``
+
+        Raises:
+            ValueError: If ``coords`` has an odd length
+
+        """
+        if len(coords) % 2:
+            raise ValueError("Odd number of coordinates")
+        pointset = cls.__new__(cls)
+        pointset.coords = coords
+        return pointset
+
+    @property
+    def xs(self):
+        """List of the X coordinates."""
+        return self.coords[0::2].tolist()
+
+    @property
+    def ys(self):
+        """List of the Y coordinates."""
+        return self.coords[1::2].tolist()
+
+    def __len__(self):
+        """Return the number of points."""
+        return len(self.coords) // 2
+
+    def __getitem__(self, index):
+        """Return the (x, y) tuple of a point, or a PointSet for a slice."""
+        if isinstance(index, slice):
+            return PointSet(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PointSet index out of range")
+        return self.coords[2 * index], self.coords[2 * index + 1]
+
+    def __iter__(self):
+        """Iterate over the (x, y) tuples."""
+        coords = self.coords
+        return zip(coords[0::2], coords[1::2], strict=True)
+
+    def __eq__(self, other):
+        """Compare with any sequence of (x, y) pairs."""
+        return _sequence_eq(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Return a short representation."""
+        return f"PointSet({len(self)} points)"
+
+
+class PointSetView(Sequence):
+    """Read-only view over the bytes of a binary PointSet.
+
+    Only the header is read at construction; each point is decoded when
+    it is accessed, so checks that touch a few points (count, bounding
+    box of a sample...) do not pay for the whole PointSet.
+    """
+
+    __slots__ = ("_data", "_count")
+
+    def __init__(self, data):
+        """Check the header and wrap the data without decoding it.
+
+        Args:
+            data: Bytes-like object in the PointSet format (kept by
+                reference, it must not change while the view is used)
+
+        Raises:
+            ValueError: If data is truncated
+
+        """
+        if len(data) < 4:
+            raise ValueError("Data too short to contain point count")
+        count = int.from_bytes(data[:4], byteorder='big')
+        expected_length = 4 + 8 * count
+        if len(data) < expected_length:
+            msg = f"Data too short: expected {expected_length} bytes, "
+            msg += f"got {len(data)}"
+            raise ValueError(msg)
+        self._data = data
+        self._count = count
+
+    def __len__(self):
+        """Return the number of points, read from the header."""
+        return self._count
+
+    def __getitem__(self, index):
+        """Decode one point as an (x, y) tuple, or a slice as a PointSet."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._count)
+            if step == 1:
+                return PointSet.from_coords(
+                    self._decode(start, max(start, stop))
+                )
+            return PointSet(self[i] for i in range(start, stop, step))
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PointSet index out of range")
+        return _POINT.unpack_from(self._data, 4 + 8 * index)
+
+    def __iter__(self):
+        """Decode the points one by one."""
+        data = self._data
+        for offset in range(4, 4 + 8 * self._count, 8):
+            yield _POINT.unpack_from(data, offset)
+
+    def _decode(self, start, stop):
+        """Decode points [start, stop) into native float32 coordinates."""
+        coords = array('f')
+        with memoryview(self._data) as view:
+            coords.frombytes(view[4 + 8 * start:4 + 8 * stop])
+        if sys.byteorder == 'little':
+            coords.byteswap()
+        return coords
+
+    def to_array(self):
+        """Decode all the points at once.
+
+        Returns:
+            array: ``array('f')`` of interleaved native coordinates, as
+            in ``PointSet.coords``
+
+        """
+        return self._decode(0, self._count)
+
+    def __eq__(self, other):
+        """Compare with any sequence of (x, y) pairs."""
+        return _sequence_eq(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Return a short representation."""
+        return f"PointSetView({self._count} points)"
+
+
+class TriangleMesh(Sequence):
+    """Triangles stored as a flat array of uint32 vertex indices.
+
+    Attributes:
+        indices: ``array('I')`` holding ``i0, j0, k0, i1, j1, k1, ...``
+
+    """
+
+    __slots__ = ("indices",)
+
+    def __init__(self, triangles=()):
+        """Build a TriangleMesh from (i, j, k) triples.
+
+        Args:
+            triangles: Iterable of (i, j, k) vertex indices
+
+        Raises:
+            ValueError: If an index does not fit in an unsigned 32-bit integer
+
+        """
+        self.indices = array('I')
+        try:
+            for triangle in triangles:
+                self.indices.extend(triangle)
+        except OverflowError as e:
+            raise ValueError(f"Invalid triangle index: {e}") from e
+
+    @classmethod
+    def from_flat(cls, flat):
+        """Build a TriangleMesh from a flat sequence of indices.
+
+        Args:
+            flat: Sequence of vertex indices, three per triangle (an
+                ``array('I')`` is used as is, without copy)
+
+        Returns:
+            TriangleMesh: The triangles
+
+        Raises:
+            ValueError: If the length is not a multiple of three or an index
+                does not fit in an unsigned 32-bit integer
+
+        """
+        if len(flat) % 3:
+            raise ValueError("Number of indices is not a multiple of 3")
+        mesh = cls.__new__(cls)
+        if isinstance(flat, array) and flat.typecode == 'I':
+            mesh.indices = flat
+        else:
+            try:
+                mesh.indices = array('I', flat)
+            except OverflowError as e:
+                raise ValueError(f"Invalid triangle index: {e}") from e
+        return mesh
+
+    def __len__(self):
+        """Return the number of triangles."""
+        return len(self.indices) // 3
+
+    def __getitem__(self, index):
+        """Return the (i, j, k) tuple of a triangle, or a mesh for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return TriangleMesh.from_flat(self.indices[3 * start:3 * stop])
+            return TriangleMesh(self[i] for i in range(start, stop, step))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TriangleMesh index out of range")
+        t = 3 * index
+        return self.indices[t], self.indices[t + 1], self.indices[t + 2]
+
+    def __iter__(self):
+        """Iterate over the (i, j, k) tuples."""
+        indices = self.indices
+        return zip(indices[0::3], indices[1::3], indices[2::3], strict=True)
+
+    def __eq__(self, other):
+        """Compare with any sequence of (i, j, k) triples."""
+        return _sequence_eq(self, other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Return a short representation."""
+        return f"TriangleMesh({len(self)} triangles)"
+
+
+class TrustedMesh(TriangleMesh):
+    """TriangleMesh whose indices are known to be valid by construction.
+
+    Returned by the triangulation pipeline: every index is below
+    ``num_vertices``, so the serializers skip their bound check. The
+    indices must not be modified afterwards; slices are plain TriangleMesh.
+
+    Attributes:
+        indices: ``array('I')`` shared with the wrapped mesh
+        num_vertices: Number of vertices the indices refer to
+
+    """
+
+    __slots__ = ("num_vertices",)
+
+    def __init__(self, triangles, num_vertices):
+        """Mark the triangles of an engine as valid, without copy or check.
+
+        Args:
+            triangles: TriangleMesh produced by a triangulation engine
+            num_vertices: Number of points the engine was given
+
+        """
+        self.indices = triangles.indices
+        self.num_vertices = num_vertices
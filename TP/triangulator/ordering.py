@@ -0,0 +1,113 @@
+"""Module d'ordonnancement spatial des points (courbe de Hilbert, BRIO)."""
+import math
+import random
+
+HILBERT_ORDER = 16
+
+
+def _hilbert_index(x, y, side):
+    """Return the distance along the Hilbert curve of the cell (x, y)."""
+    d = 0
+    s = side >> 1
+    while s > 0:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x = side - 1 - x
+                y = side - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+
+def hilbert_keys(xs, ys, order=HILBERT_ORDER):
+    """Compute the Hilbert curve index of every point.
+
+    The bounding box of the points is mapped onto a ``2**order`` grid, so
+    that points close along the curve are close in the plane.
+
+    Args:
+        xs: Sequence of X coordinates
+        ys: Sequence of Y coordinates
+        order: Number of bits per axis of the grid
+
+    Returns:
+        list: One integer key per point
+
+    """
+    finite = [
+        (x, y) for x, y in zip(xs, ys, strict=True)
+        if math.isfinite(x) and math.isfinite(y)
+    ]
+    if not finite:
+        return [0] * len(xs)
+
+    min_x = min(x for x, _ in finite)
+    min_y = min(y for _, y in finite)
+    extent = max(
+        max(x for x, _ in finite) - min_x,
+        max(y for _, y in finite) - min_y,
+    )
+    side = 1 << order
+    scale = (side - 1) / extent if extent > 0 else 0.0
+
+    keys = []
+    for x, y in zip(xs, ys, strict=True):
+        if not (math.isfinite(x) and math.isfinite(y)):
+            keys.append(0)
+            continue
+        ix = int((x - min_x) * scale)
+        iy = int((y - min_y) * scale)
+        keys.append(_hilbert_index(ix, iy, side))
+    return keys
+
+
+def hilbert_order(xs, ys):
+    """Return the permutation that sorts the points along a Hilbert curve.
+
+    Args:
+        xs: Sequence of X coordinates
+        ys: Sequence of Y coordinates
+
+    Returns:
+        list: Point indices, ``order[k]`` being the k-th point on the curve
+
+    """
+    keys = hilbert_keys(xs, ys)
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def brio_order(xs, ys, seed=0):
+    """Return a Biased Randomized Insertion Order of the points.
+
+    Each point is assigned to a round by repeated coin flips (about half
+    of the points fall in the last round, a quarter in the one before,
+    etc.). Rounds are inserted from the smallest to the largest and each
+    round is sorted along a Hilbert curve, which keeps the randomization
+    needed for the expected O(n log n) bound while making consecutive
+    insertions spatially close.
+
+    Args:
+        xs: Sequence of X coordinates
+        ys: Sequence of Y coordinates
+        seed: Seed of the coin flips, so that the order is reproducible
+
+    Returns:
+        list: Permutation of the point indices (insertion order)
+
+    """
+    n = len(xs)
+    keys = hilbert_keys(xs, ys)
+    rng = random.Random(seed)
+    max_level = max(0, n.bit_length() - 1)
+
+    levels = []
+    for _ in range(n):
+        level = 0
+        while level < max_level and rng.random() < 0.5:
+            level += 1
+        levels.append(level)
+
+    return sorted(range(n), key=lambda i: (-levels[i], keys[i]))
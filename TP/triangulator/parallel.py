@@ -0,0 +1,274 @@
+"""Module de triangulation de Delaunay parallèle par bandes verticales.
+
+Les points sont découpés en bandes selon X, chaque bande est triangulée
+dans un processus séparé (coordonnées partagées en mémoire, sans
+sérialisation de listes de tuples), puis les coutures entre bandes sont
+recalculées dans le processus principal.
+"""
+import math
+import multiprocessing
+import os
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .delaunay import sweep_hull
+
+# En dessous de ce nombre de points, le coût des processus n'est pas rentable
+PARALLEL_THRESHOLD = 200_000
+
+# Marge relative pour décider qu'un cercle circonscrit reste dans sa bande
+_SAFETY = 1e-9
+
+# Processus des bandes, gardés d'un appel à l'autre
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def strip_pool(workers):
+    """Return the process pool triangulating the strips.
+
+    The pool is started once and reused by the next calls; it is only
+    replaced when a call asks for a different number of workers.
+
+    Args:
+        workers: Number of processes
+
+    Returns:
+        ProcessPoolExecutor: The pool
+
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None and _pool_workers != workers:
+            _pool.shutdown(wait=False)
+            _pool = None
+        if _pool is None:
+            # Appelé depuis des serveurs multithreadés : pas de fork, les
+            # processus partent d'un serveur neutre
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def shutdown_pool():
+    """Stop the strip process pool, if it was started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+
+
+def _circumcircle_x_extent(ax, ay, bx, by, cx, cy):
+    """Return the (min, max) X reached by the circumcircle of (a, b, c)."""
+    dx = bx - ax
+    dy = by - ay
+    ex = cx - ax
+    ey = cy - ay
+    denom = dx * ey - dy * ex
+    if denom == 0:
+        return -math.inf, math.inf
+    bl = dx * dx + dy * dy
+    cl = ex * ex + ey * ey
+    d = 0.5 / denom
+    ox = (ey * bl - dy * cl) * d
+    oy = (dx * cl - ex * bl) * d
+    r = math.sqrt(ox * ox + oy * oy)
+    center = ax + ox
+    margin = _SAFETY * (abs(center) + r)
+    return center - r - margin, center + r + margin
+
+
+def _triangulate_strip(shm_name, n, start, stop, left, right):
+    """Triangulate one strip of the x-sorted points (runs in a worker).
+
+    A strip triangle whose circumcircle stays strictly between the
+    neighbouring strips cannot contain any other point, so it is final.
+    The other triangles are left to the seam pass.
+
+    Args:
+        shm_name: Name of the shared memory block holding the X
+            coordinates, the Y coordinates and the x-sorted order
+        n: Total number of points
+        start: First position of the strip in the sorted order
+        stop: Position after the last point of the strip
+        left: Largest X of the strip on the left (or -inf)
+        right: Smallest X of the strip on the right (or inf)
+
+    Returns:
+        tuple: ``(kept, walls, seam)`` arrays of global indices: the final
+        triangles (flat), the directed edges bounding them and the
+        vertices the seam pass must triangulate again
+
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        coords = shm.buf[:16 * n].cast('d')
+        order = shm.buf[16 * n:24 * n].cast('q')
+        ids = order[start:stop].tolist()
+        xs = [coords[i] for i in ids]
+        ys = [coords[n + i] for i in ids]
+        order.release()
+        coords.release()
+    finally:
+        shm.close()
+
+    flat, halfedges, hull = sweep_hull(xs, ys)
+    count = len(flat) // 3
+    safe = []
+    seam = set(hull)
+    for t in range(count):
+        a, b, c = flat[3 * t], flat[3 * t + 1], flat[3 * t + 2]
+        low, high = _circumcircle_x_extent(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c])
+        ok = left < low and high < right
+        safe.append(ok)
+        if not ok:
+            seam.update((a, b, c))
+
+    kept = array('q')
+    walls = array('q')
+    for t in range(count):
+        if not safe[t]:
+            continue
+        for e in range(3 * t, 3 * t + 3):
+            kept.append(ids[flat[e]])
+            twin = halfedges[e]
+            if twin == -1 or not safe[twin // 3]:
+                u = flat[e]
+                v = flat[3 * t + (e + 1) % 3]
+                walls.extend((ids[u], ids[v]))
+
+    return kept, walls, array('q', sorted(ids[v] for v in seam))
+
+
+def _is_triangulation(flat, xs, ys):
+    """Check that flat forms a triangulated disk using every distinct point.
+
+    Uses Euler's relation T = 2V - 2 - B (B the number of boundary edges)
+    together with the uniqueness of every directed edge.
+    """
+    edges = set()
+    for t in range(0, len(flat), 3):
+        a, b, c = flat[t], flat[t + 1], flat[t + 2]
+        for edge in ((a, b), (b, c), (c, a)):
+            if edge in edges:
+                return False
+            edges.add(edge)
+    boundary = sum(1 for a, b in edges if (b, a) not in edges)
+    used = len(set(flat))
+    if used != len(set(zip(xs, ys, strict=True))):
+        return False
+    return len(flat) // 3 == 2 * used - 2 - boundary
+
+
+def parallel_delaunay(xs, ys, workers=None):
+    """Compute the Delaunay triangulation over several processes.
+
+    Args:
+        xs: List of X coordinates
+        ys: List of Y coordinates
+        workers: Number of strips and processes (default: CPU count)
+
+    Returns:
+        list: Flat list of vertex indices, three per counterclockwise
+        triangle, like ``sweep_hull``
+
+    """
+    n = len(xs)
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or n < 3 * workers:
+        return sweep_hull(xs, ys)[0]
+
+    order = sorted(range(n), key=xs.__getitem__)
+    shm = shared_memory.SharedMemory(create=True, size=24 * n)
+    try:
+        shm.buf[:8 * n] = array('d', xs).tobytes()
+        shm.buf[8 * n:16 * n] = array('d', ys).tobytes()
+        shm.buf[16 * n:24 * n] = array('q', order).tobytes()
+
+        tasks = []
+        for k in range(workers):
+            start = k * n // workers
+            stop = (k + 1) * n // workers
+            left = xs[order[start - 1]] if start > 0 else -math.inf
+            right = xs[order[stop]] if stop < n else math.inf
+            tasks.append((start, stop, left, right))
+
+        pool = strip_pool(workers)
+        futures = [
+            pool.submit(_triangulate_strip, shm.name, n, *task)
+            for task in tasks
+        ]
+        results = [future.result() for future in futures]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    kept = array('q')
+    walls = set()
+    seam = set()
+    for strip_kept, strip_walls, strip_seam in results:
+        kept.extend(strip_kept)
+        walls.update(zip(strip_walls[::2], strip_walls[1::2], strict=True))
+        seam.update(strip_seam)
+
+    flat = kept.tolist()
+    if seam:
+        flat.extend(_stitch(xs, ys, sorted(seam), walls))
+
+    if not _is_triangulation(flat, xs, ys):
+        # Configuration imprévue : on retombe sur le calcul séquentiel
+        return sweep_hull(xs, ys)[0]
+    return flat
+
+
+def _stitch(xs, ys, seam, walls):
+    """Triangulate the seam vertices and keep the part outside the strips.
+
+    The edges bounding the final strip triangles ("walls") are Delaunay
+    edges, so they also appear in the triangulation of the seam vertices.
+    Starting from the far side of each wall, a flood fill that never
+    crosses a wall collects exactly the triangles missing between strips.
+
+    Returns:
+        list: Flat list of global vertex indices of the seam triangles
+
+    """
+    flat, halfedges, _ = sweep_hull([xs[i] for i in seam], [ys[i] for i in seam])
+    flat = [seam[v] for v in flat]
+    if not walls:
+        return flat
+
+    edge_of = {}
+    for e in range(len(flat)):
+        edge_of[(flat[e], flat[e - e % 3 + (e + 1) % 3])] = e
+
+    undirected = walls | {(b, a) for a, b in walls}
+    stack = []
+    for a, b in walls:
+        e = edge_of.get((b, a))
+        if e is not None:
+            stack.append(e // 3)
+
+    reached = set(stack)
+    while stack:
+        t = stack.pop()
+        for e in range(3 * t, 3 * t + 3):
+            twin = halfedges[e]
+            if twin == -1 or twin // 3 in reached:
+                continue
+            if (flat[e], flat[3 * t + (e + 1) % 3]) in undirected:
+                continue
+            reached.add(twin // 3)
+            stack.append(twin // 3)
+
+    result = []
+    for t in sorted(reached):
+        result.extend(flat[3 * t:3 * t + 3])
+    return result
@@ -0,0 +1,140 @@
+"""Module des prédicats géométriques robustes (orientation, cercle circonscrit).
+
+Chaque test est d'abord évalué en flottants avec une borne d'erreur à la
+Shewchuk ; seuls les cas ambigus (proches du dégénéré) sont recalculés en
+arithmétique entière exacte.
+"""
+import math
+
+_EPSILON = 2.0 ** -53
+_CCW_ERRBOUND = (3.0 + 16.0 * _EPSILON) * _EPSILON
+_ICC_ERRBOUND = (10.0 + 96.0 * _EPSILON) * _EPSILON
+
+
+def _to_integers(*values):
+    """Scale floats to integers sharing a common power-of-two denominator.
+
+    Raises:
+        ValueError: If a value is NaN
+        OverflowError: If a value is infinite
+
+    """
+    ratios = [float(v).as_integer_ratio() for v in values]
+    denom = max(d for _, d in ratios)
+    return [n * (denom // d) for n, d in ratios]
+
+
+def _sign_as_float(value):
+    """Convert an exact determinant to a float without losing its sign."""
+    if value == 0:
+        return 0.0
+    result = float(value)
+    if result == 0.0:
+        return math.copysign(5e-324, value)
+    return result
+
+
+def _orient2d_exact(ax, ay, bx, by, cx, cy):
+    """Compute the orientation determinant exactly."""
+    ax, ay, bx, by, cx, cy = _to_integers(ax, ay, bx, by, cx, cy)
+    return (ax - cx) * (by - cy) - (ay - cy) * (bx - cx)
+
+
+def _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy):
+    """Compute the in-circle determinant exactly."""
+    ax, ay, bx, by, cx, cy, dx, dy = _to_integers(ax, ay, bx, by, cx, cy, dx, dy)
+    adx = ax - dx
+    ady = ay - dy
+    bdx = bx - dx
+    bdy = by - dy
+    cdx = cx - dx
+    cdy = cy - dy
+    return (
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy)
+        + (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy)
+        + (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+
+
+def orient2d(ax, ay, bx, by, cx, cy):
+    """Orientation test of three points.
+
+    Args:
+        ax: X coordinate of a
+        ay: Y coordinate of a
+        bx: X coordinate of b
+        by: Y coordinate of b
+        cx: X coordinate of c
+        cy: Y coordinate of c
+
+    Returns:
+        float: Positive if (a, b, c) is counterclockwise, negative if
+        clockwise, zero if collinear. The sign is always exact; the
+        magnitude approximates twice the signed area.
+
+    """
+    detleft = (ax - cx) * (by - cy)
+    detright = (ay - cy) * (bx - cx)
+    det = detleft - detright
+    if abs(det) >= _CCW_ERRBOUND * (abs(detleft) + abs(detright)):
+        return det
+    try:
+        return _sign_as_float(_orient2d_exact(ax, ay, bx, by, cx, cy))
+    except (ValueError, OverflowError):
+        # Coordonnées non finies : pas de signe exact possible
+        return det
+
+
+def incircle(ax, ay, bx, by, cx, cy, dx, dy):
+    """In-circle test of d against the circle through a, b and c.
+
+    The triangle (a, b, c) must be counterclockwise.
+
+    Args:
+        ax: X coordinate of a
+        ay: Y coordinate of a
+        bx: X coordinate of b
+        by: Y coordinate of b
+        cx: X coordinate of c
+        cy: Y coordinate of c
+        dx: X coordinate of the query point d
+        dy: Y coordinate of the query point d
+
+    Returns:
+        float: Positive if d lies inside the circle, negative if outside,
+        zero if the four points are cocircular. The sign is always exact.
+
+    """
+    adx = ax - dx
+    ady = ay - dy
+    bdx = bx - dx
+    bdy = by - dy
+    cdx = cx - dx
+    cdy = cy - dy
+
+    bdxcdy = bdx * cdy
+    cdxbdy = cdx * bdy
+    alift = adx * adx + ady * ady
+    cdxady = cdx * ady
+    adxcdy = adx * cdy
+    blift = bdx * bdx + bdy * bdy
+    adxbdy = adx * bdy
+    bdxady = bdx * ady
+    clift = cdx * cdx + cdy * cdy
+
+    det = (
+        alift * (bdxcdy - cdxbdy)
+        + blift * (cdxady - adxcdy)
+        + clift * (adxbdy - bdxady)
+    )
+    permanent = (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift
+        + (abs(cdxady) + abs(adxcdy)) * blift
+        + (abs(adxbdy) + abs(bdxady)) * clift
+    )
+    if abs(det) > _ICC_ERRBOUND * permanent:
+        return det
+    try:
+        return _sign_as_float(_incircle_exact(ax, ay, bx, by, cx, cy, dx, dy))
+    except (ValueError, OverflowError):
+        return det
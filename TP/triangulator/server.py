@@ -0,0 +1,212 @@
+"""Serveur HTTP/1.1 minimal pour applications ASGI, en asyncio pur.
+
+Suffisant pour lancer l'application ASGI localement sans dépendance : une
+requête à la fois par connexion (keep-alive), corps de requête lu d'un
+bloc, réponse envoyée par morceaux quand sa longueur n'est pas annoncée.
+En production, tout serveur ASGI (uvicorn, hypercorn...) peut le remplacer.
+"""
+import asyncio
+from http import HTTPStatus
+from urllib.parse import unquote
+
+# Taille maximale acceptée pour la ligne de requête et les en-têtes
+MAX_HEADER_BYTES = 65536
+
+
+class _Lifespan:
+    """Run the ASGI lifespan protocol of an application, if it has one."""
+
+    def __init__(self, app):
+        self._app = app
+        self._events = asyncio.Queue()
+        self._replies = asyncio.Queue()
+        self._task = None
+        self._supported = True
+
+    async def _receive(self):
+        return await self._events.get()
+
+    async def _send(self, message):
+        await self._replies.put(message)
+
+    async def _run(self):
+        try:
+            await self._app({"type": "lifespan", "asgi": {"version": "3.0"}},
+                            self._receive, self._send)
+        except Exception:
+            pass  # application sans gestion du cycle de vie
+        finally:
+            # L'application n'écoute plus : les événements suivants sont
+            # ignorés, et une attente en cours est débloquée
+            self._supported = False
+            await self._replies.put(None)
+
+    async def _event(self, name):
+        await self._events.put({"type": f"lifespan.{name}"})
+        reply = await self._replies.get()
+        if reply is not None and reply["type"].endswith(".failed"):
+            raise RuntimeError(reply.get("message", f"lifespan {name} failed"))
+
+    async def startup(self):
+        self._task = asyncio.create_task(self._run())
+        await self._event("startup")
+
+    async def shutdown(self):
+        if self._supported:
+            await self._event("shutdown")
+        await self._task
+
+
+async def _handle(app, reader, writer):
+    """Serve the requests of one connection."""
+    client = writer.get_extra_info("peername")
+    server = writer.get_extra_info("sockname")
+    try:
+        while True:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                return
+            except asyncio.LimitOverrunError:
+                writer.write(b"HTTP/1.1 431 Request Header Fields Too Large\r\n"
+                             b"Content-Length: 0\r\nConnection: close\r\n\r\n")
+                return
+            request_line, *lines = head.decode("latin-1").split("\r\n")
+            method, target, version = request_line.split()
+            headers = []
+            for line in lines:
+                if line:
+                    name, _, value = line.partition(":")
+                    headers.append((name.strip().lower().encode("latin-1"),
+                                    value.strip().encode("latin-1")))
+            fields = dict(headers)
+            body = await reader.readexactly(int(fields.get(b"content-length", 0)))
+
+            path, _, query = target.partition("?")
+            scope = {
+                "type": "http",
+                "asgi": {"version": "3.0"},
+                "http_version": version.removeprefix("HTTP/"),
+                "method": method.upper(),
+                "scheme": "http",
+                "path": unquote(path),
+                "raw_path": path.encode("latin-1"),
+                "query_string": query.encode("latin-1"),
+                "root_path": "",
+                "headers": headers,
+                "client": client,
+                "server": server,
+            }
+            keep_alive = await _respond(app, scope, body, writer)
+            await writer.drain()
+            if not keep_alive or version != "HTTP/1.1" or (
+                fields.get(b"connection", b"").lower() == b"close"
+            ):
+                return
+    except (ConnectionError, ValueError):
+        return
+    finally:
+        writer.close()
+
+
+async def _respond(app, scope, body, writer):
+    """Run the application on one request; return False to close."""
+    received = False
+    started = False
+    chunked = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal received
+        if not received:
+            received = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal started, chunked
+        if message["type"] == "http.response.start":
+            started = True
+            status = message["status"]
+            response_headers = list(message.get("headers", []))
+            names = {name.lower() for name, _ in response_headers}
+            chunked = b"content-length" not in names and status not in (204, 304)
+            if chunked:
+                response_headers.append((b"transfer-encoding", b"chunked"))
+            try:
+                reason = HTTPStatus(status).phrase
+            except ValueError:
+                reason = ""
+            head = [f"HTTP/1.1 {status} {reason}\r\n".encode("latin-1")]
+            head += [name + b": " + value + b"\r\n"
+                     for name, value in response_headers]
+            writer.write(b"".join(head) + b"\r\n")
+        elif message["type"] == "http.response.body":
+            data = message.get("body", b"")
+            if chunked:
+                if data:
+                    writer.write(b"%x\r\n%b\r\n" % (len(data), data))
+                if not message.get("more_body", False):
+                    writer.write(b"0\r\n\r\n")
+            else:
+                writer.write(data)
+            if not message.get("more_body", False):
+                finished.set()
+            await writer.drain()
+
+    try:
+        await app(scope, receive, send)
+    except Exception:
+        if started:
+            return False
+        writer.write(b"HTTP/1.1 500 Internal Server Error\r\n"
+                     b"Content-Length: 0\r\nConnection: close\r\n\r\n")
+        return False
+    finally:
+        finished.set()
+    return True
+
+
+async def start_server(app, host="127.0.0.1", port=8000):
+    """Start serving an ASGI application, after its lifespan startup.
+
+    Args:
+        app: ASGI 3 application
+        host: Interface to listen on
+        port: TCP port (0 for any free port)
+
+    Returns:
+        tuple: ``(server, lifespan)``; stop with ``stop_server``
+
+    """
+    lifespan = _Lifespan(app)
+    await lifespan.startup()
+    server = await asyncio.start_server(
+        lambda reader, writer: _handle(app, reader, writer),
+        host, port, limit=MAX_HEADER_BYTES,
+    )
+    return server, lifespan
+
+
+async def stop_server(server, lifespan):
+    """Stop accepting connections, then run the lifespan shutdown."""
+    server.close()
+    await server.wait_closed()
+    await lifespan.shutdown()
+
+
+async def serve(app, host="127.0.0.1", port=8000):
+    """Serve an ASGI application until cancelled.
+
+    Args:
+        app: ASGI 3 application
+        host: Interface to listen on
+        port: TCP port
+
+    """
+    server, lifespan = await start_server(app, host, port)
+    try:
+        await server.serve_forever()
+    finally:
+        await stop_server(server, lifespan)
@@ -1,34 +1,174 @@
 """Module pour la triangulation de points 2D."""
-import urllib.error
-import urllib.request
+import math
 
+from .cleanup import dedupe_pointset, is_collinear, remap_triangles
+from .client import PointSetClient, manager_client
+from .delaunay import index_triangles, sweep_hull
+from .hull import is_convex_polygon
+from .incremental import incremental_delaunay
+from .mesh import PointSet, PointSetView, TriangleMesh, TrustedMesh
+from .ordering import brio_order
+from .parallel import PARALLEL_THRESHOLD, parallel_delaunay
 
-def fetch_pointset_from_manager(pointset_id: str, use_mock: bool = True) -> bytes:
-    """Fetch PointSet binary data from PointSetManager."""
+ALGORITHMS = ("delaunay", "incremental", "fan", "auto")
+
+
+class InsufficientPointsError(ValueError):
+    """Raised when a PointSet has fewer than 3 points."""
+
+
+def fetch_pointset_from_manager(pointset_id: str, use_mock: bool = True,
+                                client: PointSetClient | None = None) -> bytes:
+    """Fetch PointSet binary data from PointSetManager.
+
+    Args:
+        pointset_id: UUID of the PointSet
+        use_mock: Return a fixed 3-point PointSet instead of calling the
+            PointSetManager
+        client: Client to use (default: the pooled client of this process
+            for ``MANAGER_URL``)
+
+    Returns:
+        bytes: PointSet in its binary format
+
+    Raises:
+        PointSetManagerError: If the PointSetManager answers with an
+            error or cannot be reached
+
+    """
     if use_mock:
-         return (
+        return (
             b"\x00\x00\x00\x03"
             b"\x00\x00\x00\x00\x00\x00\x00\x00"
             b"\x3f\x80\x00\x00\x00\x00\x00\x00"
             b"\x00\x00\x00\x00\x3f\x80\x00\x00"
         )
-    url = f"http://pointset-manager:5000/pointsets/{pointset_id}"
-    try:
-        with urllib.request.urlopen(url) as response:
-            return response.read()
-    except urllib.error.HTTPError as e:
-        raise RuntimeError(f"HTTP error {e.code} for {url}") from e
-    except urllib.error.URLError as e:
-        raise RuntimeError(f"URL error for {url}: {e}") from e
-
-def triangulate(pointset):
-    """Naive fan triangulation.
-
-    Returns list of triangles as (i, j, k) indices.
+    if client is None:
+        client = manager_client()
+    return client.get_pointset(pointset_id)
+
+
+def triangulate(pointset, algorithm="delaunay",
+                parallel_threshold=PARALLEL_THRESHOLD, workers=None):
+    """Triangulate a set of 2D points.
+
+    Args:
+        pointset: Sequence of (x, y) tuples
+        algorithm: ``"delaunay"`` (default) for an O(n log n) sweep-hull
+            Delaunay triangulation, ``"incremental"`` for the same
+            triangulation built by point insertion in BRIO order,
+            ``"fan"`` for the O(n) fan ``(0, i, i + 1)``, only valid for
+            points already ordered along a convex polygon, or ``"auto"``
+            for that fan (counterclockwise) when an O(n) check shows that
+            the points form a convex polygon, Delaunay otherwise
+        parallel_threshold: From this number of points, the ``"delaunay"``
+            triangulation is split into strips computed in a process pool
+        workers: Number of processes of the pool (default: CPU count)
+
+    Returns:
+        TrustedMesh: Triangles as (i, j, k) indices into ``pointset``. Delaunay
+        triangles are counterclockwise and start with their smallest index.
+
+    Raises:
+        ValueError: If the algorithm is unknown or a coordinate is NaN or
+            infinite
+
     """
+    if algorithm not in ALGORITHMS:
+        raise ValueError(
+            f"Unknown algorithm {algorithm!r}, expected one of {ALGORITHMS}"
+        )
     if len(pointset) < 3:
-        return []
-    triangles = []
-    for i in range(1, len(pointset) - 1):
-        triangles.append((0, i, i + 1))
-    return triangles
\ No newline at end of file
+        return TrustedMesh(TriangleMesh(), len(pointset))
+    return TrustedMesh(
+        _triangulate(pointset, algorithm, parallel_threshold, workers),
+        len(pointset),
+    )
+
+
+def _triangulate(pointset, algorithm, parallel_threshold, workers):
+    """Run the selected engine on at least three points."""
+    xs = [float(x) for x, _ in pointset]
+    ys = [float(y) for _, y in pointset]
+    # Vérifié pour tous les moteurs : aucun ne donne de résultat sensé
+    # avec un NaN ou un infini
+    if not (all(map(math.isfinite, xs)) and all(map(math.isfinite, ys))):
+        index = next(
+            i for i in range(len(xs))
+            if not (math.isfinite(xs[i]) and math.isfinite(ys[i]))
+        )
+        raise ValueError(
+            f"Non-finite coordinate in point {index}: {pointset[index]}"
+        )
+
+    if algorithm == "fan":
+        return TriangleMesh((0, i, i + 1) for i in range(1, len(xs) - 1))
+    if algorithm == "auto":
+        direction = is_convex_polygon(xs, ys)
+        if direction > 0:
+            return TriangleMesh((0, i, i + 1) for i in range(1, len(xs) - 1))
+        if direction < 0:
+            # Polygone parcouru en sens horaire : triangles retournés
+            return TriangleMesh((0, i + 1, i) for i in range(1, len(xs) - 1))
+        algorithm = "delaunay"
+
+    if algorithm == "incremental":
+        # Pré-tri spatial : l'ordre d'insertion est une permutation, les
+        # triangles référencent toujours les indices d'origine
+        flat = incremental_delaunay(xs, ys, brio_order(xs, ys))
+    elif len(xs) >= parallel_threshold:
+        flat = parallel_delaunay(xs, ys, workers)
+    else:
+        flat, _, _ = sweep_hull(xs, ys)
+    return index_triangles(flat)
+
+
+def triangulate_pointset(data, triangulate_unique=triangulate):
+    """Decode a binary PointSet and triangulate it.
+
+    Exact duplicates are removed on the raw records first and the triangles
+    are numbered back to the original points; collinear inputs give no
+    triangle without calling the engine.
+
+    Args:
+        data: Binary data in the PointSet format
+        triangulate_unique: Function triangulating the PointSet of the
+            distinct points (``triangulate`` by default)
+
+    Returns:
+        tuple: ``(points, triangles)``, the decoded PointSet and the
+        TrustedMesh indexing it
+
+    Raises:
+        InsufficientPointsError: If the PointSet has fewer than 3 points
+        ValueError: If the PointSet data is invalid or has a NaN or
+            infinite coordinate
+
+    """
+    # Le nombre de points est lu dans l'en-tête, sans décoder les points
+    view = PointSetView(data)
+    if len(view) < 3:
+        raise InsufficientPointsError(
+            f"Need at least 3 points for triangulation, got {len(view)}"
+        )
+    coords = view.to_array()
+    # Somme en double précision : NaN et infinis s'y propagent, aucune
+    # somme de float32 finis ne déborde
+    if not math.isfinite(sum(coords)):
+        index = next(
+            i for i, value in enumerate(coords) if not math.isfinite(value)
+        ) // 2
+        raise ValueError(
+            f"Non-finite coordinate in point {index}: {view[index]}"
+        )
+    points = PointSet.from_coords(coords)
+
+    # Doublons retirés sur les octets bruts ; les triangles sont
+    # renumérotés vers les indices d'origine
+    unique, original = dedupe_pointset(data)
+    if is_collinear(unique):
+        return points, TrustedMesh(TriangleMesh(), len(points))
+    # Les indices renumérotés sont des indices de ``points`` : la
+    # sérialisation peut se passer de les vérifier
+    triangles = remap_triangles(triangulate_unique(unique), original)
+    return points, TrustedMesh(triangles, len(points))
@@ -0,0 +1,128 @@
+"""Module de regroupement des calculs simultanés sur une même clé.
+
+Quand plusieurs requêtes demandent en même temps le même résultat, une
+seule (la première) le calcule ; les autres attendent et reçoivent son
+résultat, ou son exception.
+"""
+import asyncio
+import functools
+import threading
+
+
+class _Call:
+    """Outcome of a call in progress, shared with the waiting callers."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key, across threads.
+
+    Attributes:
+        coalesced: Number of calls that waited for another one instead of
+            running their function
+
+    """
+
+    def __init__(self):
+        """Create a group with no call in progress."""
+        self.coalesced = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, function):
+        """Run ``function()``, unless a call with the same key is running.
+
+        Args:
+            key: Hashable key identifying the result
+            function: Callable without arguments computing the result
+
+        Returns:
+            The result of ``function``, computed by this call or by the
+            concurrent call that was already running
+
+        Raises:
+            Exception: The exception raised by ``function``, re-raised in
+                every waiting caller
+
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            # Les appels suivants recalculent : seuls les appels simultanés
+            # sont regroupés
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Coalesce concurrent calls with the same key, in one event loop.
+
+    Attributes:
+        coalesced: Number of calls that waited for another one instead of
+            running their function
+
+    """
+
+    def __init__(self):
+        """Create a group with no call in progress."""
+        self.coalesced = 0
+        self._calls = {}
+
+    async def do(self, key, function):
+        """Await ``function()``, unless a call with the same key is running.
+
+        Args:
+            key: Hashable key identifying the result
+            function: Coroutine function without arguments computing the
+                result
+
+        Returns:
+            The result of ``function``, computed by this call or by the
+            concurrent call that was already running
+
+        Raises:
+            Exception: The exception raised by ``function``, re-raised in
+                every waiting caller
+
+        """
+        task = self._calls.get(key)
+        if task is None:
+            # Le calcul est une tâche à part : l'annulation d'un appelant,
+            # premier compris, ne l'interrompt pas pour les autres
+            task = self._calls[key] = asyncio.ensure_future(function())
+            task.add_done_callback(functools.partial(self._finish, key))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key, task):
+        """Forget a finished call; later calls compute again."""
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            task.exception()  # pas d'avertissement si tous sont partis
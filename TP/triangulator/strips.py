@@ -0,0 +1,179 @@
+"""Module de conversion d'une triangulation en bandes de triangles.
+
+Dans une bande ``v0, v1, v2, v3, ...`` chaque nouvel indice forme un
+triangle avec les deux précédents : une bande de T triangles tient en
+T + 2 indices au lieu de 3 * T. Les bandes sont séparées par un indice de
+redémarrage (« primitive restart »), directement compris par les moteurs
+de rendu.
+"""
+from array import array
+
+from .mesh import TriangleMesh
+
+# Indice séparant deux bandes consécutives
+STRIP_RESTART = 0xFFFFFFFF
+
+
+def _neighbors(flat):
+    """Return, for each side ``3 * t + r``, the twin side in the neighbor.
+
+    Side ``3 * t + r`` goes from vertex ``r`` to vertex ``r + 1`` of
+    triangle ``t``; its twin is the opposite side of the adjacent triangle,
+    or -1 on the boundary.
+    """
+    neighbor = array('q', [-1]) * len(flat)
+    pending = {}
+    for e in range(len(flat)):
+        a = flat[e]
+        b = flat[e + 1] if e % 3 != 2 else flat[e - 2]
+        twin = pending.pop((b, a), None)
+        if twin is None:
+            pending[(a, b)] = e
+        else:
+            neighbor[e] = twin
+            neighbor[twin] = e
+    return neighbor
+
+
+def triangle_strips(triangles):
+    """Convert triangles to strips, in linear time.
+
+    Strips are grown greedily across shared edges; when a strip can only
+    continue on the side of its second to last vertex, that vertex is
+    repeated, which adds a degenerate triangle (skipped by renderers)
+    instead of starting a new strip. The triangles must be consistently
+    oriented (as produced by the triangulation engines): each decoded
+    triangle keeps the orientation of the original one.
+
+    Args:
+        triangles: TriangleMesh, or sequence of (i, j, k) triangles
+
+    Returns:
+        array: ``array('I')`` of vertex indices, the strips being separated
+        by ``STRIP_RESTART``. Triangle ``k`` of a strip ``v`` is
+        ``(v[k], v[k + 1], v[k + 2])`` for even ``k`` and
+        ``(v[k + 1], v[k], v[k + 2])`` for odd ``k``.
+
+    """
+    if isinstance(triangles, TriangleMesh):
+        flat = triangles.indices
+    else:
+        flat = TriangleMesh(triangles).indices
+    neighbor = _neighbors(flat)
+    count = len(flat) // 3
+    used = bytearray(count)
+    strips = array('I')
+
+    # Nombre de voisins libres de chaque triangle. Les bandes partent des
+    # triangles les moins connectés (bords, coins), qui sinon finiraient
+    # isolés ; les files sont relues paresseusement.
+    free = bytearray(count)
+    for e in range(len(flat)):
+        if neighbor[e] >= 0:
+            free[e // 3] += 1
+    queues = [[], [], [], []]
+    for t in range(count - 1, -1, -1):
+        queues[free[t]].append(t)
+
+    def take(t):
+        used[t] = 1
+        for e in range(3 * t, 3 * t + 3):
+            twin = neighbor[e]
+            if twin >= 0 and not used[twin // 3]:
+                u = twin // 3
+                free[u] -= 1
+                queues[free[u]].append(u)
+
+    while True:
+        t = _next_start(queues, used, free)
+        if t < 0:
+            return strips
+        take(t)
+        base = 3 * t
+        # Rotation du premier triangle : la bande part par le côté libre
+        # dont le voisin a le moins d'autres voisins libres
+        r = 0
+        best = 4
+        for s in range(3):
+            twin = neighbor[base + (s + 1) % 3]
+            if twin >= 0 and not used[twin // 3] and free[twin // 3] < best:
+                r = s
+                best = free[twin // 3]
+        if strips:
+            strips.append(STRIP_RESTART)
+        strips.extend((
+            flat[base + r], flat[base + (r + 1) % 3], flat[base + (r + 2) % 3]
+        ))
+
+        # Côté partagé avec le triangle suivant : les deux derniers indices
+        side = base + (r + 1) % 3
+        while True:
+            e = neighbor[side]
+            if e < 0 or used[e // 3]:
+                break
+            take(e // 3)
+            base = e - e % 3
+            r = e % 3
+            w = flat[base + (r + 2) % 3]
+            strips.append(w)
+            # Côté suivant : du dernier indice au nouveau ; l'autre côté
+            # libre, celui de l'avant-dernier, coûte un indice répété
+            if flat[e] == strips[-2]:
+                side, pivot = base + (r + 2) % 3, base + (r + 1) % 3
+            else:
+                side, pivot = base + (r + 1) % 3, base + (r + 2) % 3
+            if _is_free(side, neighbor, used) or not _is_free(
+                pivot, neighbor, used
+            ):
+                continue
+            # p, q, w devient p, q, p, w : le triangle dégénéré (p, q, p)
+            # décale la parité et la bande repart du côté (p, w)
+            strips[-1] = strips[-3]
+            strips.append(w)
+            side = pivot
+
+
+def _is_free(side, neighbor, used):
+    """Tell whether the triangle across a side exists and is unused."""
+    twin = neighbor[side]
+    return twin >= 0 and not used[twin // 3]
+
+
+def _next_start(queues, used, free):
+    """Pop the unused triangle with the fewest free neighbors, or -1."""
+    for degree, queue in enumerate(queues):
+        while queue:
+            t = queue.pop()
+            if not used[t] and free[t] == degree:
+                return t
+    return -1
+
+
+def strips_to_triangles(strips):
+    """Decode strips back to triangles.
+
+    Args:
+        strips: Vertex indices as returned by ``triangle_strips``
+
+    Returns:
+        TriangleMesh: The triangles, strip after strip
+
+    """
+    flat = array('I')
+    start = 0
+    end = len(strips)
+    while start < end:
+        try:
+            stop = strips.index(STRIP_RESTART, start)
+        except ValueError:
+            stop = end
+        for k in range(start, stop - 2):
+            a, b, c = strips[k], strips[k + 1], strips[k + 2]
+            if a in (b, c) or b == c:
+                continue  # triangle dégénéré de changement de sens
+            if (k - start) % 2:
+                flat.extend((b, a, c))
+            else:
+                flat.extend((a, b, c))
+        start = stop + 1
+    return TriangleMesh.from_flat(flat)
@@ -1,12 +1,45 @@
 """Module pour la sérialisation/désérialisation de structures géométriques."""
+import mmap
 import struct
+import sys
+import zlib
+from array import array
+from contextlib import contextmanager
+
+from .mesh import PointSet, PointSetView, TriangleMesh, TrustedMesh
+
+# Nombre de points ou de triangles par morceau de réponse en flux
+STREAM_CHUNK = 65536
+
+# En-tête d'un résultat de lot : index, statut HTTP, taille du contenu
+_BATCH_FRAME = struct.Struct('>IHI')
+
+
+def _big_endian_bytes(values, byteorder='big'):
+    """Return the bytes of a typed array in byteorder, without modifying it."""
+    if sys.byteorder != byteorder:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _pack_points_into(buffer, offset, pointset, byteorder='big'):
+    """Write the float32 coordinates of the points at offset, in one pack."""
+    if isinstance(pointset, PointSet):
+        # Stockage déjà en float32 : copie en bloc
+        coords = _big_endian_bytes(pointset.coords, byteorder)
+        buffer[offset:offset + len(coords)] = coords
+        return
+    coords = [c for x, y in pointset for c in (float(x), float(y))]
+    prefix = '>' if byteorder == 'big' else '<'
+    struct.pack_into(f'{prefix}{len(coords)}f', buffer, offset, *coords)
 
 
 def serialize_pointset(pointset):
     """Serialize a PointSet to binary format (float32).
     
     Args:
-        pointset: List of (x, y) tuples representing 2D points
+        pointset: PointSet, or list of (x, y) tuples representing 2D points
         
     Returns:
         bytes: Binary representation in big-endian format
@@ -16,59 +49,97 @@ def serialize_pointset(pointset):
         return b"\x00\x00\x00\x00"  # 4 bytes pour 0 points
 
     num_points = len(pointset)
-    data = num_points.to_bytes(4, byteorder='big')
-
-    for x, y in pointset:
-        data += struct.pack('>f', float(x))  # X en float32 big-endian
-        data += struct.pack('>f', float(y))  # Y en float32 big-endian
-
-    return data
+    # Tampon dimensionné d'avance : pas de recopie à chaque point
+    data = bytearray(4 + 8 * num_points)
+    data[:4] = num_points.to_bytes(4, byteorder='big')
+    _pack_points_into(data, 4, pointset)
+    return bytes(data)
 
 
 def deserialize_pointset(data):
-    """Deserialize binary data to list of (x, y) float tuples.
+    """Deserialize binary data to a PointSet.
     
     Args:
-        data: Binary data in the PointSet format
+        data: Binary data in the PointSet format (any bytes-like object)
         
     Returns:
-        list: List of (x, y) tuples
+        PointSet: Points, indexable as (x, y) tuples
         
     Raises:
         ValueError: If data is invalid or truncated
 
     """
-    if len(data) < 4:
+    # Vérification de l'en-tête et de la longueur, puis décodage en un
+    # seul appel depuis le tampon d'origine
+    view = PointSetView(data)
+    return PointSet.from_coords(view.to_array())
+
+
+class PointSetTooLargeError(ValueError):
+    """Raised when a PointSet announces more bytes than allowed."""
+
+
+def read_pointset(stream, max_bytes):
+    """Read a binary PointSet from a stream, within a size limit.
+
+    The size announced by the header is checked before any point is read,
+    then the points are read straight into one preallocated buffer: an
+    oversized upload is refused after 4 bytes, and an accepted one is not
+    copied. Nothing past the announced points is read.
+
+    Args:
+        stream: Binary file-like object with ``readinto``
+        max_bytes: Largest accepted PointSet, header included
+
+    Returns:
+        bytearray: The PointSet data, as expected by ``deserialize_pointset``
+
+    Raises:
+        PointSetTooLargeError: If the header announces more than
+            ``max_bytes`` bytes
+        ValueError: If the stream ends before the announced points
+
+    """
+    header = bytearray(4)
+    if _read_into(stream, memoryview(header)) < 4:
         raise ValueError("Data too short to contain point count")
-    
-    num_points = int.from_bytes(data[:4], byteorder='big')
-    
-    if num_points == 0:
-        return []
-    
-    expected_length = 4 + 8 * num_points
-    if len(data) < expected_length:
+    count = int.from_bytes(header, byteorder='big')
+    expected_length = 4 + 8 * count
+    if expected_length > max_bytes:
+        raise PointSetTooLargeError(
+            f"PointSet too large: {count} points take {expected_length} "
+            f"bytes, at most {max_bytes} allowed"
+        )
+
+    data = bytearray(expected_length)
+    data[:4] = header
+    with memoryview(data) as view:
+        length = 4 + _read_into(stream, view[4:])
+    if length < expected_length:
         msg = f"Data too short: expected {expected_length} bytes, "
-        msg += f"got {len(data)}"
+        msg += f"got {length}"
         raise ValueError(msg)
-    
-    points = []
-    offset = 4
-    for _ in range(num_points):
-        x = struct.unpack('>f', data[offset:offset+4])[0]
-        y = struct.unpack('>f', data[offset+4:offset+8])[0]
-        points.append((x, y))
-        offset += 8
-    
-    return points
+    return data
+
+
+def _read_into(stream, view):
+    """Fill a memoryview from a stream; return the number of bytes read."""
+    filled = 0
+    while filled < len(view):
+        n = stream.readinto(view[filled:])
+        if not n:
+            break
+        filled += n
+    return filled
 
 
 def serialize_triangles(vertices, triangles):
     """Serialize vertices + triangles into binary format.
     
     Args:
-        vertices: List of (x, y) tuples representing vertices
-        triangles: List of (i, j, k) tuples representing triangle indices
+        vertices: PointSet, or list of (x, y) tuples representing vertices
+        triangles: TriangleMesh, or list of (i, j, k) tuples representing
+            triangle indices
         
     Returns:
         bytes: Binary representation of the complete triangulation
@@ -77,16 +148,99 @@ def serialize_triangles(vertices, triangles):
         ValueError: If triangle indices are invalid
 
     """
-    # Part 1: serialize vertices (same as PointSet)
-    vertex_data = serialize_pointset(vertices)
-    
-    # Part 2: serialize triangles
-    num_triangles = len(triangles)
-    triangle_data = num_triangles.to_bytes(4, byteorder='big')
-    
     num_vertices = len(vertices)
+    num_triangles = len(triangles)
+    indices = _checked_indices(triangles, num_vertices)
+
+    # Part 1: vertices (same as PointSet), Part 2: triangles
+    triangle_offset = 4 + 8 * num_vertices
+    data = bytearray(triangle_offset + 4 + 12 * num_triangles)
+    data[:4] = num_vertices.to_bytes(4, byteorder='big')
+    _pack_points_into(data, 4, vertices)
+    data[triangle_offset:triangle_offset + 4] = num_triangles.to_bytes(
+        4, byteorder='big'
+    )
+    if isinstance(indices, array):
+        data[triangle_offset + 4:] = _big_endian_bytes(indices)
+    else:
+        struct.pack_into(
+            f'>{len(indices)}I', data, triangle_offset + 4, *indices
+        )
+    return bytes(data)
+
+
+def deserialize_triangles(data):
+    """Deserialize binary data in the Triangles format.
+
+    Args:
+        data: Binary data in the Triangles format (any bytes-like object)
+
+    Returns:
+        tuple: ``(vertices, triangles)``, the PointSet and the TrustedMesh
+        indexing it
+
+    Raises:
+        ValueError: If data is invalid or truncated
+
+    """
+    view = PointSetView(data)
+    num_vertices = len(view)
+    triangle_offset = 4 + 8 * num_vertices
+    if len(data) < triangle_offset + 4:
+        raise ValueError("Data too short to contain triangle count")
+    num_triangles = int.from_bytes(
+        data[triangle_offset:triangle_offset + 4], byteorder='big'
+    )
+    expected_length = triangle_offset + 4 + 12 * num_triangles
+    if len(data) != expected_length:
+        msg = f"Invalid length: expected {expected_length} bytes, "
+        msg += f"got {len(data)}"
+        raise ValueError(msg)
+
+    indices = array('I')
+    with memoryview(data) as buffer:
+        indices.frombytes(buffer[triangle_offset + 4:])
+    if sys.byteorder == 'little':
+        indices.byteswap()
+    if indices and max(indices) >= num_vertices:
+        raise ValueError(f"Invalid triangle index: {max(indices)}")
+    vertices = PointSet.from_coords(view.to_array())
+    return vertices, TrustedMesh(TriangleMesh.from_flat(indices), num_vertices)
+
+
+def _checked_indices(triangles, num_vertices):
+    """Return the flat triangle indices after checking their bounds.
+
+    Triangles coming from the triangulation pipeline are not checked; the
+    others are checked with whole-array operations, and only a failure
+    walks them one by one to report the culprit.
+
+    Raises:
+        ValueError: Naming the first triangle with an invalid index
+
+    """
+    if isinstance(triangles, TrustedMesh) and (
+        triangles.num_vertices <= num_vertices
+    ):
+        return triangles.indices
+    if isinstance(triangles, TriangleMesh):
+        indices = triangles.indices
+    else:
+        try:
+            # Les indices négatifs ou trop grands débordent du type 'I'
+            indices = array('I', [v for i, j, k in triangles for v in (i, j, k)])
+        except OverflowError:
+            _raise_first_invalid(triangles, num_vertices)
+            raise
+    # Indices non signés : seule la borne supérieure est à vérifier
+    if indices and max(indices) >= num_vertices:
+        _raise_first_invalid(triangles, num_vertices)
+    return indices
+
+
+def _raise_first_invalid(triangles, num_vertices):
+    """Raise the ValueError describing the first invalid triangle."""
     for i, j, k in triangles:
-        # Validation des indices
         if i < 0 or j < 0 or k < 0:
             raise ValueError(f"Negative index in triangle: ({i}, {j}, {k})")
         if i >= num_vertices or j >= num_vertices or k >= num_vertices:
@@ -94,9 +248,314 @@ def serialize_triangles(vertices, triangles):
                 f"Index out of bounds in triangle ({i}, {j}, {k}), "
                 f"max index is {num_vertices - 1}"
             )
-        
-        triangle_data += i.to_bytes(4, byteorder='big')
-        triangle_data += j.to_bytes(4, byteorder='big')
-        triangle_data += k.to_bytes(4, byteorder='big')
-    
-    return vertex_data + triangle_data
\ No newline at end of file
+
+
+def triangles_size(num_vertices, num_triangles):
+    """Return the size in bytes of a serialized triangulation."""
+    return 4 + 8 * num_vertices + 4 + 12 * num_triangles
+
+
+def iter_serialize_triangles(vertices, triangles, chunk_size=STREAM_CHUNK,
+                             byteorder='big'):
+    """Serialize vertices + triangles as a stream of byte chunks.
+
+    Gives the same bytes as ``serialize_triangles`` without building them
+    all at once: the indices are checked first, then the vertex block and
+    the triangle records are encoded ``chunk_size`` records at a time.
+
+    Args:
+        vertices: PointSet, or list of (x, y) tuples representing vertices
+        triangles: TriangleMesh, or list of (i, j, k) tuples representing
+            triangle indices
+        chunk_size: Number of points or triangles per chunk
+        byteorder: ``'big'`` for the standard format, or ``'little'`` for
+            the same layout with every count, coordinate and index in
+            little-endian order
+
+    Returns:
+        iterator: Chunks of bytes, ``triangles_size`` bytes in total
+
+    Raises:
+        ValueError: If triangle indices are invalid (raised by this call,
+            before any chunk is produced)
+
+    """
+    indices = _checked_indices(triangles, len(vertices))
+    return _iter_triangle_chunks(vertices, indices, chunk_size, byteorder)
+
+
+def _iter_vertex_chunks(vertices, chunk_size, byteorder):
+    """Yield the vertex block (count and coordinates) chunk by chunk."""
+    num_vertices = len(vertices)
+    yield num_vertices.to_bytes(4, byteorder=byteorder)
+    for start in range(0, num_vertices, chunk_size):
+        stop = min(start + chunk_size, num_vertices)
+        if isinstance(vertices, PointSet):
+            yield _big_endian_bytes(vertices.coords[2 * start:2 * stop], byteorder)
+        else:
+            chunk = bytearray(8 * (stop - start))
+            _pack_points_into(chunk, 0, vertices[start:stop], byteorder)
+            yield bytes(chunk)
+
+
+def _iter_triangle_chunks(vertices, indices, chunk_size, byteorder):
+    """Yield the chunks of an already validated triangulation."""
+    yield from _iter_vertex_chunks(vertices, chunk_size, byteorder)
+    yield (len(indices) // 3).to_bytes(4, byteorder=byteorder)
+    prefix = '>' if byteorder == 'big' else '<'
+    step = 3 * chunk_size
+    for start in range(0, len(indices), step):
+        chunk = indices[start:start + step]
+        if isinstance(chunk, array):
+            yield _big_endian_bytes(chunk, byteorder)
+        else:
+            yield struct.pack(f'{prefix}{len(chunk)}I', *chunk)
+
+
+def encode_varint_deltas(indices, previous=0):
+    """Encode indices as zigzag deltas in LEB128 varints.
+
+    Consecutive indices of a triangulation are close to each other, so
+    most deltas fit in one or two bytes instead of four.
+
+    Args:
+        indices: Sequence of non-negative integers
+        previous: Value the first delta is taken from, to continue the
+            encoding of a previous chunk
+
+    Returns:
+        bytes: Each ``indices[n] - indices[n - 1]`` (the first one relative
+        to ``previous``), zigzag-mapped to a non-negative integer, written
+        7 bits per byte with the high bit set on every byte but the last
+
+    """
+    data = bytearray()
+    for value in indices:
+        delta = value - previous
+        previous = value
+        z = delta << 1 if delta >= 0 else ((-delta) << 1) - 1
+        while z >= 0x80:
+            data.append((z & 0x7F) | 0x80)
+            z >>= 7
+        data.append(z)
+    return bytes(data)
+
+
+def decode_varint_deltas(data, count):
+    """Decode ``count`` indices written by ``encode_varint_deltas``.
+
+    Args:
+        data: Bytes-like object starting with the encoded indices
+        count: Number of indices to read
+
+    Returns:
+        tuple: ``(indices, size)``, the ``array('I')`` of indices and the
+        number of bytes consumed
+
+    Raises:
+        ValueError: If the data ends before ``count`` indices
+
+    """
+    indices = array('I')
+    previous = 0
+    offset = 0
+    for _ in range(count):
+        z = 0
+        shift = 0
+        while True:
+            if offset >= len(data):
+                raise ValueError("Data too short: truncated varint")
+            byte = data[offset]
+            offset += 1
+            z |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        previous += (z >> 1) if not z & 1 else -((z + 1) >> 1)
+        indices.append(previous)
+    return indices, offset
+
+
+def iter_serialize_triangles_varint(vertices, triangles, chunk_size=STREAM_CHUNK):
+    """Serialize vertices + delta/varint-encoded triangles as byte chunks.
+
+    The vertex block and the triangle count are those of the standard
+    format; the ``3 * T`` indices follow as ``encode_varint_deltas`` bytes.
+
+    Args:
+        vertices: PointSet, or list of (x, y) tuples representing vertices
+        triangles: TriangleMesh, or list of (i, j, k) tuples representing
+            triangle indices
+        chunk_size: Number of points or triangles per chunk
+
+    Returns:
+        iterator: Chunks of bytes
+
+    Raises:
+        ValueError: If triangle indices are invalid (raised by this call,
+            before any chunk is produced)
+
+    """
+    indices = _checked_indices(triangles, len(vertices))
+    return _iter_varint_chunks(vertices, indices, chunk_size)
+
+
+def _iter_varint_chunks(vertices, indices, chunk_size):
+    """Yield the chunks of an already validated varint triangulation."""
+    yield from _iter_vertex_chunks(vertices, chunk_size, 'big')
+    yield (len(indices) // 3).to_bytes(4, byteorder='big')
+    step = 3 * chunk_size
+    previous = 0
+    for start in range(0, len(indices), step):
+        chunk = indices[start:start + step]
+        # Le premier delta d'un morceau part du dernier indice du précédent
+        yield encode_varint_deltas(chunk, previous)
+        previous = chunk[-1]
+
+
+def iter_compress(chunks, encoding):
+    """Compress a stream of byte chunks on the fly.
+
+    Args:
+        chunks: Iterable of bytes
+        encoding: ``'gzip'`` or ``'deflate'`` (zlib stream), as in the HTTP
+            ``Content-Encoding`` header
+
+    Yields:
+        bytes: Compressed chunks
+
+    """
+    wbits = 31 if encoding == 'gzip' else 15
+    compressor = zlib.compressobj(wbits=wbits)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def serialize_locations(locations):
+    """Serialize point-location results into binary format.
+
+    Args:
+        locations: ``array('I')`` (or sequence) of triangle indices, one per
+            query point, 0xFFFFFFFF for points outside the triangulation
+
+    Returns:
+        bytes: Number of results (4 bytes) followed by one big-endian
+        unsigned 32-bit index per query point
+
+    """
+    if not isinstance(locations, array) or locations.typecode != 'I':
+        locations = array('I', locations)
+    data = len(locations).to_bytes(4, byteorder='big')
+    return data + _big_endian_bytes(locations)
+
+
+def serialize_batch_frame(index, status, payload):
+    """Serialize one result of a batch triangulation.
+
+    Args:
+        index: Position of the PointSet ID in the batch request
+        status: HTTP status code of this result
+        payload: Triangles data if ``status`` is 200, JSON error otherwise
+
+    Returns:
+        bytes: Index (4 bytes), status (2 bytes) and payload size (4
+        bytes), big-endian unsigned, followed by the payload
+
+    """
+    return _BATCH_FRAME.pack(index, status, len(payload)) + payload
+
+
+def serialize_voronoi(centers, edges):
+    """Serialize a Voronoi diagram into binary format.
+
+    Args:
+        centers: Interleaved coordinates of the Voronoi vertices
+        edges: Flat ``(i, j, u, v)`` edge records, as returned by
+            ``voronoi_dual``
+
+    Returns:
+        bytes: The Voronoi vertices in the PointSet format, followed by the
+        number of edges (4 bytes) and 16 bytes per edge (four big-endian
+        unsigned 32-bit indices)
+
+    """
+    vertex_data = (len(centers) // 2).to_bytes(4, byteorder='big')
+    vertex_data += _big_endian_bytes(array('f', centers))
+
+    if not isinstance(edges, array) or edges.typecode != 'I':
+        edges = array('I', edges)
+    edge_data = (len(edges) // 4).to_bytes(4, byteorder='big')
+    return vertex_data + edge_data + _big_endian_bytes(edges)
+
+
+def serialize_triangle_strips(vertices, strips):
+    """Serialize vertices + triangle strips into binary format.
+
+    Args:
+        vertices: PointSet, or list of (x, y) tuples representing vertices
+        strips: Vertex indices separated by ``STRIP_RESTART``, as returned
+            by ``triangle_strips``
+
+    Returns:
+        bytes: The vertices in the PointSet format, followed by the number
+        of strip indices (4 bytes) and the indices (big-endian unsigned
+        32-bit integers)
+
+    """
+    if not isinstance(strips, array) or strips.typecode != 'I':
+        strips = array('I', strips)
+    num_vertices = len(vertices)
+    strip_offset = 4 + 8 * num_vertices
+    data = bytearray(strip_offset + 4 + 4 * len(strips))
+    data[:4] = num_vertices.to_bytes(4, byteorder='big')
+    _pack_points_into(data, 4, vertices)
+    data[strip_offset:strip_offset + 4] = len(strips).to_bytes(
+        4, byteorder='big'
+    )
+    data[strip_offset + 4:] = _big_endian_bytes(strips)
+    return bytes(data)
+
+
+@contextmanager
+def mapped_file(path):
+    """Map a file read-only in memory, to decode it without reading it.
+
+    Args:
+        path: Path of the file
+
+    Yields:
+        mmap.mmap | bytes: The file contents (``b""`` for an empty file,
+        which cannot be mapped)
+
+    """
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+def write_triangles(f, vertices, triangles, chunk_size=STREAM_CHUNK):
+    """Write vertices + triangles in the Triangles format to a binary file.
+
+    Args:
+        f: File object opened for binary writing
+        vertices: PointSet, or list of (x, y) tuples representing vertices
+        triangles: TriangleMesh, or list of (i, j, k) tuples
+        chunk_size: Number of points or triangles per write
+
+    Returns:
+        int: Number of bytes written
+
+    Raises:
+        ValueError: If triangle indices are invalid (nothing is written)
+
+    """
+    written = 0
+    for chunk in iter_serialize_triangles(vertices, triangles, chunk_size):
+        written += f.write(chunk)
+    return written
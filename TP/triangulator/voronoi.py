@@ -0,0 +1,59 @@
+"""Module du diagramme de Voronoi, calculé comme dual de la triangulation.
+
+Chaque triangle de Delaunay donne un sommet de Voronoi (son centre
+circonscrit) et chaque arête de Delaunay une arête de Voronoi entre les
+centres des deux triangles qui la bordent : un seul passage linéaire sur
+les triangles suffit.
+"""
+from array import array
+
+# Extrémité manquante d'une arête de Voronoi non bornée (demi-droite)
+UNBOUNDED = 0xFFFFFFFF
+
+
+def voronoi_dual(points, triangles):
+    """Derive the Voronoi diagram from a Delaunay triangulation.
+
+    Args:
+        points: Sequence of (x, y) sites
+        triangles: Sequence of counterclockwise (i, j, k) Delaunay triangles
+
+    Returns:
+        tuple: ``(centers, edges)``. ``centers`` is an ``array('d')`` of
+        interleaved coordinates, the Voronoi vertex ``t`` being the
+        circumcenter of triangle ``t``. ``edges`` is an ``array('I')`` of
+        records ``(i, j, u, v)``: the cells of sites ``i`` and ``j`` are
+        adjacent and share the Voronoi edge from ``u`` (the triangle on the
+        left of i -> j) to ``v`` (the one on the right). ``v`` is
+        ``UNBOUNDED`` on the hull: the edge is then a ray from ``u`` towards
+        the right of i -> j.
+
+    """
+    centers = array('d')
+    edges = array('I')
+    pending = {}
+    for t, (a, b, c) in enumerate(triangles):
+        ax, ay = points[a]
+        bx, by = points[b]
+        cx, cy = points[c]
+        dx = bx - ax
+        dy = by - ay
+        ex = cx - ax
+        ey = cy - ay
+        bl = dx * dx + dy * dy
+        cl = ex * ex + ey * ey
+        d = 0.5 / (dx * ey - dy * ex)
+        centers.append(ax + (ey * bl - dy * cl) * d)
+        centers.append(ay + (dx * cl - ex * bl) * d)
+
+        for i, j in ((a, b), (b, c), (c, a)):
+            twin = pending.pop((j, i), None)
+            if twin is None:
+                pending[(i, j)] = t
+            else:
+                # Le jumeau est à gauche de j -> i, t à sa droite
+                edges.extend((j, i, twin, t))
+
+    for (i, j), t in pending.items():
+        edges.extend((i, j, t, UNBOUNDED))
+    return centers, edges